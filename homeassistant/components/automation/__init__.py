@@ -1,13 +1,16 @@
 """Allow to set up simple automation rules via the config file."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
 import logging
 from typing import Any, Awaitable, Callable, Dict, cast
 
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
-from homeassistant.components import blueprint
+from homeassistant.components import blueprint, websocket_api
+from homeassistant.components.homeassistant.triggers import state_index
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -41,7 +44,12 @@ from homeassistant.exceptions import (
     ConditionErrorIndex,
     HomeAssistantError,
 )
-from homeassistant.helpers import condition, extract_domain_configs, template
+from homeassistant.helpers import (
+    condition,
+    config_hash,
+    extract_domain_configs,
+    template,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
@@ -245,8 +253,8 @@ async def async_setup(hass, config):
     )
 
     async def reload_service_handler(service_call):
-        """Remove all automations and load new ones from config."""
-        conf = await component.async_prepare_reload()
+        """Reload the automations that were added, removed or changed."""
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
         async_get_blueprints(hass).async_reset_cache()
@@ -263,9 +271,25 @@ async def async_setup(hass, config):
         schema=vol.Schema({}),
     )
 
+    websocket_api.async_register_command(hass, websocket_trigger_stats)
+
     return True
 
 
+@websocket_api.websocket_command({vol.Required("type"): "automation/trigger_stats"})
+@callback
+def websocket_trigger_stats(hass, connection, msg):
+    """Return the evaluation counters of the state triggers of automations."""
+    connection.send_result(
+        msg["id"],
+        [
+            stats
+            for stats in state_index.async_get_trigger_stats(hass)
+            if stats["domain"] == DOMAIN
+        ],
+    )
+
+
 class AutomationEntity(ToggleEntity, RestoreEntity):
     """Entity to show status of entity."""
 
@@ -284,6 +308,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         raw_config,
         blueprint_inputs,
         trace_config,
+        config_hash=None,
     ):
         """Initialize an automation entity."""
         self._attr_name = name
@@ -303,6 +328,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         self._blueprint_inputs = blueprint_inputs
         self._trace_config = trace_config
         self._attr_unique_id = automation_id
+        self.config_hash = config_hash
 
     @property
     def extra_state_attributes(self):
@@ -596,6 +622,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
             log_cb,
             home_assistant_start,
             variables,
+            self.entity_id,
         )
 
 
@@ -606,10 +633,16 @@ async def _async_process_config(
 ) -> bool:
     """Process config and add automations.
 
+    Automations already set up whose raw config and blueprint inputs are
+    unchanged are kept running, the others are removed.
+
     Returns if blueprints were used.
     """
     entities = []
     blueprints_used = False
+    existing: dict[str, list[AutomationEntity]] = {}
+    for entity in cast(Iterable[AutomationEntity], component.entities):
+        existing.setdefault(entity.config_hash, []).append(entity)
 
     for config_key in extract_domain_configs(config, DOMAIN):
         conf: list[dict[str, Any] | blueprint.BlueprintInputs] = config[config_key]
@@ -617,6 +650,7 @@ async def _async_process_config(
         for list_no, config_block in enumerate(conf):
             raw_blueprint_inputs = None
             raw_config = None
+            default_name = f"{config_key} {list_no}"
             if isinstance(config_block, blueprint.BlueprintInputs):
                 blueprints_used = True
                 blueprint_inputs = config_block
@@ -624,6 +658,12 @@ async def _async_process_config(
 
                 try:
                     raw_config = blueprint_inputs.async_substitute()
+                    automation_hash = _automation_config_hash(
+                        raw_config, raw_blueprint_inputs, default_name
+                    )
+                    if existing.get(automation_hash):
+                        existing[automation_hash].pop()
+                        continue
                     config_block = cast(
                         Dict[str, Any],
                         await async_validate_config_item(hass, raw_config),
@@ -638,9 +678,15 @@ async def _async_process_config(
                     continue
             else:
                 raw_config = cast(AutomationConfig, config_block).raw_config
+                automation_hash = _automation_config_hash(
+                    raw_config, None, default_name
+                )
+                if existing.get(automation_hash):
+                    existing[automation_hash].pop()
+                    continue
 
             automation_id = config_block.get(CONF_ID)
-            name = config_block.get(CONF_ALIAS) or f"{config_key} {list_no}"
+            name = config_block.get(CONF_ALIAS) or default_name
 
             initial_state = config_block.get(CONF_INITIAL_STATE)
 
@@ -691,16 +737,40 @@ async def _async_process_config(
                 raw_config,
                 raw_blueprint_inputs,
                 config_block[CONF_TRACE],
+                automation_hash,
             )
 
             entities.append(entity)
 
+    # Remove the automations that changed first, they may be replaced by
+    # automations with the same entity ID
+    removed = [entity for entities in existing.values() for entity in entities]
+    if removed:
+        await asyncio.gather(
+            *(component.async_remove_entity(entity.entity_id) for entity in removed)
+        )
+
     if entities:
         await component.async_add_entities(entities)
 
     return blueprints_used
 
 
+def _automation_config_hash(
+    raw_config: dict[str, Any] | None,
+    raw_blueprint_inputs: dict[str, Any] | None,
+    default_name: str,
+) -> str:
+    """Return the hash identifying the config of an automation.
+
+    The default name is only part of the hash of automations without an
+    alias, since their name depends on their position in the config.
+    """
+    if raw_config is not None and CONF_ALIAS in raw_config:
+        return config_hash(raw_config, raw_blueprint_inputs)
+    return config_hash(raw_config, raw_blueprint_inputs, default_name)
+
+
 async def _async_process_if(hass, name, config, p_config):
     """Process if checks."""
     if_configs = p_config[CONF_CONDITION]
@@ -2,7 +2,6 @@
 
 from abc import abstractmethod
 from datetime import timedelta
-import fnmatch
 from ipaddress import ip_address as make_ip_address
 import logging
 import os
@@ -37,6 +36,10 @@ from homeassistant.const import (
 )
 from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.discovery_matcher import (
+    DiscoveryMatcherIndex,
+    get_matcher_stats,
+)
 from homeassistant.helpers.event import (
     async_track_state_added_domain,
     async_track_time_interval,
@@ -52,6 +55,8 @@ REQUESTED_ADDR = "requested_addr"
 MESSAGE_TYPE = "message-type"
 HOSTNAME = "hostname"
 MAC_ADDRESS = "macaddress"
+# Matchers are indexed by the OUI of their MAC address
+MAC_OUI_LENGTH = 6
 IP_ADDRESS = "ip"
 DHCP_REQUEST = 3
 SCAN_INTERVAL = timedelta(minutes=60)
@@ -90,7 +95,11 @@ class WatcherBase:
         super().__init__()
 
         self.hass = hass
-        self._integration_matchers = integration_matchers
+        self._integration_matchers = DiscoveryMatcherIndex(
+            integration_matchers,
+            {MAC_ADDRESS: MAC_OUI_LENGTH},
+            stats=get_matcher_stats(hass, DOMAIN),
+        )
         self._address_data = address_data
 
     def process_client(self, ip_address, hostname, mac_address):
@@ -132,17 +141,9 @@ class WatcherBase:
             lowercase_hostname,
         )
 
-        for entry in self._integration_matchers:
-            if MAC_ADDRESS in entry and not fnmatch.fnmatch(
-                uppercase_mac, entry[MAC_ADDRESS]
-            ):
-                continue
-
-            if HOSTNAME in entry and not fnmatch.fnmatch(
-                lowercase_hostname, entry[HOSTNAME]
-            ):
-                continue
-
+        for entry in self._integration_matchers.match(
+            {MAC_ADDRESS: uppercase_mac, HOSTNAME: lowercase_hostname}
+        ):
             _LOGGER.debug("Matched %s against %s", data, entry)
 
             self.create_task(
@@ -22,11 +22,20 @@ from homeassistant.const import (
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_NONE,
     EVENT_HOMEASSISTANT_START,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_OFF,
     STATE_ON,
 )
-from homeassistant.core import CoreState, HomeAssistant, callback, split_entity_id
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
 from homeassistant.helpers.entity_component import EntityComponent
@@ -59,6 +68,9 @@ SERVICE_REMOVE = "remove"
 PLATFORMS = ["light", "cover", "notify"]
 
 REG_KEY = f"{DOMAIN}_registry"
+MEMBERSHIP_KEY = f"{DOMAIN}_membership"
+
+GROUP_PREFIX = f"{DOMAIN}."
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -114,6 +126,170 @@ class GroupIntegrationRegistry:
         self.on_states_by_domain[current_domain.get()] = set(on_states)
 
 
+class _ExpandedGroup:
+    """Members of a group with nested groups expanded."""
+
+    __slots__ = ("entity_ids", "dependencies")
+
+    def __init__(
+        self, entity_ids: tuple[str, ...], dependencies: dict[str, State | None]
+    ) -> None:
+        """Initialize the expanded group."""
+        self.entity_ids = entity_ids
+        # The state of each group the expansion was computed from
+        self.dependencies = dependencies
+
+
+class GroupMembership:
+    """Flattened membership graph of the groups.
+
+    The expansion of each group is cached with the state of every group it
+    was expanded from. It is checked against the state machine when looked
+    up, and recomputed when the members of any of these groups changed. A
+    reverse index maps each entity to the group entities containing it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the membership graph."""
+        self.hass = hass
+        self._expanded: dict[str, _ExpandedGroup] = {}
+        self._groups_by_member: dict[str, dict[str, None]] = {}
+        self._reported_cycles: set[tuple[str, str]] = set()
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Drop the expansions of groups when they are removed."""
+        return self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_group_removed, _async_is_group_removal
+        )
+
+    @callback
+    def _async_group_removed(self, event: Event) -> None:
+        """Drop a removed group."""
+        self.async_drop(event.data["entity_id"])
+
+    @callback
+    def async_drop(self, group_id: str) -> None:
+        """Drop the cached expansion and reported cycles of a removed group."""
+        self._expanded.pop(group_id, None)
+        self._reported_cycles = {
+            cycle for cycle in self._reported_cycles if group_id not in cycle
+        }
+
+    def _is_current(self, expanded: _ExpandedGroup) -> bool:
+        """Return True if the members of the groups of an expansion are unchanged.
+
+        A group state that changed without changing its members is kept as the
+        new state of the expansion, so it is compared by identity next time.
+        """
+        dependencies = expanded.dependencies
+        for group_id, state in dependencies.items():
+            current = self.hass.states.get(group_id)
+            if current is state:
+                continue
+            if current is None or state is None:
+                return False
+            if current.attributes.get(ATTR_ENTITY_ID) != state.attributes.get(
+                ATTR_ENTITY_ID
+            ):
+                return False
+            dependencies[group_id] = current
+        return True
+
+    def expand(self, group_id: str) -> tuple[str, ...]:
+        """Return the members of a group with nested groups replaced by their members."""
+        return self._expand(group_id, [])[0].entity_ids
+
+    def _expand(self, group_id: str, stack: list[str]) -> tuple[_ExpandedGroup, int]:
+        """Expand a group nested in the groups of the stack.
+
+        Also return the lowest stack depth of the groups it loops back to,
+        the expansion is only cached when it does not depend on a group
+        being expanded lower in the stack.
+        """
+        if (expanded := self._expanded.get(group_id)) and self._is_current(expanded):
+            return expanded, len(stack)
+
+        depth = len(stack)
+        stack.append(group_id)
+        lowest_depth = depth
+        state = self.hass.states.get(group_id)
+        dependencies = {group_id: state}
+        found_ids: dict[str, None] = {}
+
+        members = state.attributes.get(ATTR_ENTITY_ID, ()) if state else ()
+        for member in members:
+            if not isinstance(member, str):
+                continue
+            member = member.lower()
+            if not member.startswith(GROUP_PREFIX):
+                found_ids[member] = None
+                continue
+            if member in stack:
+                if member != group_id and (group_id, member) not in (
+                    self._reported_cycles
+                ):
+                    self._reported_cycles.add((group_id, member))
+                    _LOGGER.warning(
+                        "Group %s contains %s which already contains it",
+                        group_id,
+                        member,
+                    )
+                lowest_depth = min(lowest_depth, stack.index(member))
+                continue
+            nested, nested_depth = self._expand(member, stack)
+            lowest_depth = min(lowest_depth, nested_depth)
+            dependencies.update(nested.dependencies)
+            found_ids.update(dict.fromkeys(nested.entity_ids))
+
+        stack.pop()
+        expanded = _ExpandedGroup(tuple(found_ids), dependencies)
+        # Groups without a state are not cached, so they are not kept after
+        # their removal
+        if lowest_depth >= depth and state is not None:
+            self._expanded[group_id] = expanded
+        else:
+            self._expanded.pop(group_id, None)
+        return expanded, lowest_depth
+
+    @callback
+    def async_add_group(self, group_id: str, entity_ids: Iterable[str]) -> None:
+        """Add a group entity to the reverse index of its members."""
+        for entity_id in entity_ids:
+            self._groups_by_member.setdefault(entity_id, {})[group_id] = None
+
+    @callback
+    def async_remove_group(self, group_id: str, entity_ids: Iterable[str]) -> None:
+        """Remove a group entity from the reverse index of its members."""
+        for entity_id in entity_ids:
+            if (groups := self._groups_by_member.get(entity_id)) is None:
+                continue
+            groups.pop(group_id, None)
+            if not groups:
+                del self._groups_by_member[entity_id]
+
+    def groups_with_entity(self, entity_id: str) -> list[str]:
+        """Return the group entities directly containing an entity."""
+        return list(self._groups_by_member.get(entity_id, ()))
+
+
+@callback
+def _async_is_group_removal(event: Event) -> bool:
+    """Return True if a group state was removed."""
+    return event.data.get("new_state") is None and event.data["entity_id"].startswith(
+        GROUP_PREFIX
+    )
+
+
+@callback
+def _get_membership(hass: HomeAssistant) -> GroupMembership:
+    """Return the group membership graph, starting it if needed."""
+    if (membership := hass.data.get(MEMBERSHIP_KEY)) is None:
+        membership = hass.data[MEMBERSHIP_KEY] = GroupMembership(hass)
+        membership.async_start()
+    return cast(GroupMembership, membership)
+
+
 @bind_hass
 def is_on(hass, entity_id):
     """Test if the group state is in its ON-state."""
@@ -135,7 +311,8 @@ def expand_entity_ids(hass: HomeAssistant, entity_ids: Iterable[Any]) -> list[st
 
     Async friendly.
     """
-    found_ids: list[str] = []
+    membership = hass.data.get(MEMBERSHIP_KEY) or GroupMembership(hass)
+    found_ids: dict[str, None] = {}
     for entity_id in entity_ids:
         if not isinstance(entity_id, str) or entity_id in (
             ENTITY_MATCH_NONE,
@@ -145,30 +322,15 @@ def expand_entity_ids(hass: HomeAssistant, entity_ids: Iterable[Any]) -> list[st
 
         entity_id = entity_id.lower()
 
-        try:
-            # If entity_id points at a group, expand it
-            domain, _ = ha.split_entity_id(entity_id)
-
-            if domain == DOMAIN:
-                child_entities = get_entity_ids(hass, entity_id)
-                if entity_id in child_entities:
-                    child_entities = list(child_entities)
-                    child_entities.remove(entity_id)
-                found_ids.extend(
-                    ent_id
-                    for ent_id in expand_entity_ids(hass, child_entities)
-                    if ent_id not in found_ids
-                )
+        # If entity_id points at a group, expand it
+        domain, _ = ha.split_entity_id(entity_id)
 
-            else:
-                if entity_id not in found_ids:
-                    found_ids.append(entity_id)
-
-        except AttributeError:
-            # Raised by split_entity_id if entity_id is not a string
-            pass
+        if domain == DOMAIN:
+            found_ids.update(dict.fromkeys(membership.expand(entity_id)))
+        else:
+            found_ids[entity_id] = None
 
-    return found_ids
+    return list(found_ids)
 
 
 @bind_hass
@@ -199,16 +361,10 @@ def groups_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
 
     Async friendly.
     """
-    if DOMAIN not in hass.data:
+    if (membership := hass.data.get(MEMBERSHIP_KEY)) is None:
         return []
 
-    groups = []
-
-    for group in hass.data[DOMAIN].entities:
-        if entity_id in group.tracking:
-            groups.append(group.entity_id)
-
-    return groups
+    return cast(GroupMembership, membership).groups_with_entity(entity_id)
 
 
 async def async_setup(hass, config):
@@ -219,6 +375,7 @@ async def async_setup(hass, config):
         component = hass.data[DOMAIN] = EntityComponent(_LOGGER, DOMAIN, hass)
 
     hass.data[REG_KEY] = GroupIntegrationRegistry()
+    _get_membership(hass)
 
     await async_process_integration_platforms(hass, DOMAIN, _process_group_platform)
 
@@ -442,6 +599,9 @@ class Group(Entity):
         self._on_off = None
         self._assumed = None
         self._on_states = None
+        # Number of members that are on and that have an assumed state
+        self._on_count = 0
+        self._assumed_count = 0
         self.user_defined = user_defined
         self.mode = any
         if mode:
@@ -572,7 +732,10 @@ class Group(Entity):
         This method must be run in the event loop.
         """
         self._async_stop()
+        membership = _get_membership(self.hass)
+        membership.async_remove_group(self.entity_id, self.tracking)
         self._set_tracked(entity_ids)
+        membership.async_add_group(self.entity_id, self.tracking)
         self._reset_tracked_state()
         self._async_start()
 
@@ -637,6 +800,8 @@ class Group(Entity):
 
     async def async_added_to_hass(self):
         """Handle addition to Home Assistant."""
+        _get_membership(self.hass).async_add_group(self.entity_id, self.tracking)
+
         if self.hass.state != CoreState.running:
             self.hass.bus.async_listen_once(
                 EVENT_HOMEASSISTANT_START, self._async_start
@@ -650,6 +815,9 @@ class Group(Entity):
     async def async_will_remove_from_hass(self):
         """Handle removal from Home Assistant."""
         self._async_stop()
+        membership = _get_membership(self.hass)
+        membership.async_remove_group(self.entity_id, self.tracking)
+        membership.async_drop(self.entity_id)
 
     async def _async_state_changed_listener(self, event):
         """Respond to a member state changing.
@@ -675,6 +843,8 @@ class Group(Entity):
         self._on_off = {}
         self._assumed = {}
         self._on_states = set()
+        self._on_count = 0
+        self._assumed_count = 0
 
         for entity_id in self.trackable:
             state = self.hass.states.get(entity_id)
@@ -688,7 +858,9 @@ class Group(Entity):
         domain = new_state.domain
         state = new_state.state
         registry = self.hass.data[REG_KEY]
-        self._assumed[entity_id] = new_state.attributes.get(ATTR_ASSUMED_STATE)
+        assumed = new_state.attributes.get(ATTR_ASSUMED_STATE)
+        self._assumed_count += bool(assumed) - bool(self._assumed.get(entity_id))
+        self._assumed[entity_id] = assumed
 
         if domain not in registry.on_states_by_domain:
             # Handle the group of a group case
@@ -696,12 +868,20 @@ class Group(Entity):
                 self._on_states.add(state)
             elif state in registry.off_on_mapping:
                 self._on_states.add(registry.off_on_mapping[state])
-            self._on_off[entity_id] = state in registry.on_off_mapping
+            member_on = state in registry.on_off_mapping
         else:
             entity_on_state = registry.on_states_by_domain[domain]
             if domain in self.hass.data[REG_KEY].on_states_by_domain:
                 self._on_states.update(entity_on_state)
-            self._on_off[entity_id] = state in entity_on_state
+            member_on = state in entity_on_state
+        self._on_count += member_on - self._on_off.get(entity_id, False)
+        self._on_off[entity_id] = member_on
+
+    def _mode_holds(self, count, total):
+        """Return the mode applied to members of which count are truthy."""
+        if self.mode is all:
+            return count == total
+        return count > 0
 
     @callback
     def _async_update_group_state(self, tr_state=None):
@@ -724,7 +904,9 @@ class Group(Entity):
             or self._assumed_state
             and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
         ):
-            self._assumed_state = self.mode(self._assumed.values())
+            self._assumed_state = self._mode_holds(
+                self._assumed_count, len(self._assumed)
+            )
 
         elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
             self._assumed_state = True
@@ -734,7 +916,7 @@ class Group(Entity):
         # have the same on state we use this state
         # and its hass.data[REG_KEY].on_off_mapping to off
         if num_on_states == 1:
-            on_state = list(self._on_states)[0]
+            on_state = next(iter(self._on_states))
         # If we do not have an on state for any domains
         # we use None (which will be STATE_UNKNOWN)
         elif num_on_states == 0:
@@ -744,7 +926,7 @@ class Group(Entity):
         # on state, we use STATE_ON/STATE_OFF
         else:
             on_state = STATE_ON
-        group_is_on = self.mode(self._on_off.values())
+        group_is_on = self._mode_holds(self._on_count, len(self._on_off))
         if group_is_on:
             self._state = on_state
         else:
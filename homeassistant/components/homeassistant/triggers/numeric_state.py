@@ -15,10 +15,9 @@ from homeassistant.const import (
 )
 from homeassistant.core import CALLBACK_TYPE, HassJob, callback
 from homeassistant.helpers import condition, config_validation as cv, template
-from homeassistant.helpers.event import (
-    async_track_same_state,
-    async_track_state_change_event,
-)
+from homeassistant.helpers.event import async_track_same_state
+
+from . import state_index
 
 # mypy: allow-incomplete-defs, allow-untyped-calls, allow-untyped-defs
 # mypy: no-check-untyped-defs
@@ -191,7 +190,17 @@ async def async_attach_trigger(
             else:
                 call_action()
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+    # With fixed thresholds the result only depends on the value, so changes
+    # that leave it unchanged can't fire or arm the trigger
+    unsub = state_index.async_get_index(hass).async_attach(
+        entity_ids,
+        state_automation_listener,
+        automation_info,
+        attribute=attribute,
+        require_change=value_template is None
+        and not isinstance(below, str)
+        and not isinstance(above, str),
+    )
 
     @callback
     def async_remove():
@@ -11,12 +11,9 @@ from homeassistant import exceptions
 from homeassistant.const import CONF_ATTRIBUTE, CONF_FOR, CONF_PLATFORM, MATCH_ALL
 from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, State, callback
 from homeassistant.helpers import config_validation as cv, template
-from homeassistant.helpers.event import (
-    Event,
-    async_track_same_state,
-    async_track_state_change_event,
-    process_state_match,
-)
+from homeassistant.helpers.event import Event, async_track_same_state
+
+from . import state_index
 
 # mypy: allow-incomplete-defs, allow-untyped-calls, allow-untyped-defs
 # mypy: no-check-untyped-defs
@@ -82,8 +79,6 @@ async def async_attach_trigger(
     match_all = from_state == MATCH_ALL and to_state == MATCH_ALL
     unsub_track_same = {}
     period: dict[str, timedelta] = {}
-    match_from_state = process_state_match(from_state)
-    match_to_state = process_state_match(to_state)
     attribute = config.get(CONF_ATTRIBUTE)
     job = HassJob(action)
 
@@ -94,7 +89,7 @@ async def async_attach_trigger(
 
     @callback
     def state_automation_listener(event: Event):
-        """Listen for state changes and calls action."""
+        """Listen for the state changes matching the trigger and calls action."""
         entity: str = event.data["entity_id"]
         from_s: State | None = event.data.get("old_state")
         to_s: State | None = event.data.get("new_state")
@@ -113,20 +108,6 @@ async def async_attach_trigger(
         else:
             new_value = to_s.attributes.get(attribute)
 
-        # When we listen for state changes with `match_all`, we
-        # will trigger even if just an attribute changes. When
-        # we listen to just an attribute, we should ignore all
-        # other attribute changes.
-        if attribute is not None and old_value == new_value:
-            return
-
-        if (
-            not match_from_state(old_value)
-            or not match_to_state(new_value)
-            or (not match_all and old_value == new_value)
-        ):
-            return
-
         @callback
         def call_action():
             """Call action with right context."""
@@ -194,7 +175,19 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_id, state_automation_listener)
+    # When we listen for state changes with `match_all`, we
+    # will trigger even if just an attribute changes. When
+    # we listen to just an attribute, we should ignore all
+    # other attribute changes.
+    unsub = state_index.async_get_index(hass).async_attach(
+        entity_id,
+        state_automation_listener,
+        automation_info,
+        attribute=attribute,
+        from_state=from_state,
+        to_state=to_state,
+        require_change=attribute is not None or not match_all,
+    )
 
     @callback
     def async_remove():
@@ -0,0 +1,246 @@
+"""Shared index of the state triggers attached to each entity."""
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable
+import itertools
+import logging
+from typing import Any, Callable, Tuple
+
+import attr
+
+from homeassistant.const import MATCH_ALL
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    process_state_match,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STATE_TRIGGER_INDEX = "state_trigger_index"
+
+StatsKey = Tuple[str, str, str]
+
+
+@attr.s(slots=True)
+class TriggerStats:
+    """Evaluation counters of the state triggers of an automation."""
+
+    triggers: int = attr.ib(default=0)
+    evaluations: int = attr.ib(default=0)
+    matches: int = attr.ib(default=0)
+
+
+class _IndexedTrigger:
+    """A state trigger attached to the index."""
+
+    __slots__ = ("order", "job", "match_from", "match_to", "stats")
+
+    def __init__(
+        self,
+        order: int,
+        job: HassJob,
+        from_state: Any,
+        to_state: Any,
+        stats: TriggerStats,
+    ) -> None:
+        """Compile the from and to constraints."""
+        self.order = order
+        self.job = job
+        self.match_from = process_state_match(from_state)
+        self.match_to = process_state_match(to_state)
+        self.stats = stats
+
+
+def _to_keys(to_state: Any) -> list[Hashable] | None:
+    """Return the values a trigger can be looked up by, None if it can't."""
+    if to_state is None or to_state == MATCH_ALL:
+        return None
+    if isinstance(to_state, str) or not hasattr(to_state, "__iter__"):
+        return [to_state] if isinstance(to_state, Hashable) else None
+    return list(set(to_state))
+
+
+class _AttributeTable:
+    """Decision table of the triggers on one value of an entity.
+
+    Triggers are looked up by the new value when they only accept some
+    values, the other triggers are candidates for every change of the value.
+    Triggers that fire even when the value didn't change are kept apart.
+    """
+
+    __slots__ = ("by_to", "any_to", "always")
+
+    def __init__(self) -> None:
+        """Initialize the table."""
+        self.by_to: dict[Hashable, list[_IndexedTrigger]] = {}
+        self.any_to: list[_IndexedTrigger] = []
+        self.always: list[_IndexedTrigger] = []
+
+    def __bool__(self) -> bool:
+        """Return True if triggers are in the table."""
+        return bool(self.by_to or self.any_to or self.always)
+
+    def candidates(self, new_value: Any, changed: bool) -> list[_IndexedTrigger]:
+        """Return the triggers that may match, in the order they were attached."""
+        if not changed:
+            return self.always
+        try:
+            by_to = self.by_to.get(new_value, [])
+        except TypeError:
+            # Unhashable values can't be looked up
+            by_to = []
+        if not self.any_to and not self.always:
+            return by_to
+        if not by_to and not self.always:
+            return self.any_to
+        return sorted(
+            itertools.chain(by_to, self.any_to, self.always),
+            key=lambda trigger: trigger.order,
+        )
+
+
+def _state_value(state: Any, attribute: str | None) -> Any:
+    if state is None:
+        return None
+    if attribute is None:
+        return state.state
+    return state.attributes.get(attribute)
+
+
+class StateTriggerIndex:
+    """Index of the state triggers by entity and by the values they accept.
+
+    The index listens once to the state changes of each entity and only
+    runs the triggers whose constraints match, instead of every trigger
+    listening to its entities and rejecting most changes itself.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self.stats: dict[StatsKey, TriggerStats] = {}
+        self._tables: dict[str, dict[str | None, _AttributeTable]] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+        self._order = itertools.count()
+
+    @callback
+    def async_attach(
+        self,
+        entity_ids: Iterable[str],
+        action: Callable[[Event], Any],
+        automation_info: dict | None,
+        *,
+        attribute: str | None = None,
+        from_state: Any = MATCH_ALL,
+        to_state: Any = MATCH_ALL,
+        require_change: bool = True,
+    ) -> CALLBACK_TYPE:
+        """Attach a trigger to the state changes of entities.
+
+        The action is run for changes of the state, or of the attribute, of
+        the entities that match from_state and to_state. Changes that leave
+        the value unchanged are only passed on when require_change is False.
+        """
+        info = automation_info or {}
+        stats_key = (
+            info.get("domain") or "",
+            info.get("entity_id") or "",
+            info.get("name") or "",
+        )
+        stats = self.stats.setdefault(stats_key, TriggerStats())
+        stats.triggers += 1
+
+        trigger = _IndexedTrigger(
+            next(self._order), HassJob(action), from_state, to_state, stats
+        )
+        to_keys = None if not require_change else _to_keys(to_state)
+        entity_ids = [entity_id.lower() for entity_id in entity_ids]
+
+        for entity_id in entity_ids:
+            if entity_id not in self._tables:
+                self._tables[entity_id] = {}
+                self._unsubs[entity_id] = async_track_state_change_event(
+                    self.hass, entity_id, self._async_state_changed
+                )
+            table = self._tables[entity_id].setdefault(attribute, _AttributeTable())
+            if not require_change:
+                table.always.append(trigger)
+            elif to_keys is None:
+                table.any_to.append(trigger)
+            else:
+                for key in to_keys:
+                    table.by_to.setdefault(key, []).append(trigger)
+
+        @callback
+        def async_remove() -> None:
+            """Detach the trigger."""
+            for entity_id in entity_ids:
+                self._async_remove(entity_id, attribute, trigger)
+            stats.triggers -= 1
+            if not stats.triggers:
+                del self.stats[stats_key]
+
+        return async_remove
+
+    @callback
+    def _async_remove(
+        self, entity_id: str, attribute: str | None, trigger: _IndexedTrigger
+    ) -> None:
+        tables = self._tables.get(entity_id)
+        if tables is None or (table := tables.get(attribute)) is None:
+            return
+        for triggers in (table.always, table.any_to, *table.by_to.values()):
+            if trigger in triggers:
+                triggers.remove(trigger)
+        for key in [key for key, triggers in table.by_to.items() if not triggers]:
+            del table.by_to[key]
+
+        if not table:
+            del tables[attribute]
+        if not tables:
+            del self._tables[entity_id]
+            self._unsubs.pop(entity_id)()
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Run the triggers matching a state change."""
+        entity_id = event.data["entity_id"]
+        if (tables := self._tables.get(entity_id)) is None:
+            return
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+
+        for attribute, table in list(tables.items()):
+            old_value = _state_value(old_state, attribute)
+            new_value = _state_value(new_state, attribute)
+            candidates = table.candidates(new_value, old_value != new_value)
+
+            for trigger in list(candidates):
+                trigger.stats.evaluations += 1
+                if not trigger.match_from(old_value) or not trigger.match_to(new_value):
+                    continue
+                trigger.stats.matches += 1
+                try:
+                    self.hass.async_run_hass_job(trigger.job, event)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(
+                        "Error while processing state change for %s", entity_id
+                    )
+
+
+@callback
+def async_get_index(hass: HomeAssistant) -> StateTriggerIndex:
+    """Return the state trigger index."""
+    if (index := hass.data.get(DATA_STATE_TRIGGER_INDEX)) is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return index  # type: ignore[no-any-return]
+
+
+@callback
+def async_get_trigger_stats(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Return the evaluation counters of the state triggers per automation."""
+    return [
+        {"domain": domain, "entity_id": entity_id, "name": name, **attr.asdict(stats)}
+        for (domain, entity_id, name), stats in async_get_index(hass).stats.items()
+    ]
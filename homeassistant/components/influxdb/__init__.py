@@ -1,6 +1,7 @@
 """Support for sending data to an Influx database."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 import logging
@@ -30,7 +31,11 @@ from homeassistant.const import (
     STATE_UNKNOWN,
 )
 from homeassistant.core import callback
-from homeassistant.helpers import event as event_helper, state as state_helper
+from homeassistant.helpers import (
+    discovery,
+    event as event_helper,
+    state as state_helper,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.helpers.entityfilter import (
@@ -64,6 +69,11 @@ from .const import (
     CONF_PORT,
     CONF_PRECISION,
     CONF_RETRY_COUNT,
+    CONF_SPOOL,
+    CONF_SPOOL_BATCH_BYTES,
+    CONF_SPOOL_MAX_SIZE,
+    CONF_SPOOL_QUEUE_THRESHOLD,
+    CONF_SPOOL_WRITERS,
     CONF_SSL,
     CONF_SSL_CA_CERT,
     CONF_TAGS,
@@ -75,6 +85,10 @@ from .const import (
     DEFAULT_API_VERSION,
     DEFAULT_HOST_V2,
     DEFAULT_MEASUREMENT_ATTR,
+    DEFAULT_SPOOL_BATCH_BYTES,
+    DEFAULT_SPOOL_MAX_SIZE,
+    DEFAULT_SPOOL_QUEUE_THRESHOLD,
+    DEFAULT_SPOOL_WRITERS,
     DEFAULT_SSL_V2,
     DOMAIN,
     EVENT_NEW_STATE,
@@ -89,16 +103,23 @@ from .const import (
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
+    REPLAYED_MESSAGE,
     RESUMED_MESSAGE,
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_DIRECTORY,
+    SPOOL_REPLAY_ERROR_MESSAGE,
+    SPOOL_RETRY_INTERVAL,
+    SPOOL_SEGMENT_SIZE,
+    SPOOLED_MESSAGE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .spool import InfluxSpool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -181,6 +202,22 @@ _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
         vol.Optional(CONF_COMPONENT_CONFIG_DOMAIN, default={}): vol.Schema(
             {cv.string: _CUSTOMIZE_ENTITY_SCHEMA}
         ),
+        vol.Optional(CONF_SPOOL): vol.Schema(
+            {
+                vol.Optional(
+                    CONF_SPOOL_MAX_SIZE, default=DEFAULT_SPOOL_MAX_SIZE
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(
+                    CONF_SPOOL_QUEUE_THRESHOLD, default=DEFAULT_SPOOL_QUEUE_THRESHOLD
+                ): cv.positive_int,
+                vol.Optional(
+                    CONF_SPOOL_WRITERS, default=DEFAULT_SPOOL_WRITERS
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(
+                    CONF_SPOOL_BATCH_BYTES, default=DEFAULT_SPOOL_BATCH_BYTES
+                ): cv.positive_int,
+            }
+        ),
     }
 )
 
@@ -479,9 +516,24 @@ def setup(hass, config):
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    spool_conf = conf.get(CONF_SPOOL)
+    spool = None
+    if spool_conf is not None:
+        max_size = spool_conf[CONF_SPOOL_MAX_SIZE] * 1024 * 1024
+        # Keep several segments so dropping the oldest one frees a part of the spool
+        spool = InfluxSpool(
+            hass.config.path(SPOOL_DIRECTORY),
+            min(SPOOL_SEGMENT_SIZE, max_size // 4),
+            max_size,
+        )
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_json, max_tries, spool, spool_conf
+    )
     instance.start()
 
+    if spool is not None:
+        discovery.load_platform(hass, "sensor", DOMAIN, {}, config)
+
     def shutdown(event):
         """Shut down the thread."""
         instance.queue.put(None)
@@ -496,7 +548,9 @@ def setup(hass, config):
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(
+        self, hass, influx, event_to_json, max_tries, spool=None, spool_conf=None
+    ):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue = queue.Queue()
@@ -505,6 +559,14 @@ class InfluxThread(threading.Thread):
         self.max_tries = max_tries
         self.write_errors = 0
         self.shutdown = False
+        self.spool = spool
+        if spool is not None:
+            self.spool_queue_threshold = spool_conf[CONF_SPOOL_QUEUE_THRESHOLD]
+            self.spool_writers = spool_conf[CONF_SPOOL_WRITERS]
+            self.spool_batch_bytes = spool_conf[CONF_SPOOL_BATCH_BYTES]
+        # While InfluxDB is unreachable, events go to the spool until a replay succeeds
+        self.unreachable = False
+        self.next_replay = 0.0
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
@@ -518,6 +580,12 @@ class InfluxThread(threading.Thread):
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
+    def idle_timeout(self):
+        """Return number of seconds to wait for the first event of a batch."""
+        if self.spool is None or not self.spool.backlog:
+            return None
+        return max(self.next_replay - time.monotonic(), 0)
+
     def get_events_json(self):
         """Return a batch of events formatted for writing."""
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
@@ -529,7 +597,7 @@ class InfluxThread(threading.Thread):
 
         with suppress(queue.Empty):
             while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
-                timeout = None if count == 0 else self.batch_timeout()
+                timeout = self.idle_timeout() if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
 
@@ -539,7 +607,8 @@ class InfluxThread(threading.Thread):
                     timestamp, event = item
                     age = time.monotonic() - timestamp
 
-                    if age < queue_seconds:
+                    # Old events are kept when they can be spooled
+                    if age < queue_seconds or self.spool is not None:
                         event_json = self.event_to_json(event)
                         if event_json:
                             json.append(event_json)
@@ -569,19 +638,92 @@ class InfluxThread(threading.Thread):
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
+                elif self.spool is not None:
+                    _LOGGER.error(SPOOLED_MESSAGE, err)
+                    self.spool.append(json)
+                    self.unreachable = True
+                    self.next_replay = time.monotonic() + SPOOL_RETRY_INTERVAL
                 else:
                     if not self.write_errors:
                         _LOGGER.error(err)
                     self.write_errors += len(json)
 
+    def write_spooled(self, json):
+        """Write a batch of spooled events, return False if InfluxDB is unreachable."""
+        try:
+            self.influx.write(json)
+        except ValueError as err:
+            # Retrying can't fix invalid data
+            _LOGGER.error(err)
+        except ConnectionError:
+            return False
+        return True
+
+    def replay_spool(self, executor):
+        """Write the oldest segment of the spool with parallel writers."""
+        path = self.spool.oldest_segment()
+        start = time.monotonic()
+        results = list(
+            executor.map(
+                self.write_spooled,
+                self.spool.read_batches(path, self.spool_batch_bytes),
+            )
+        )
+        if all(results):
+            points = self.spool.metrics.replayed_points
+            self.spool.remove_segment(path, time.monotonic() - start)
+            _LOGGER.debug(REPLAYED_MESSAGE, self.spool.metrics.replayed_points - points)
+            self.unreachable = False
+        else:
+            # The whole segment is written again, InfluxDB overwrites the
+            # points already written as they have the same timestamps
+            self.unreachable = True
+            self.next_replay = time.monotonic() + SPOOL_RETRY_INTERVAL
+
+    def should_spool(self):
+        """Return True if new events should be spooled instead of written."""
+        return self.spool is not None and (
+            self.unreachable or self.queue.qsize() > self.spool_queue_threshold
+        )
+
+    def should_replay(self):
+        """Return True if the spool should be replayed now."""
+        return (
+            self.spool is not None
+            and self.spool.backlog
+            and not self.shutdown
+            and self.queue.qsize() <= self.spool_queue_threshold
+            and (not self.unreachable or time.monotonic() >= self.next_replay)
+        )
+
     def run(self):
         """Process incoming events."""
+        executor = None
+        if self.spool is not None:
+            executor = ThreadPoolExecutor(
+                max_workers=self.spool_writers, thread_name_prefix=f"{DOMAIN}_spool"
+            )
+
         while not self.shutdown:
             count, json = self.get_events_json()
             if json:
-                self.write_to_influxdb(json)
+                if self.should_spool():
+                    self.spool.append(json)
+                else:
+                    self.write_to_influxdb(json)
             for _ in range(count):
                 self.queue.task_done()
+            if self.should_replay():
+                try:
+                    self.replay_spool(executor)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(SPOOL_REPLAY_ERROR_MESSAGE)
+                    self.unreachable = True
+                    self.next_replay = time.monotonic() + SPOOL_RETRY_INTERVAL
+
+        if executor is not None:
+            executor.shutdown()
+            self.spool.close()
 
     def block_till_done(self):
         """Block till all events processed."""
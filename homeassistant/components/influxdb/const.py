@@ -32,6 +32,11 @@ CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
+CONF_SPOOL = "spool"
+CONF_SPOOL_MAX_SIZE = "max_size"
+CONF_SPOOL_QUEUE_THRESHOLD = "queue_threshold"
+CONF_SPOOL_WRITERS = "writers"
+CONF_SPOOL_BATCH_BYTES = "batch_bytes"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -59,6 +64,10 @@ DEFAULT_RANGE_START = "-15m"
 DEFAULT_RANGE_STOP = "now()"
 DEFAULT_FUNCTION_FLUX = "|> limit(n: 1)"
 DEFAULT_MEASUREMENT_ATTR = "unit_of_measurement"
+DEFAULT_SPOOL_MAX_SIZE = 100  # MB
+DEFAULT_SPOOL_QUEUE_THRESHOLD = 1000
+DEFAULT_SPOOL_WRITERS = 2
+DEFAULT_SPOOL_BATCH_BYTES = 512 * 1024
 
 INFLUX_CONF_MEASUREMENT = "measurement"
 INFLUX_CONF_TAGS = "tags"
@@ -78,6 +87,9 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+SPOOL_DIRECTORY = ".influxdb_spool"
+SPOOL_SEGMENT_SIZE = 4 * 1024 * 1024
+SPOOL_RETRY_INTERVAL = 30  # seconds
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -120,6 +132,11 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+SPOOLED_MESSAGE = "InfluxDB is not reachable, spooling events to disk: %s"
+SPOOL_DROPPED_MESSAGE = "InfluxDB spool is full, dropped %d old events."
+REPLAYED_MESSAGE = "Wrote %d spooled events."
+SPOOL_CORRUPT_MESSAGE = "Skipped %d corrupt spooled events in %s."
+SPOOL_REPLAY_ERROR_MESSAGE = "Error replaying the InfluxDB spool."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
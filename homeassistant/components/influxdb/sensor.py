@@ -1,6 +1,7 @@
 """InfluxDB component which allows you to get data from an Influx database."""
 from __future__ import annotations
 
+from dataclasses import asdict
 import datetime
 import logging
 from typing import Final
@@ -9,6 +10,7 @@ import voluptuous as vol
 
 from homeassistant.components.sensor import (
     PLATFORM_SCHEMA as SENSOR_PLATFORM_SCHEMA,
+    STATE_CLASS_MEASUREMENT,
     SensorEntity,
 )
 from homeassistant.const import (
@@ -46,6 +48,7 @@ from .const import (
     DEFAULT_GROUP_FUNCTION,
     DEFAULT_RANGE_START,
     DEFAULT_RANGE_STOP,
+    DOMAIN,
     INFLUX_CONF_VALUE,
     INFLUX_CONF_VALUE_V2,
     LANGUAGE_FLUX,
@@ -61,6 +64,7 @@ from .const import (
     RENDERING_WHERE_MESSAGE,
     RUNNING_QUERY_MESSAGE,
 )
+from .spool import InfluxSpool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -150,6 +154,10 @@ PLATFORM_SCHEMA = vol.All(
 
 def setup_platform(hass, config, add_entities, discovery_info=None):
     """Set up the InfluxDB component."""
+    if discovery_info is not None:
+        add_entities([InfluxSpoolSensor(hass.data[DOMAIN].spool)])
+        return
+
     try:
         influx = get_influx_connection(config, test_read=True)
     except ConnectionError as exc:
@@ -175,6 +183,28 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, lambda _: influx.close())
 
 
+class InfluxSpoolSensor(SensorEntity):
+    """Number of points waiting in the spool of InfluxDB."""
+
+    _attr_name = "InfluxDB spool backlog"
+    _attr_icon = "mdi:database-clock"
+    _attr_native_unit_of_measurement = "points"
+    _attr_state_class = STATE_CLASS_MEASUREMENT
+
+    def __init__(self, spool: InfluxSpool) -> None:
+        """Initialize the sensor."""
+        self._spool = spool
+
+    def update(self) -> None:
+        """Read the counters of the spool."""
+        metrics = asdict(self._spool.metrics)
+        self._attr_native_value = metrics.pop("backlog_points")
+        metrics["replay_points_per_second"] = round(
+            metrics["replay_points_per_second"], 1
+        )
+        self._attr_extra_state_attributes = metrics
+
+
 class InfluxSensor(SensorEntity):
     """Implementation of a Influxdb sensor."""
 
@@ -0,0 +1,190 @@
+"""Durable on-disk spool of the points waiting to be written to InfluxDB."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+import datetime
+import json
+import logging
+import os
+from typing import Any
+
+from .const import SPOOL_CORRUPT_MESSAGE, SPOOL_DROPPED_MESSAGE
+
+_LOGGER = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".spool"
+
+
+@dataclass
+class SpoolMetrics:
+    """Counters of an InfluxDB spool."""
+
+    backlog_points: int = 0
+    backlog_bytes: int = 0
+    spooled_points: int = 0
+    replayed_points: int = 0
+    dropped_points: int = 0
+    corrupt_points: int = 0
+    replay_points_per_second: float = 0.0
+
+
+@dataclass
+class _Segment:
+    """A spool segment file."""
+
+    path: str
+    points: int = 0
+    size: int = 0
+
+
+def _json_default(value: Any) -> str:
+    """Serialize the point values JSON doesn't support."""
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return str(value)
+
+
+class InfluxSpool:
+    """Append-only spool of points, rotated in segment files.
+
+    Each line of a segment is one point encoded as JSON. Segments are
+    replayed oldest first and deleted once written. When the spool outgrows
+    its maximum size the oldest segments are dropped, so a server that stays
+    unreachable can't fill up the disk.
+
+    The spool is only used from the InfluxDB thread.
+    """
+
+    def __init__(self, directory: str, segment_size: int, max_size: int) -> None:
+        """Load the segments left in the spool directory."""
+        self.directory = directory
+        self.segment_size = segment_size
+        self.max_size = max_size
+        self.metrics = SpoolMetrics()
+        self._segments: list[_Segment] = []
+        self._file = None
+        self._sequence = 0
+
+        os.makedirs(directory, exist_ok=True)
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(SEGMENT_SUFFIX):
+                continue
+            segment = _Segment(os.path.join(directory, name))
+            with open(segment.path, "rb") as file:
+                for line in file:
+                    segment.points += 1
+                    segment.size += len(line)
+            self._segments.append(segment)
+            self._sequence = max(self._sequence, int(name[: -len(SEGMENT_SUFFIX)]))
+            self._add_backlog(segment.points, segment.size)
+
+    @property
+    def backlog(self) -> bool:
+        """Return True if points are waiting in the spool."""
+        return self.metrics.backlog_points > 0
+
+    def append(self, points: list[dict]) -> None:
+        """Append points to the current segment, rotating it when full."""
+        if not points:
+            return
+        data = "".join(
+            f"{json.dumps(point, default=_json_default)}\n" for point in points
+        ).encode()
+
+        if self._file is None or self._segments[-1].size >= self.segment_size:
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        segment = self._segments[-1]
+        segment.points += len(points)
+        segment.size += len(data)
+        self.metrics.spooled_points += len(points)
+        self._add_backlog(len(points), len(data))
+        self._enforce_max_size()
+
+    def oldest_segment(self) -> str | None:
+        """Return the path of the oldest segment, closing it if it is current."""
+        if not self._segments:
+            return None
+        if len(self._segments) == 1:
+            self._close_file()
+        return self._segments[0].path
+
+    def read_batches(self, path: str, max_bytes: int) -> Iterator[list[dict]]:
+        """Read the points of a segment in batches of at most max_bytes.
+
+        Lines that can't be decoded, such as the last line of a segment being
+        written when Home Assistant crashed, are skipped.
+        """
+        batch: list[dict] = []
+        batch_size = 0
+        corrupt = 0
+        with open(path, "rb") as file:
+            for line in file:
+                try:
+                    point = json.loads(line)
+                except ValueError:
+                    corrupt += 1
+                    continue
+                if batch and batch_size + len(line) > max_bytes:
+                    yield batch
+                    batch = []
+                    batch_size = 0
+                batch.append(point)
+                batch_size += len(line)
+        if batch:
+            yield batch
+        if corrupt:
+            self.metrics.corrupt_points += corrupt
+            _LOGGER.warning(SPOOL_CORRUPT_MESSAGE, corrupt, path)
+
+    def remove_segment(self, path: str, seconds: float) -> None:
+        """Remove a segment whose points were written in the given time."""
+        segment = self._pop_segment(path)
+        self.metrics.replayed_points += segment.points
+        if seconds > 0:
+            self.metrics.replay_points_per_second = segment.points / seconds
+
+    def close(self) -> None:
+        """Close the current segment, its points stay in the spool."""
+        self._close_file()
+
+    def _rotate(self) -> None:
+        """Start a new segment."""
+        self._close_file()
+        self._sequence += 1
+        path = os.path.join(self.directory, f"{self._sequence:012d}{SEGMENT_SUFFIX}")
+        self._file = open(path, "ab")  # pylint: disable=consider-using-with
+        self._segments.append(_Segment(path))
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _enforce_max_size(self) -> None:
+        """Drop the oldest segments while the spool is too large."""
+        while self.metrics.backlog_bytes > self.max_size and len(self._segments) > 1:
+            segment = self._pop_segment(self._segments[0].path)
+            self.metrics.dropped_points += segment.points
+            _LOGGER.warning(SPOOL_DROPPED_MESSAGE, segment.points)
+
+    def _pop_segment(self, path: str) -> _Segment:
+        for index, segment in enumerate(self._segments):
+            if segment.path == path:
+                break
+        else:
+            raise KeyError(path)
+        if index == len(self._segments) - 1:
+            self._close_file()
+        del self._segments[index]
+        os.remove(path)
+        self._add_backlog(-segment.points, -segment.size)
+        return segment
+
+    def _add_backlog(self, points: int, size: int) -> None:
+        self.metrics.backlog_points += points
+        self.metrics.backlog_bytes += size
@@ -2,14 +2,16 @@
 from __future__ import annotations
 
 import asyncio
-from functools import lru_cache, partial, wraps
+from collections import deque
+import datetime as dt
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
 from operator import attrgetter
 import ssl
 import time
-from typing import Any, Awaitable, Callable, Union, cast
+from typing import Any, Awaitable, Callable, Iterable, Union, cast
 import uuid
 
 import attr
@@ -80,7 +82,9 @@ from .models import (
     PublishPayloadType,
     ReceiveMessage,
     ReceivePayloadType,
+    SubscriptionQueueMetrics,
 )
+from .topic_trie import TopicTrie
 from .util import _VALID_QOS_SCHEMA, valid_publish_topic, valid_subscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
@@ -118,6 +122,7 @@ CONNECTION_FAILED_RECOVERABLE = "connection_failed_recoverable"
 
 DISCOVERY_COOLDOWN = 2
 TIMEOUT_ACK = 10
+SUBSCRIBE_RETRY_INTERVAL = 10
 
 PLATFORMS = [
     "alarm_control_panel",
@@ -417,6 +422,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, websocket_subscribe)
     websocket_api.async_register_command(hass, websocket_remove_device)
     websocket_api.async_register_command(hass, websocket_mqtt_info)
+    websocket_api.async_register_command(hass, websocket_subscription_metrics)
 
     if conf is None:
         # If we have a config entry, setup is done by that config entry.
@@ -556,7 +562,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
@@ -580,6 +585,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        self._subscription_trie: TopicTrie[Subscription] = TopicTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -588,6 +594,18 @@ class MQTT:
 
         self._pending_operations: dict[str, asyncio.Event] = {}
 
+        # Topics waiting to be sent to the broker in batched (UN)SUBSCRIBE packets
+        self._pending_subscriptions: list[dict[str, int]] = []
+        self._pending_unsubscribes: dict[str, None] = {}
+        self._pending_subscriptions_task: asyncio.Task | None = None
+        self._failed_subscriptions: set[str] = set()
+        self._subscription_retry: asyncio.TimerHandle | None = None
+        self.subscription_metrics = SubscriptionQueueMetrics()
+
+        # Messages received by the paho network thread, drained by the event loop
+        self._received_messages: deque = deque()
+        self._drain_scheduled = False
+
         if self.hass.state == CoreState.running:
             self._ha_started.set()
         else:
@@ -755,16 +773,14 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._subscription_trie.add(topic, subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
             self._last_subscribe = time.time()
-            await self._async_perform_subscription(topic, qos)
+            self._async_queue_subscription(topic, qos)
 
         @callback
         def async_remove() -> None:
@@ -772,40 +788,168 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            self._subscription_trie.remove(topic, subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if topic in self._subscription_trie:
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
             # Only unsubscribe if currently connected.
             if self.connected:
-                self.hass.async_create_task(self._async_unsubscribe(topic))
+                self._async_queue_unsubscribe(topic)
 
         return async_remove
 
-    async def _async_unsubscribe(self, topic: str) -> None:
-        """Unsubscribe from a topic.
+    @callback
+    def _async_queue_subscription(self, topic: str, qos: int) -> None:
+        """Queue a topic for the next batched SUBSCRIBE packet.
+
+        A topic queued again with another qos goes to a new batch, so the
+        broker gets the subscriptions in the order they were made.
+        """
+        self._pending_unsubscribes.pop(topic, None)
+        pending = self._pending_subscriptions
+        if not pending or pending[-1].get(topic, qos) != qos:
+            pending.append({})
+        pending[-1][topic] = qos
+        self._async_schedule_pending_subscriptions()
+
+    @callback
+    def _async_queue_unsubscribe(self, topic: str) -> None:
+        """Queue a topic for the next batched UNSUBSCRIBE packet."""
+        for batch in self._pending_subscriptions:
+            batch.pop(topic, None)
+        self._pending_subscriptions = [
+            batch for batch in self._pending_subscriptions if batch
+        ]
+        self._pending_unsubscribes[topic] = None
+        self._async_schedule_pending_subscriptions()
+
+    @property
+    def _subscription_queue_depth(self) -> int:
+        """Return the number of topics waiting to be sent."""
+        return sum(len(batch) for batch in self._pending_subscriptions) + len(
+            self._pending_unsubscribes
+        )
+
+    @callback
+    def _async_schedule_pending_subscriptions(self) -> None:
+        """Schedule sending the queued topics if not already scheduled."""
+        metrics = self.subscription_metrics
+        metrics.queue_depth = self._subscription_queue_depth
+        metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth)
+        if self._pending_subscriptions_task is None:
+            self._pending_subscriptions_task = self.hass.async_create_task(
+                self._async_perform_pending_subscriptions()
+            )
+
+    async def _async_perform_pending_subscriptions(self) -> None:
+        """Send the queued topics in as few packets as possible.
+
+        Topics queued while a batch is waiting for the broker are sent in the
+        next batch. Failed subscriptions are retried later.
+        """
+        try:
+            while self._pending_subscriptions or self._pending_unsubscribes:
+                if not self.connected:
+                    # All active topics are subscribed to again on reconnect
+                    self._pending_subscriptions.clear()
+                    self._pending_unsubscribes.clear()
+                    break
+                if self._pending_unsubscribes:
+                    topics = list(self._pending_unsubscribes)
+                    self._pending_unsubscribes.clear()
+                    self._async_record_batch(len(topics))
+                    try:
+                        await self._async_unsubscribe(topics)
+                    except HomeAssistantError as err:
+                        _LOGGER.error("Failed to unsubscribe from %s: %s", topics, err)
+                if self._pending_subscriptions:
+                    subscriptions = list(self._pending_subscriptions.pop(0).items())
+                    self._async_record_batch(len(subscriptions))
+                    try:
+                        await self._async_perform_subscriptions(subscriptions)
+                    except HomeAssistantError as err:
+                        topics = [topic for topic, _ in subscriptions]
+                        _LOGGER.error("Failed to subscribe to %s: %s", topics, err)
+                        self._async_schedule_subscription_retry(topics)
+        finally:
+            self._pending_subscriptions_task = None
+            self.subscription_metrics.queue_depth = self._subscription_queue_depth
+
+    @callback
+    def _async_schedule_subscription_retry(self, topics: list[str]) -> None:
+        """Schedule subscribing again to the topics of a failed batch."""
+        self._failed_subscriptions.update(topics)
+        if self._subscription_retry is None:
+            self._subscription_retry = self.hass.loop.call_later(
+                SUBSCRIBE_RETRY_INTERVAL, self._async_retry_subscriptions
+            )
+
+    @callback
+    def _async_retry_subscriptions(self) -> None:
+        """Subscribe again to the topics of failed batches."""
+        self._subscription_retry = None
+        topics = self._failed_subscriptions
+        self._failed_subscriptions = set()
+        # All active topics are subscribed to again on reconnect
+        if self.connected:
+            self._async_queue_active_topics(topics)
+
+    @callback
+    def _async_queue_active_topics(self, topics: Iterable[str] | None = None) -> None:
+        """Queue the topics with active subscriptions, all if topics is None.
+
+        Each topic is subscribed to once, with the highest requested qos.
+        """
+        subscriptions = self.subscriptions
+        if topics is not None:
+            topic_set = set(topics)
+            subscriptions = [sub for sub in subscriptions if sub.topic in topic_set]
+        keyfunc = attrgetter("topic")
+        for topic, subs in groupby(sorted(subscriptions, key=keyfunc), keyfunc):
+            max_qos = max(subscription.qos for subscription in subs)
+            self._async_queue_subscription(topic, max_qos)
+
+    @callback
+    def _async_record_batch(self, batch_size: int) -> None:
+        """Update the metrics for a batch about to be sent."""
+        metrics = self.subscription_metrics
+        metrics.queue_depth = self._subscription_queue_depth
+        metrics.batches += 1
+        metrics.batched_topics += batch_size
+        metrics.last_batch_size = batch_size
+        metrics.max_batch_size = max(metrics.max_batch_size, batch_size)
+
+    async def _async_unsubscribe(self, topics: list[str]) -> None:
+        """Unsubscribe from topics in a single UNSUBSCRIBE packet.
 
         This method is a coroutine.
         """
         async with self._paho_lock:
             result: int | None = None
             result, mid = await self.hass.async_add_executor_job(
-                self._mqttc.unsubscribe, topic
+                self._mqttc.unsubscribe, topics[0] if len(topics) == 1 else topics
             )
-            _LOGGER.debug("Unsubscribing from %s, mid: %s", topic, mid)
+            _LOGGER.debug("Unsubscribing from %s, mid: %s", topics, mid)
             _raise_on_error(result)
         await self._wait_for_mid(mid)
 
-    async def _async_perform_subscription(self, topic: str, qos: int) -> None:
-        """Perform a paho-mqtt subscription."""
+    async def _async_perform_subscriptions(
+        self, subscriptions: list[tuple[str, int]]
+    ) -> None:
+        """Perform a paho-mqtt subscription to topics in a single SUBSCRIBE packet."""
         async with self._paho_lock:
             result: int | None = None
-            result, mid = await self.hass.async_add_executor_job(
-                self._mqttc.subscribe, topic, qos
-            )
-            _LOGGER.debug("Subscribing to %s, mid: %s", topic, mid)
+            if len(subscriptions) == 1:
+                result, mid = await self.hass.async_add_executor_job(
+                    self._mqttc.subscribe, *subscriptions[0]
+                )
+            else:
+                result, mid = await self.hass.async_add_executor_job(
+                    self._mqttc.subscribe, subscriptions
+                )
+            _LOGGER.debug("Subscribing to %s, mid: %s", subscriptions, mid)
             _raise_on_error(result)
         await self._wait_for_mid(mid)
 
@@ -834,12 +978,7 @@ class MQTT:
             result_code,
         )
 
-        # Group subscriptions to only re-subscribe once for each topic.
-        keyfunc = attrgetter("topic")
-        for topic, subs in groupby(sorted(self.subscriptions, key=keyfunc), keyfunc):
-            # Re-subscribe with the highest requested qos
-            max_qos = max(subscription.qos for subscription in subs)
-            self.hass.add_job(self._async_perform_subscription, topic, max_qos)
+        self.hass.loop.call_soon_threadsafe(self._async_resubscribe)
 
         if (
             CONF_BIRTH_MESSAGE in self.conf
@@ -861,45 +1000,78 @@ class MQTT:
                 publish_birth_message(birth_message), self.hass.loop
             )
 
+    @callback
+    def _async_resubscribe(self) -> None:
+        """Queue all active topics to be subscribed to again."""
+        if self._subscription_retry is not None:
+            self._subscription_retry.cancel()
+            self._subscription_retry = None
+        self._failed_subscriptions.clear()
+        self._async_queue_active_topics()
+
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        Messages are buffered and handed to the event loop in batches, waking
+        it up only when no drain is already scheduled.
+        """
+        self._received_messages.append(msg)
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._async_drain_messages)
 
     @callback
-    def _mqtt_handle_message(self, msg) -> None:
+    def _async_drain_messages(self) -> None:
+        """Handle the messages buffered by the paho network thread."""
+        # Clear the flag before draining, messages buffered after this point
+        # either get handled by this drain or schedule the next one.
+        self._drain_scheduled = False
+        timestamp = dt_util.utcnow()
+        received_messages = self._received_messages
+        for _ in range(len(received_messages)):
+            msg = received_messages.popleft()
+            try:
+                self._mqtt_handle_message(msg, timestamp)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error handling message on %s", msg.topic)
+
+    @callback
+    def _mqtt_handle_message(self, msg, timestamp: dt.datetime | None = None) -> None:
         _LOGGER.debug(
             "Received message on %s%s: %s",
             msg.topic,
             " (retained)" if msg.retain else "",
             msg.payload[0:8192],
         )
-        timestamp = dt_util.utcnow()
+        if timestamp is None:
+            timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+        subscriptions = self._subscription_trie.match(msg.topic)
+        # Payloads decoded per encoding, None if decoding failed
+        decoded_payloads: dict[str, str | None] = {}
 
         for subscription in subscriptions:
 
             payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
-                try:
-                    payload = msg.payload.decode(subscription.encoding)
-                except (AttributeError, UnicodeDecodeError):
+            if (encoding := subscription.encoding) is not None:
+                if encoding in decoded_payloads:
+                    decoded_payload = decoded_payloads[encoding]
+                else:
+                    try:
+                        decoded_payload = msg.payload.decode(encoding)
+                    except (AttributeError, UnicodeDecodeError):
+                        decoded_payload = None
+                    decoded_payloads[encoding] = decoded_payload
+                if decoded_payload is None:
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
                         msg.payload[0:8192],
                         msg.topic,
-                        subscription.encoding,
+                        encoding,
                         subscription.job,
                     )
                     continue
+                payload = decoded_payload
 
             self.hass.async_run_hass_job(
                 subscription.job,
@@ -983,16 +1155,6 @@ def _raise_on_error(result_code: int | None) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
@@ -1005,6 +1167,16 @@ async def websocket_mqtt_info(hass, connection, msg):
     connection.send_result(msg["id"], mqtt_info)
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "mqtt/subscription_metrics"})
+@callback
+def websocket_subscription_metrics(hass, connection, msg):
+    """Get metrics of the queue batching (un)subscriptions."""
+    connection.send_result(
+        msg["id"], attr.asdict(hass.data[DATA_MQTT].subscription_metrics)
+    )
+
+
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/remove", vol.Required("device_id"): str}
 )
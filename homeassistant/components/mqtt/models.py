@@ -32,5 +32,17 @@ class ReceiveMessage:
     timestamp: dt.datetime = attr.ib(default=None)
 
 
+@attr.s(slots=True)
+class SubscriptionQueueMetrics:
+    """Metrics of the queue batching topics into SUBSCRIBE and UNSUBSCRIBE packets."""
+
+    queue_depth: int = attr.ib(default=0)
+    max_queue_depth: int = attr.ib(default=0)
+    batches: int = attr.ib(default=0)
+    batched_topics: int = attr.ib(default=0)
+    last_batch_size: int = attr.ib(default=0)
+    max_batch_size: int = attr.ib(default=0)
+
+
 AsyncMessageCallbackType = Callable[[ReceiveMessage], Awaitable[None]]
 MessageCallbackType = Callable[[ReceiveMessage], None]
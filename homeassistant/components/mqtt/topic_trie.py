@@ -0,0 +1,135 @@
+"""Topic filter trie to find the subscriptions matching an MQTT topic."""
+from __future__ import annotations
+
+from collections.abc import Hashable
+from operator import itemgetter
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T", bound=Hashable)
+
+MATCH_CACHE_SIZE = 2048
+
+
+class _TopicNode(Generic[_T]):
+    """Node of the topic trie, one per topic filter level."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicNode[_T]] = {}
+        # Values of the topic filter ending at this node, with their insertion order
+        self.values: dict[_T, int] = {}
+
+
+def _filter_matches(filter_levels: list[str], topic: str) -> bool:
+    """Return True if a topic filter, split in levels, matches a topic."""
+    topic_levels = topic.split("/")
+    # Wildcards at the first level don't match topics starting with $
+    if topic.startswith("$") and filter_levels[0] in ("+", "#"):
+        return False
+    for index, level in enumerate(filter_levels):
+        if level == "#":
+            return True
+        if index >= len(topic_levels):
+            return False
+        if level not in ("+", topic_levels[index]):
+            return False
+    return len(filter_levels) == len(topic_levels)
+
+
+class TopicTrie(Generic[_T]):
+    """Index of values by MQTT topic filter, supporting + and # wildcards.
+
+    Matches are returned in insertion order and cached per topic. Adding or
+    removing a topic filter only evicts the cached topics it matches.
+    """
+
+    def __init__(self, cache_size: int = MATCH_CACHE_SIZE) -> None:
+        """Initialize the trie."""
+        self._root: _TopicNode[_T] = _TopicNode()
+        self._sequence = 0
+        self._cache: dict[str, tuple[_T, ...]] = {}
+        self._cache_size = cache_size
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.values[value] = self._sequence
+        self._sequence += 1
+        self._evict(topic_filter)
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value of a topic filter, raise KeyError if not found."""
+        path: list[tuple[_TopicNode[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.values[value]
+        # Prune the nodes that no longer lead to any value
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.children or child.values:
+                break
+            del parent.children[level]
+        self._evict(topic_filter)
+
+    def __contains__(self, topic_filter: object) -> bool:
+        """Return True if values are registered for the exact topic filter."""
+        if not isinstance(topic_filter, str):
+            return False
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def match(self, topic: str) -> tuple[_T, ...]:
+        """Return the values of all topic filters matching a topic."""
+        if (matches := self._cache.get(topic)) is not None:
+            return matches
+
+        levels = topic.split("/")
+        num_levels = len(levels)
+        # Wildcards at the first level don't match topics starting with $
+        normal = not topic.startswith("$")
+        found: list[tuple[_T, int]] = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, index = stack.pop()
+            wildcards = normal or index > 0
+            if index == num_levels:
+                found.extend(node.values.items())
+            else:
+                if (child := node.children.get(levels[index])) is not None:
+                    stack.append((child, index + 1))
+                if wildcards and (child := node.children.get("+")) is not None:
+                    stack.append((child, index + 1))
+            if wildcards and (child := node.children.get("#")) is not None:
+                found.extend(child.values.items())
+
+        found.sort(key=itemgetter(1))
+        matches = tuple(value for value, _ in found)
+
+        if len(self._cache) >= self._cache_size:
+            # Evict the oldest cached topic
+            del self._cache[next(iter(self._cache))]
+        self._cache[topic] = matches
+        return matches
+
+    def _evict(self, topic_filter: str) -> None:
+        """Evict the cached matches of topics matched by a topic filter."""
+        if "+" not in topic_filter and "#" not in topic_filter:
+            self._cache.pop(topic_filter, None)
+            return
+        filter_levels = topic_filter.split("/")
+        for topic in [
+            topic for topic in self._cache if _filter_matches(filter_levels, topic)
+        ]:
+            del self._cache[topic]
@@ -14,14 +14,18 @@ import objgraph
 from pyprof2calltree import convert
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.discovery_matcher import matcher_stats_as_dict
+from homeassistant.helpers.entity_platform import DATA_ENTITY_PLATFORM
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
 
-from .const import DOMAIN
+from .const import DOMAIN, LOOP_MONITOR
+from .loop_monitor import LoopMonitor
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -48,6 +52,8 @@ CONF_SECONDS = "seconds"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
+PLATFORMS = ["sensor"]
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -56,6 +62,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     lock = asyncio.Lock()
     domain_data = hass.data[DOMAIN] = {}
 
+    monitor = domain_data[LOOP_MONITOR] = LoopMonitor(hass.loop)
+    monitor.start()
+
+    @callback
+    def _async_stop_loop_monitor(*_):
+        monitor.stop()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_loop_monitor)
+    )
+    websocket_api.async_register_command(hass, websocket_loop_stats)
+    websocket_api.async_register_command(hass, websocket_executor_stats)
+    websocket_api.async_register_command(hass, websocket_polling_stats)
+    websocket_api.async_register_command(hass, websocket_discovery_stats)
+
     async def _async_run_profile(call: ServiceCall):
         async with lock:
             await _async_generate_profile(hass, call)
@@ -191,19 +212,91 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _async_dump_scheduled,
     )
 
+    hass.config_entries.async_setup_platforms(entry, PLATFORMS)
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
-    if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
-        hass.data[DOMAIN][LOG_INTERVAL_SUB]()
-    hass.data.pop(DOMAIN)
+    domain_data = hass.data.pop(DOMAIN)
+    if LOG_INTERVAL_SUB in domain_data:
+        domain_data[LOG_INTERVAL_SUB]()
+    domain_data.pop(LOOP_MONITOR).stop()
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/loop_stats"})
+@callback
+def websocket_loop_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.connection.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Return the slow callbacks of the event loop per integration."""
+    if DOMAIN not in hass.data:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Profiler is not loaded"
+        )
+        return
+    connection.send_result(msg["id"], hass.data[DOMAIN][LOOP_MONITOR].as_dict())
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/executor_stats"})
+@callback
+def websocket_executor_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.connection.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Return the queue metrics of the executor pools."""
+    connection.send_result(msg["id"], hass.executor_pools.metrics())
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/polling_stats"})
+@callback
+def websocket_polling_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.connection.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Return the poll latencies and skips of the entity platforms."""
+    connection.send_result(
+        msg["id"],
+        [
+            {
+                "domain": platform.domain,
+                "platform": platform.platform_name,
+                "config_entry_id": platform.config_entry.entry_id
+                if platform.config_entry
+                else None,
+                **platform.polling_stats.as_dict(),
+            }
+            for platforms in hass.data.get(DATA_ENTITY_PLATFORM, {}).values()
+            for platform in platforms
+        ],
+    )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/discovery_stats"})
+@callback
+def websocket_discovery_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.connection.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Return the lookups and matches of the discovery matchers per source."""
+    connection.send_result(msg["id"], matcher_stats_as_dict(hass))
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     start_time = int(time.time() * 1000000)
     hass.components.persistent_notification.async_create(
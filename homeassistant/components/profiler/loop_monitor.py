@@ -0,0 +1,214 @@
+"""Monitor of the callbacks stalling the event loop."""
+from __future__ import annotations
+
+import asyncio
+from asyncio import events
+from bisect import bisect_left
+from dataclasses import dataclass, field
+import functools
+import os
+import sys
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Callable
+
+SLOW_CALLBACK_THRESHOLD = 0.05
+HISTOGRAM_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CORE = "homeassistant"
+UNKNOWN = "unknown"
+
+_ORIGINAL_RUN: Callable[[events.Handle], None] = events.Handle._run
+_MONITOR: LoopMonitor | None = None
+
+# Source files by path, resolved from the loaded modules
+_FILE_MODULES: dict[str, str] = {}
+
+
+@dataclass
+class CallbackHistogram:
+    """Durations of the slow callbacks attributed to an integration."""
+
+    buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(HISTOGRAM_BUCKETS) + 1)
+    )
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    slowest: str | None = None
+
+    def add(self, duration: float, description: str) -> None:
+        """Add the duration of a slow callback."""
+        self.buckets[bisect_left(HISTOGRAM_BUCKETS, duration)] += 1
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+            self.slowest = description
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dictionary."""
+        return {
+            "count": self.count,
+            "total": round(self.total, 6),
+            "max": round(self.max, 6),
+            "slowest": self.slowest,
+            "buckets": {
+                **{
+                    str(bound): count
+                    for bound, count in zip(HISTOGRAM_BUCKETS, self.buckets)
+                },
+                "+Inf": self.buckets[-1],
+            },
+        }
+
+
+class LoopMonitor:
+    """Time the callbacks run by the event loop.
+
+    Every handle run by the loop is timed, which only costs two clock reads.
+    Callbacks running longer than the threshold are attributed to the
+    integration of their module, or for task steps to the innermost
+    integration the task's coroutines were awaiting, and added to its
+    histogram.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        threshold: float = SLOW_CALLBACK_THRESHOLD,
+    ) -> None:
+        """Initialize the monitor."""
+        self.loop = loop
+        self.threshold = threshold
+        self.histograms: dict[str, CallbackHistogram] = {}
+        self.handles = 0
+        self.busy = 0.0
+        self.slow_callbacks = 0
+        self.max_duration = 0.0
+        self._started = perf_counter()
+
+    def start(self) -> None:
+        """Start timing the callbacks of the loop."""
+        global _MONITOR  # pylint: disable=global-statement
+        _MONITOR = self
+        events.Handle._run = _timed_run  # type: ignore[assignment]
+
+    def stop(self) -> None:
+        """Stop timing the callbacks."""
+        global _MONITOR  # pylint: disable=global-statement
+        if _MONITOR is not self:
+            return
+        _MONITOR = None
+        events.Handle._run = _ORIGINAL_RUN  # type: ignore[assignment]
+
+    def record(self, handle: events.Handle, duration: float) -> None:
+        """Attribute a slow callback to its integration."""
+        # pylint: disable=protected-access
+        integration, description = _describe_callback(handle._callback)
+        if (histogram := self.histograms.get(integration)) is None:
+            histogram = self.histograms[integration] = CallbackHistogram()
+        histogram.add(duration, description)
+        self.slow_callbacks += 1
+        self.max_duration = max(self.max_duration, duration)
+
+    def slowest_integrations(self, limit: int) -> list[str]:
+        """Return the integrations that stalled the loop the longest."""
+        return sorted(
+            self.histograms,
+            key=lambda integration: self.histograms[integration].total,
+            reverse=True,
+        )[:limit]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics of the loop."""
+        return {
+            "threshold": self.threshold,
+            "uptime": round(perf_counter() - self._started, 3),
+            "handles": self.handles,
+            "busy": round(self.busy, 6),
+            "slow_callbacks": self.slow_callbacks,
+            "max_duration": round(self.max_duration, 6),
+            "integrations": {
+                integration: histogram.as_dict()
+                for integration, histogram in self.histograms.items()
+            },
+        }
+
+
+def _timed_run(handle: events.Handle) -> None:
+    """Run a handle, timing it if the loop is monitored."""
+    monitor = _MONITOR
+    # pylint: disable=protected-access
+    if monitor is None or handle._loop is not monitor.loop:
+        _ORIGINAL_RUN(handle)
+        return
+    start = perf_counter()
+    _ORIGINAL_RUN(handle)
+    duration = perf_counter() - start
+    monitor.handles += 1
+    monitor.busy += duration
+    if duration >= monitor.threshold:
+        monitor.record(handle, duration)
+
+
+def _describe_callback(callback: Any) -> tuple[str, str]:
+    """Return the integration and a description of a callback."""
+    while isinstance(callback, functools.partial):
+        callback = callback.func
+
+    task = getattr(callback, "__self__", None)
+    if isinstance(task, asyncio.Task):
+        return _describe_coroutine(task.get_coro())
+
+    module = getattr(callback, "__module__", None) or UNKNOWN
+    name = getattr(callback, "__qualname__", None) or repr(callback)
+    return _integration(module), f"{module}.{name}"
+
+
+def _describe_coroutine(coro: Any) -> tuple[str, str]:
+    """Return the innermost integration a task's coroutines were awaiting.
+
+    Falls back on the outermost coroutine when no integration is awaited.
+    """
+    found: tuple[str, str] | None = None
+    outermost: tuple[str, str] | None = None
+    while coro is not None:
+        code = getattr(coro, "cr_code", None) or getattr(coro, "gi_code", None)
+        if code is None:
+            break
+        module = _module_for_file(code.co_filename)
+        described = (_integration(module), f"{module}.{coro.__qualname__}")
+        if outermost is None:
+            outermost = described
+        if module.startswith(("homeassistant.components.", "custom_components.")):
+            found = described
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    return found or outermost or (UNKNOWN, UNKNOWN)
+
+
+def _module_for_file(filename: str) -> str:
+    """Return the name of the module loaded from a source file."""
+    if (module := _FILE_MODULES.get(filename)) is not None:
+        return module
+    for name, loaded in list(sys.modules.items()):
+        if isinstance(loaded, ModuleType) and (
+            path := getattr(loaded, "__file__", None)
+        ):
+            _FILE_MODULES.setdefault(path, name)
+    if filename not in _FILE_MODULES:
+        # Not a loaded module, don't look for it again
+        _FILE_MODULES[filename] = os.path.splitext(os.path.basename(filename))[0]
+    return _FILE_MODULES[filename]
+
+
+def _integration(module: str) -> str:
+    """Return the integration of a module, or its top level package."""
+    parts = module.split(".")
+    if parts[0] == "homeassistant":
+        if len(parts) > 2 and parts[1] == "components":
+            return parts[2]
+        return CORE
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    return parts[0]
@@ -0,0 +1,56 @@
+"""Sensor of the callbacks stalling the event loop."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.components.sensor import STATE_CLASS_TOTAL_INCREASING, SensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DEFAULT_NAME, DOMAIN, LOOP_MONITOR
+from .loop_monitor import LoopMonitor
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+ATTR_MAX_DURATION = "max_duration"
+ATTR_SLOWEST_INTEGRATIONS = "slowest_integrations"
+
+SLOWEST_INTEGRATIONS = 5
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the profiler sensors."""
+    async_add_entities(
+        [LoopSlowCallbacksSensor(hass.data[DOMAIN][LOOP_MONITOR], entry.entry_id)],
+        True,
+    )
+
+
+class LoopSlowCallbacksSensor(SensorEntity):
+    """Number of callbacks that stalled the event loop."""
+
+    _attr_icon = "mdi:timer-sand"
+    _attr_state_class = STATE_CLASS_TOTAL_INCREASING
+    _attr_native_unit_of_measurement = "callbacks"
+
+    def __init__(self, monitor: LoopMonitor, entry_id: str) -> None:
+        """Initialize the sensor."""
+        self._monitor = monitor
+        self._attr_name = f"{DEFAULT_NAME} event loop slow callbacks"
+        self._attr_unique_id = f"{entry_id}_loop_slow_callbacks"
+
+    async def async_update(self) -> None:
+        """Read the counters of the loop monitor."""
+        monitor = self._monitor
+        self._attr_native_value = monitor.slow_callbacks
+        self._attr_extra_state_attributes = {
+            ATTR_MAX_DURATION: round(monitor.max_duration, 3),
+            ATTR_SLOWEST_INTEGRATIONS: monitor.slowest_integrations(
+                SLOWEST_INTEGRATIONS
+            ),
+        }
@@ -1,12 +1,12 @@
 """Support for Prometheus metrics export."""
 import logging
 import string
+import threading
 
 from aiohttp import web
 import prometheus_client
 import voluptuous as vol
 
-from homeassistant import core as hacore
 from homeassistant.components.climate.const import (
     ATTR_CURRENT_TEMPERATURE,
     ATTR_HVAC_ACTION,
@@ -35,6 +35,7 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
+from homeassistant.core import callback
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
@@ -52,12 +53,17 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+CONF_COLLECT_ON_SCRAPE = "collect_on_scrape"
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
 
 DEFAULT_NAMESPACE = "homeassistant"
 
+IGNORED_STATES = (STATE_UNAVAILABLE, STATE_UNKNOWN)
+# Domains whose metrics count events and can't be rendered from a snapshot
+COUNTER_DOMAINS = ("automation",)
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.All(
@@ -66,6 +72,7 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_PROM_NAMESPACE, default=DEFAULT_NAMESPACE): cv.string,
                 vol.Optional(CONF_DEFAULT_METRIC): cv.string,
                 vol.Optional(CONF_OVERRIDE_METRIC): cv.string,
+                vol.Optional(CONF_COLLECT_ON_SCRAPE, default=False): cv.boolean,
                 vol.Optional(CONF_COMPONENT_CONFIG, default={}): vol.Schema(
                     {cv.entity_id: COMPONENT_CONFIG_SCHEMA_ENTRY}
                 ),
@@ -84,8 +91,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass, config):
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(prometheus_client))
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -108,7 +113,15 @@ def setup(hass, config):
         default_metric,
     )
 
-    hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
+    if conf[CONF_COLLECT_ON_SCRAPE]:
+        hass.http.register_view(PrometheusView(prometheus_client, metrics))
+        # Only counts state changes, so it is cheap enough to run in the loop
+        hass.add_job(
+            hass.bus.async_listen, EVENT_STATE_CHANGED, metrics.handle_counter_event
+        )
+    else:
+        hass.http.register_view(PrometheusView(prometheus_client))
+        hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
     return True
 
 
@@ -144,7 +157,11 @@ class PrometheusMetrics:
         else:
             self.metrics_prefix = ""
         self._metrics = {}
+        self._metrics_lock = threading.Lock()
         self._climate_units = climate_units
+        # last_updated of the states rendered by the last scrape, by entity id
+        self._collected = {}
+        self._collect_lock = threading.Lock()
 
     def handle_event(self, event):
         """Listen for new messages on the bus, and add them to Prometheus."""
@@ -154,30 +171,67 @@ class PrometheusMetrics:
 
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
-        domain, _ = hacore.split_entity_id(entity_id)
 
         if not self._filter(state.entity_id):
             return
 
-        ignored_states = (STATE_UNAVAILABLE, STATE_UNKNOWN)
+        self._handle_state(state)
+        self._count_state_change(state)
 
-        handler = f"_handle_{domain}"
-
-        if hasattr(self, handler) and state.state not in ignored_states:
-            getattr(self, handler)(state)
+    @callback
+    def handle_counter_event(self, event):
+        """Count a state change, leaving the other metrics to the next scrape."""
+        state = event.data.get("new_state")
+        if state is None or not self._filter(state.entity_id):
+            return
 
-        labels = self._labels(state)
+        if state.domain == "automation" and state.state not in IGNORED_STATES:
+            self._handle_automation(state)
+        self._count_state_change(state)
+
+    def collect(self, states):
+        """Render the metrics of a snapshot of the states.
+
+        Runs in the executor at scrape time. States which were not updated
+        since the previous scrape still have their metrics set and are
+        skipped.
+        """
+        with self._collect_lock:
+            collected = {}
+            for state in states:
+                entity_id = state.entity_id
+                if not self._filter(entity_id):
+                    continue
+                collected[entity_id] = state.last_updated
+                if self._collected.get(entity_id) == state.last_updated:
+                    continue
+                self._handle_state(state, skip_domains=COUNTER_DOMAINS)
+            self._collected = collected
+
+    def _count_state_change(self, state):
         state_change = self._metric(
             "state_change", self.prometheus_cli.Counter, "The number of state changes"
         )
-        state_change.labels(**labels).inc()
+        state_change.labels(**self._labels(state)).inc()
+
+    def _handle_state(self, state, skip_domains=()):
+        domain = state.domain
+        handler = f"_handle_{domain}"
+
+        if (
+            domain not in skip_domains
+            and hasattr(self, handler)
+            and state.state not in IGNORED_STATES
+        ):
+            getattr(self, handler)(state)
 
+        labels = self._labels(state)
         entity_available = self._metric(
             "entity_available",
             self.prometheus_cli.Gauge,
             "Entity is available (not in the unavailable or unknown state)",
         )
-        entity_available.labels(**labels).set(float(state.state not in ignored_states))
+        entity_available.labels(**labels).set(float(state.state not in IGNORED_STATES))
 
         last_updated_time_seconds = self._metric(
             "last_updated_time_seconds",
@@ -208,10 +262,15 @@ class PrometheusMetrics:
         try:
             return self._metrics[metric]
         except KeyError:
-            full_metric_name = self._sanitize_metric_name(
-                f"{self.metrics_prefix}{metric}"
-            )
-            self._metrics[metric] = factory(full_metric_name, documentation, labels)
+            pass
+
+        # Metrics are created from the event loop and from scrapes in the executor
+        with self._metrics_lock:
+            if metric not in self._metrics:
+                full_metric_name = self._sanitize_metric_name(
+                    f"{self.metrics_prefix}{metric}"
+                )
+                self._metrics[metric] = factory(full_metric_name, documentation, labels)
             return self._metrics[metric]
 
     @staticmethod
@@ -503,15 +562,29 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli):
-        """Initialize Prometheus view."""
+    def __init__(self, prometheus_cli, metrics=None):
+        """Initialize Prometheus view.
+
+        With metrics, they are collected from the current states on each request.
+        """
         self.prometheus_cli = prometheus_cli
+        self.metrics = metrics
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
-        return web.Response(
-            body=self.prometheus_cli.generate_latest(),
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
-        )
+        if self.metrics is None:
+            body = self.prometheus_cli.generate_latest()
+        else:
+            hass = request.app["hass"]
+            body = await hass.async_add_executor_job(
+                self._collect_and_generate, hass.states.async_all()
+            )
+
+        return web.Response(body=body, content_type=CONTENT_TYPE_TEXT_PLAIN)
+
+    def _collect_and_generate(self, states):
+        """Collect the metrics of the states and render them."""
+        self.metrics.collect(states)
+        return self.prometheus_cli.generate_latest()
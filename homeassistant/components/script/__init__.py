@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 import logging
 from typing import Any, Dict, cast
 
@@ -27,7 +28,7 @@ from homeassistant.const import (
     STATE_ON,
 )
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import extract_domain_configs
+from homeassistant.helpers import config_hash, extract_domain_configs
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import ToggleEntity
@@ -175,8 +176,8 @@ async def async_setup(hass, config):
         await async_get_blueprints(hass).async_populate()
 
     async def reload_service(service):
-        """Call a service to reload scripts."""
-        conf = await component.async_prepare_reload()
+        """Reload the scripts that were added, removed or changed."""
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
 
@@ -229,10 +230,17 @@ async def async_setup(hass, config):
 async def _async_process_config(hass, config, component) -> bool:
     """Process script configuration.
 
+    Scripts already set up whose raw config and blueprint inputs are
+    unchanged are kept running, the others are removed.
+
     Return true, if Blueprints were used.
     """
     entities = []
     blueprints_used = False
+    existing: dict[str, ScriptEntity] = {
+        entity.object_id: entity
+        for entity in cast(Iterable[ScriptEntity], component.entities)
+    }
 
     for config_key in extract_domain_configs(config, DOMAIN):
         conf: dict[str, dict[str, Any] | BlueprintInputs] = config[config_key]
@@ -248,6 +256,9 @@ async def _async_process_config(hass, config, component) -> bool:
 
                 try:
                     raw_config = blueprint_inputs.async_substitute()
+                    script_hash = config_hash(raw_config, raw_blueprint_inputs)
+                    if _async_keep_script(existing, object_id, script_hash):
+                        continue
                     config_block = cast(
                         Dict[str, Any],
                         await async_validate_config_item(hass, raw_config),
@@ -262,13 +273,31 @@ async def _async_process_config(hass, config, component) -> bool:
                     continue
             else:
                 raw_config = cast(ScriptConfig, config_block).raw_config
+                script_hash = config_hash(raw_config, None)
+                if _async_keep_script(existing, object_id, script_hash):
+                    continue
 
             entities.append(
                 ScriptEntity(
-                    hass, object_id, config_block, raw_config, raw_blueprint_inputs
+                    hass,
+                    object_id,
+                    config_block,
+                    raw_config,
+                    raw_blueprint_inputs,
+                    script_hash,
                 )
             )
 
+    # Remove the scripts that changed first, as they are replaced by scripts
+    # with the same entity ID
+    if existing:
+        await asyncio.gather(
+            *(
+                component.async_remove_entity(entity.entity_id)
+                for entity in existing.values()
+            )
+        )
+
     await component.async_add_entities(entities)
 
     async def service_handler(service):
@@ -296,14 +325,29 @@ async def _async_process_config(hass, config, component) -> bool:
     return blueprints_used
 
 
+@callback
+def _async_keep_script(
+    existing: dict[str, ScriptEntity], object_id: str, script_hash: str
+) -> bool:
+    """Return True if the script is set up with the same config and keep it."""
+    entity = existing.get(object_id)
+    if entity is None or entity.config_hash != script_hash:
+        return False
+    del existing[object_id]
+    return True
+
+
 class ScriptEntity(ToggleEntity):
     """Representation of a script entity."""
 
     icon = None
 
-    def __init__(self, hass, object_id, cfg, raw_config, blueprint_inputs):
+    def __init__(
+        self, hass, object_id, cfg, raw_config, blueprint_inputs, config_hash=None
+    ):
         """Initialize the script."""
         self.object_id = object_id
+        self.config_hash = config_hash
         self.icon = cfg.get(CONF_ICON)
         self.description = cfg[CONF_DESCRIPTION]
         self.fields = cfg[CONF_FIELDS]
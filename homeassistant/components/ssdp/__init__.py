@@ -20,6 +20,10 @@ from homeassistant.const import (
     MATCH_ALL,
 )
 from homeassistant.core import CoreState, HomeAssistant, callback as core_callback
+from homeassistant.helpers.discovery_matcher import (
+    DiscoveryMatcherIndex,
+    get_matcher_stats,
+)
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import async_get_ssdp, bind_hass
@@ -53,6 +57,13 @@ ATTR_UPNP_UPC = "UPC"
 ATTR_UPNP_PRESENTATION_URL = "presentationURL"
 
 
+# Matchers are indexed by the first of these keys they contain
+MATCHER_INDEX_KEYS = {
+    "st": None,
+    ATTR_UPNP_MANUFACTURER: None,
+    ATTR_UPNP_DEVICE_TYPE: None,
+}
+
 DISCOVERY_MAPPING = {
     "usn": ATTR_SSDP_USN,
     "ext": ATTR_SSDP_EXT,
@@ -150,7 +161,16 @@ class Scanner:
         self.hass = hass
         self.seen: set[tuple[str, str | None]] = set()
         self.cache: dict[tuple[str, str], Mapping[str, str]] = {}
-        self._integration_matchers = integration_matchers
+        self._integration_matchers = DiscoveryMatcherIndex(
+            (
+                {"domain": domain, **matcher}
+                for domain, matchers in integration_matchers.items()
+                for matcher in matchers
+            ),
+            MATCHER_INDEX_KEYS,
+            glob=False,
+            stats=get_matcher_stats(hass, DOMAIN),
+        )
         self._cancel_scan: Callable[[], None] | None = None
         self._ssdp_listeners: list[SSDPListener] = []
         self._callbacks: list[tuple[Callable[[dict], None], dict[str, str]]] = []
@@ -268,12 +288,10 @@ class Scanner:
 
     @core_callback
     def _async_matching_domains(self, info_with_req: CaseInsensitiveDict) -> set[str]:
-        domains = set()
-        for domain, matchers in self._integration_matchers.items():
-            for matcher in matchers:
-                if all(info_with_req.get(k) == v for (k, v) in matcher.items()):
-                    domains.add(domain)
-        return domains
+        return {
+            matcher["domain"]
+            for matcher in self._integration_matchers.match(info_with_req)
+        }
 
     def _async_seen(self, header_st: str | None, header_location: str | None) -> bool:
         """Check if we have seen a specific st and optional location."""
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 import logging
+import math
 import re
 import secrets
 import threading
@@ -25,27 +26,43 @@ import time
 from types import MappingProxyType
 from typing import cast
 
+import voluptuous as vol
+
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     ATTR_ENDPOINTS,
+    ATTR_SETTINGS,
     ATTR_STREAMS,
+    CONF_LL_HLS,
+    CONF_MAX_LOOKBACK,
+    CONF_REMUX_RECORDINGS,
     DOMAIN,
     HLS_PROVIDER,
-    MAX_SEGMENTS,
     OUTPUT_IDLE_TIMEOUT,
     RECORDER_PROVIDER,
     STREAM_RESTART_INCREMENT,
     STREAM_RESTART_RESET_TIME,
 )
-from .core import PROVIDERS, IdleTimer, StreamOutput
+from .core import PROVIDERS, IdleTimer, StreamOutput, StreamSettings
 from .hls import async_setup_hls
 
 _LOGGER = logging.getLogger(__name__)
 
+STREAM_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_LL_HLS, default=False): cv.boolean,
+        vol.Optional(CONF_MAX_LOOKBACK, default=0): cv.positive_int,
+        vol.Optional(CONF_REMUX_RECORDINGS, default=True): cv.boolean,
+    }
+)
+
+CONFIG_SCHEMA = vol.Schema({DOMAIN: STREAM_SCHEMA}, extra=vol.ALLOW_EXTRA)
+
 STREAM_SOURCE_RE = re.compile("//.*:.*@")
 
 
@@ -88,9 +105,16 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     # pylint: disable=import-outside-toplevel
     from .recorder import async_setup_recorder
 
+    conf = config[DOMAIN] if DOMAIN in config else STREAM_SCHEMA({})
+
     hass.data[DOMAIN] = {}
     hass.data[DOMAIN][ATTR_ENDPOINTS] = {}
     hass.data[DOMAIN][ATTR_STREAMS] = []
+    hass.data[DOMAIN][ATTR_SETTINGS] = StreamSettings(
+        ll_hls=conf[CONF_LL_HLS],
+        max_lookback=conf[CONF_MAX_LOOKBACK],
+        remux_recordings=conf[CONF_REMUX_RECORDINGS],
+    )
 
     # Setup HLS
     hls_endpoint = async_setup_hls(hass)
@@ -283,6 +307,7 @@ class Stream:
             RecorderOutput, self.add_provider(RECORDER_PROVIDER, timeout=duration)
         )
         recorder.video_path = video_path
+        recorder.remux = self.hass.data[DOMAIN][ATTR_SETTINGS].remux_recordings
 
         self.start()
         _LOGGER.debug("Started a stream recording of %s seconds", duration)
@@ -290,7 +315,8 @@ class Stream:
         # Take advantage of lookback
         hls = self.outputs().get(HLS_PROVIDER)
         if lookback > 0 and hls:
-            num_segments = min(int(lookback // hls.target_duration), MAX_SEGMENTS)
+            # The HLS output keeps at least max_lookback seconds of segments
+            num_segments = math.ceil(lookback / hls.target_duration)
             # Wait for latest segment, then add the lookback
             await hls.recv()
             recorder.prepend(list(hls.get_segments())[-num_segments:])
@@ -2,8 +2,13 @@
 DOMAIN = "stream"
 
 ATTR_ENDPOINTS = "endpoints"
+ATTR_SETTINGS = "settings"
 ATTR_STREAMS = "streams"
 
+CONF_LL_HLS = "ll_hls"
+CONF_MAX_LOOKBACK = "max_lookback"
+CONF_REMUX_RECORDINGS = "remux_recordings"
+
 HLS_PROVIDER = "hls"
 RECORDER_PROVIDER = "recorder"
 
@@ -30,6 +35,16 @@ MIN_SEGMENT_DURATION = TARGET_SEGMENT_DURATION - SEGMENT_DURATION_ADJUSTER
 # variable keyframe intervals.
 EXT_X_START = 1.5
 
+# LL-HLS: number of part target durations a player should stay behind the
+# live edge. The spec requires at least 2, and recommends 3.
+PART_HOLD_BACK = 3
+# LL-HLS: blocking playlist requests for a Media Sequence Number more than
+# this many segments past the last one are rejected, as required by the spec.
+HLS_ADVANCE_SEGMENT_LIMIT = 2
+# LL-HLS: number of target durations to hold a blocking request before
+# answering with an error.
+HLS_BLOCKING_TIMEOUT = 3
+
 PACKETS_TO_WAIT_FOR_AUDIO = 20  # Some streams have an audio stream with no audio
 MAX_TIMESTAMP_GAP = 10000  # seconds - anything from 10 to 50000 is probably reasonable
 
@@ -22,6 +22,17 @@ if TYPE_CHECKING:
 PROVIDERS = Registry()
 
 
+@attr.s(slots=True)
+class StreamSettings:
+    """Stream settings."""
+
+    ll_hls: bool = attr.ib()
+    # Seconds of video kept in memory for the lookback of recordings
+    max_lookback: int = attr.ib(default=0)
+    # Remux recordings instead of concatenating the fragments of the segments
+    remux_recordings: bool = attr.ib(default=True)
+
+
 @attr.s(slots=True)
 class Part:
     """Represent a segment part."""
@@ -110,6 +121,7 @@ class StreamOutput:
         self._hass = hass
         self.idle_timer = idle_timer
         self._event = asyncio.Event()
+        self._part_event = asyncio.Event()
         self._segments: deque[Segment] = deque(maxlen=deque_maxlen)
 
     @property
@@ -165,10 +177,19 @@ class StreamOutput:
         await self._event.wait()
         return self.last_segment is not None
 
+    async def part_recv(self) -> bool:
+        """Wait for the next new segment or part of a segment."""
+        await self._part_event.wait()
+        return self.last_segment is not None
+
     def put(self, segment: Segment) -> None:
         """Store output."""
         self._hass.loop.call_soon_threadsafe(self._async_put, segment)
 
+    def part_put(self) -> None:
+        """Notify that a new part was added to the last segment."""
+        self._hass.loop.call_soon_threadsafe(self._async_part_put)
+
     @callback
     def _async_put(self, segment: Segment) -> None:
         """Store output from event loop."""
@@ -177,10 +198,18 @@ class StreamOutput:
         self._segments.append(segment)
         self._event.set()
         self._event.clear()
+        self._async_part_put()
+
+    @callback
+    def _async_part_put(self) -> None:
+        """Wake up anyone waiting for a part from event loop."""
+        self._part_event.set()
+        self._part_event.clear()
 
     def cleanup(self) -> None:
         """Handle cleanup."""
         self._event.set()
+        self._part_event.set()
         self.idle_timer.clear()
         self._segments = deque(maxlen=self._segments.maxlen)
 
@@ -197,7 +226,7 @@ class StreamView(HomeAssistantView):
     platform = None
 
     async def get(
-        self, request: web.Request, token: str, sequence: str = ""
+        self, request: web.Request, token: str, sequence: str = "", part_num: str = ""
     ) -> web.StreamResponse:
         """Start a GET request."""
         hass = request.app["hass"]
@@ -213,10 +242,10 @@ class StreamView(HomeAssistantView):
         # Start worker if not already started
         stream.start()
 
-        return await self.handle(request, stream, sequence)
+        return await self.handle(request, stream, sequence, part_num)
 
     async def handle(
-        self, request: web.Request, stream: Stream, sequence: str
+        self, request: web.Request, stream: Stream, sequence: str, part_num: str
     ) -> web.StreamResponse:
         """Handle the stream request."""
         raise NotImplementedError()
@@ -1,7 +1,8 @@
 """Utilities to help convert mp4s to fmp4s."""
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
+from typing import BinaryIO
 
 
 def find_box(
@@ -25,6 +26,18 @@ def find_box(
         index += int.from_bytes(box_header[0:4], byteorder="big")
 
 
+def write_fragmented_mp4(
+    file_out: BinaryIO, init: bytes, fragments: Iterable[bytes]
+) -> None:
+    """Write an init followed by moof/mdat fragments as one fmp4 file.
+
+    The fragments are written as is without remuxing, so they must all have been
+    produced against the given init.
+    """
+    file_out.write(init)
+    file_out.writelines(fragments)
+
+
 def get_codec_string(mp4_bytes: bytes) -> str:
     """Get RFC 6381 codec string."""
     codecs = []
@@ -1,20 +1,30 @@
 """Provide functionality to stream HLS."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import math
+from typing import TYPE_CHECKING, cast
 
 from aiohttp import web
+import async_timeout
 
 from homeassistant.core import HomeAssistant, callback
 
 from .const import (
+    ATTR_SETTINGS,
+    DOMAIN,
     EXT_X_START,
     FORMAT_CONTENT_TYPE,
+    HLS_ADVANCE_SEGMENT_LIMIT,
+    HLS_BLOCKING_TIMEOUT,
     HLS_PROVIDER,
     MAX_SEGMENTS,
     NUM_PLAYLIST_SEGMENTS,
+    PART_HOLD_BACK,
+    TARGET_PART_DURATION,
+    TARGET_SEGMENT_DURATION,
 )
-from .core import PROVIDERS, IdleTimer, StreamOutput, StreamView
+from .core import PROVIDERS, IdleTimer, Part, StreamOutput, StreamSettings, StreamView
 from .fmp4utils import get_codec_string
 
 if TYPE_CHECKING:
@@ -26,6 +36,7 @@ def async_setup_hls(hass: HomeAssistant) -> str:
     """Set up api endpoints."""
     hass.http.register_view(HlsPlaylistView())
     hass.http.register_view(HlsSegmentView())
+    hass.http.register_view(HlsPartView())
     hass.http.register_view(HlsInitView())
     hass.http.register_view(HlsMasterPlaylistView())
     return "/api/hls/{}/master_playlist.m3u8"
@@ -61,7 +72,7 @@ class HlsMasterPlaylistView(StreamView):
         return "\n".join(lines) + "\n"
 
     async def handle(
-        self, request: web.Request, stream: Stream, sequence: str
+        self, request: web.Request, stream: Stream, sequence: str, part_num: str
     ) -> web.Response:
         """Return m3u8 playlist."""
         track = stream.add_provider(HLS_PROVIDER)
@@ -83,7 +94,7 @@ class HlsPlaylistView(StreamView):
     cors_allowed = True
 
     @staticmethod
-    def render(track: StreamOutput) -> str:
+    def render(track: HlsStreamOutput, ll_hls: bool) -> str:
         """Render playlist."""
         # NUM_PLAYLIST_SEGMENTS+1 because most recent is probably not yet complete
         segments = list(track.get_segments())[-(NUM_PLAYLIST_SEGMENTS + 1) :]
@@ -115,37 +126,92 @@ class HlsPlaylistView(StreamView):
             # doesn't seem to hurt, so we can stick with it for now.
             f"#EXT-X-START:TIME-OFFSET=-{EXT_X_START * track.target_duration:.3f}",
         ]
+        if ll_hls:
+            part_target = track.part_target_duration
+            playlist.extend(
+                [
+                    f"#EXT-X-PART-INF:PART-TARGET={part_target:.3f}",
+                    "#EXT-X-SERVER-CONTROL:CAN-BLOCK-RELOAD=YES,"
+                    f"PART-HOLD-BACK={PART_HOLD_BACK * part_target:.3f}",
+                ]
+            )
 
         last_stream_id = first_segment.stream_id
         # Add playlist sections
-        for segment in segments:
-            # Skip last segment if it is not complete
-            if segment.complete:
-                if last_stream_id != segment.stream_id:
-                    playlist.extend(
-                        [
-                            "#EXT-X-DISCONTINUITY",
-                            "#EXT-X-PROGRAM-DATE-TIME:"
-                            + segment.start_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3]
-                            + "Z",
-                        ]
-                    )
+        for index, segment in enumerate(segments):
+            # Read complete before the parts, the worker sets it after the last part
+            complete = segment.complete
+            # Parts are only listed for the last two segments, which keeps them
+            # well within the three target durations allowed by the spec
+            parts = list(segment.parts) if ll_hls and index >= len(segments) - 2 else []
+            # Skip last segment if it is not complete and has no parts to show
+            if not complete and not parts:
+                continue
+            if last_stream_id != segment.stream_id:
+                playlist.extend(
+                    [
+                        "#EXT-X-DISCONTINUITY",
+                        "#EXT-X-PROGRAM-DATE-TIME:"
+                        + segment.start_time.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3]
+                        + "Z",
+                    ]
+                )
+            for part_num, part in enumerate(parts):
+                playlist.append(
+                    f"#EXT-X-PART:DURATION={part.duration:.3f},"
+                    f'URI="./segment/{segment.sequence}.{part_num}.m4s"'
+                    + (",INDEPENDENT=YES" if part.has_keyframe else "")
+                )
+            if complete:
                 playlist.extend(
                     [
                         f"#EXTINF:{segment.duration:.3f},",
                         f"./segment/{segment.sequence}.m4s",
                     ]
                 )
-                last_stream_id = segment.stream_id
+            last_stream_id = segment.stream_id
+
+        if ll_hls:
+            hint_sequence, hint_part_num = track.next_part
+            playlist.append(
+                "#EXT-X-PRELOAD-HINT:TYPE=PART,"
+                f'URI="./segment/{hint_sequence}.{hint_part_num}.m4s"'
+            )
 
         return "\n".join(playlist) + "\n"
 
     async def handle(
-        self, request: web.Request, stream: Stream, sequence: str
+        self, request: web.Request, stream: Stream, sequence: str, part_num: str
     ) -> web.Response:
         """Return m3u8 playlist."""
-        track = stream.add_provider(HLS_PROVIDER)
+        track = cast(HlsStreamOutput, stream.add_provider(HLS_PROVIDER))
         stream.start()
+        ll_hls = stream.hass.data[DOMAIN][ATTR_SETTINGS].ll_hls
+        if ll_hls and "_HLS_msn" in request.query:
+            # Blocking playlist reload: hold the request until the playlist
+            # contains the requested segment or part
+            try:
+                msn = int(request.query["_HLS_msn"])
+                hls_part = (
+                    int(request.query["_HLS_part"])
+                    if "_HLS_part" in request.query
+                    else None
+                )
+            except ValueError:
+                return web.HTTPBadRequest()
+            if msn > track.last_sequence + HLS_ADVANCE_SEGMENT_LIMIT:
+                return web.HTTPBadRequest()
+            try:
+                async with async_timeout.timeout(
+                    HLS_BLOCKING_TIMEOUT * track.target_duration
+                ):
+                    while not track.has_part(msn, hls_part):
+                        if not await track.part_recv():
+                            return web.HTTPNotFound()
+            except asyncio.TimeoutError:
+                return web.HTTPServiceUnavailable()
+        elif ll_hls and "_HLS_part" in request.query:
+            return web.HTTPBadRequest()
         # Make sure at least two segments are ready (last one may not be complete)
         if not track.sequences and not await track.recv():
             return web.HTTPNotFound()
@@ -153,7 +219,7 @@ class HlsPlaylistView(StreamView):
             return web.HTTPNotFound()
         headers = {"Content-Type": FORMAT_CONTENT_TYPE[HLS_PROVIDER]}
         response = web.Response(
-            body=self.render(track).encode("utf-8"), headers=headers
+            body=self.render(track, ll_hls).encode("utf-8"), headers=headers
         )
         response.enable_compression(web.ContentCoding.gzip)
         return response
@@ -167,7 +233,7 @@ class HlsInitView(StreamView):
     cors_allowed = True
 
     async def handle(
-        self, request: web.Request, stream: Stream, sequence: str
+        self, request: web.Request, stream: Stream, sequence: str, part_num: str
     ) -> web.Response:
         """Return init.mp4."""
         track = stream.add_provider(HLS_PROVIDER)
@@ -186,7 +252,7 @@ class HlsSegmentView(StreamView):
     cors_allowed = True
 
     async def handle(
-        self, request: web.Request, stream: Stream, sequence: str
+        self, request: web.Request, stream: Stream, sequence: str, part_num: str
     ) -> web.Response:
         """Return fmp4 segment."""
         track = stream.add_provider(HLS_PROVIDER)
@@ -200,15 +266,104 @@ class HlsSegmentView(StreamView):
         )
 
 
+class HlsPartView(StreamView):
+    """Stream view to serve a LL-HLS fmp4 part of a segment."""
+
+    url = r"/api/hls/{token:[a-f0-9]+}/segment/{sequence:\d+}.{part_num:\d+}.m4s"
+    name = "api:stream:hls:part"
+    cors_allowed = True
+
+    async def handle(
+        self, request: web.Request, stream: Stream, sequence: str, part_num: str
+    ) -> web.Response:
+        """Return fmp4 part."""
+        track = cast(HlsStreamOutput, stream.add_provider(HLS_PROVIDER))
+        track.idle_timer.awake()
+        sequence_num, part_index = int(sequence), int(part_num)
+        try:
+            async with async_timeout.timeout(
+                HLS_BLOCKING_TIMEOUT * track.target_duration
+            ):
+                # The part advertised by the preload hint is requested before
+                # it exists, so hold the request until it is ready
+                while (part := track.get_part(sequence_num, part_index)) is None:
+                    if track.next_part != (sequence_num, part_index):
+                        return web.HTTPNotFound()
+                    if not await track.part_recv():
+                        return web.HTTPNotFound()
+        except asyncio.TimeoutError:
+            return web.HTTPNotFound()
+        headers = {"Content-Type": "video/iso.segment"}
+        return web.Response(body=part.data, headers=headers)
+
+
 @PROVIDERS.register(HLS_PROVIDER)
 class HlsStreamOutput(StreamOutput):
     """Represents HLS Output formats."""
 
     def __init__(self, hass: HomeAssistant, idle_timer: IdleTimer) -> None:
-        """Initialize recorder output."""
-        super().__init__(hass, idle_timer, deque_maxlen=MAX_SEGMENTS)
+        """Initialize HLS output."""
+        # The segments double as the ring buffer for the lookback of recordings.
+        # One more segment is kept since the last one is usually not complete.
+        settings: StreamSettings | None = hass.data.get(DOMAIN, {}).get(ATTR_SETTINGS)
+        max_lookback = settings.max_lookback if settings else 0
+        super().__init__(
+            hass,
+            idle_timer,
+            deque_maxlen=max(
+                MAX_SEGMENTS, math.ceil(max_lookback / TARGET_SEGMENT_DURATION) + 1
+            ),
+        )
 
     @property
     def name(self) -> str:
         """Return provider name."""
         return HLS_PROVIDER
+
+    @property
+    def part_target_duration(self) -> float:
+        """Return the max duration of any given part in seconds."""
+        return max(
+            [
+                TARGET_PART_DURATION,
+                *(
+                    part.duration
+                    for segment in self._segments
+                    if segment.complete
+                    for part in segment.parts
+                ),
+            ]
+        )
+
+    @property
+    def next_part(self) -> tuple[int, int]:
+        """Return the sequence and part number of the next part to be produced."""
+        if not (segment := self.last_segment):
+            return (0, 0)
+        if segment.complete:
+            return (segment.sequence + 1, 0)
+        return (segment.sequence, len(segment.parts))
+
+    def get_part(self, sequence: int, part_num: int) -> Part | None:
+        """Retrieve a specific part of a segment."""
+        if not (segment := self.get_segment(sequence)) or part_num >= len(
+            segment.parts
+        ):
+            return None
+        return segment.parts[part_num]
+
+    def has_part(self, sequence: int, part_num: int | None) -> bool:
+        """Return True once a playlist would contain the segment or part.
+
+        Without a part number, the segment itself has to be complete.
+        """
+        if not (segment := self.get_segment(sequence)):
+            # Segments before the last one have already been completed
+            return sequence < self.last_sequence
+        if part_num is not None and part_num < len(segment.parts):
+            return True
+        finished = segment.complete or sequence < self.last_sequence
+        if part_num is None or not finished:
+            return finished
+        # A part past the end of a finished segment is the first part of the next one
+        return self.has_part(sequence + 1, 0)
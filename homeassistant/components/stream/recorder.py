@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections import deque
+from collections.abc import Iterable
 from io import BytesIO
 import logging
 import os
@@ -18,6 +19,7 @@ from .const import (
     SEGMENT_CONTAINER_FORMAT,
 )
 from .core import PROVIDERS, IdleTimer, Segment, StreamOutput
+from .fmp4utils import write_fragmented_mp4
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,7 +29,23 @@ def async_setup_recorder(hass: HomeAssistant) -> None:
     """Only here so Provider Registry works."""
 
 
-def recorder_save_worker(file_out: str, segments: deque[Segment]) -> None:
+def _unique_segments(segments: Iterable[Segment]) -> list[Segment]:
+    """Return the segments without duplicate or out of order sequences."""
+    unique_segments = []
+    last_sequence = float("-inf")
+    for segment in segments:
+        # Because the stream_worker is in a different thread from the record service,
+        # the lookback segments may still have some overlap with the recorder segments
+        if segment.sequence <= last_sequence:
+            continue
+        last_sequence = segment.sequence
+        unique_segments.append(segment)
+    return unique_segments
+
+
+def recorder_save_worker(
+    file_out: str, segments: deque[Segment], remux: bool = True
+) -> None:
     """Handle saving stream."""
 
     if not segments:
@@ -37,6 +55,24 @@ def recorder_save_worker(file_out: str, segments: deque[Segment]) -> None:
     if not os.path.exists(os.path.dirname(file_out)):
         os.makedirs(os.path.dirname(file_out), exist_ok=True)
 
+    unique_segments = _unique_segments(segments)
+
+    # Segments between discontinuities share an init and continuous timestamps,
+    # just like in an HLS playlist, so their fragments can be written as is
+    first_segment = unique_segments[0]
+    if not remux and all(
+        segment.init == first_segment.init
+        and segment.stream_id == first_segment.stream_id
+        for segment in unique_segments
+    ):
+        with open(file_out, "wb") as file:
+            write_fragmented_mp4(
+                file,
+                first_segment.init,
+                (part.data for segment in unique_segments for part in segment.parts),
+            )
+        return
+
     pts_adjuster: dict[str, int | None] = {"video": None, "audio": None}
     output: OutputContainer | None = None
     output_v = None
@@ -47,14 +83,7 @@ def recorder_save_worker(file_out: str, segments: deque[Segment]) -> None:
     # units which seem to be defined inversely to how stream time_bases are defined
     running_duration = 0
 
-    last_sequence = float("-inf")
-    for segment in segments:
-        # Because the stream_worker is in a different thread from the record service,
-        # the lookback segments may still have some overlap with the recorder segments
-        if segment.sequence <= last_sequence:
-            continue
-        last_sequence = segment.sequence
-
+    for segment in unique_segments:
         # Open segment
         source = av.open(
             BytesIO(segment.init + segment.get_bytes_without_init()),
@@ -122,6 +151,7 @@ class RecorderOutput(StreamOutput):
         """Initialize recorder output."""
         super().__init__(hass, idle_timer)
         self.video_path: str
+        self.remux = True
 
     @property
     def name(self) -> str:
@@ -138,7 +168,7 @@ class RecorderOutput(StreamOutput):
         thread = threading.Thread(
             name="recorder_save_worker",
             target=recorder_save_worker,
-            args=(self.video_path, self._segments),
+            args=(self.video_path, self._segments, self.remux),
         )
         thread.start()
 
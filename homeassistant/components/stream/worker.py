@@ -186,6 +186,9 @@ class SegmentBuffer:
             self._memory_file_pos = self._memory_file.tell()
             self._part_start_dts = packet.dts
         self._part_has_keyframe = False
+        # Wake up any blocking LL-HLS requests waiting on the new part
+        for stream_output in self._outputs_callback().values():
+            stream_output.part_put()
 
     def discontinuity(self) -> None:
         """Mark the stream as having been restarted."""
@@ -4,12 +4,13 @@ from __future__ import annotations
 from collections import deque
 import datetime as dt
 from itertools import count
-from typing import Any
+from typing import Any, Callable
 
 import voluptuous as vol
 
 from homeassistant.core import Context
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.json import json_dumps, json_loads
 from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_get,
@@ -20,11 +21,31 @@ from homeassistant.helpers.trace import (
 import homeassistant.util.dt as dt_util
 
 from . import websocket_api
-from .const import CONF_STORED_TRACES, DATA_TRACE, DEFAULT_STORED_TRACES
-from .utils import LimitedSizeDict
+from .const import (
+    CONF_MEMORY_BUDGET,
+    CONF_STORED_TRACES,
+    DATA_TRACE,
+    DATA_TRACE_BUDGET,
+    DEFAULT_MEMORY_BUDGET,
+    DEFAULT_STORED_TRACES,
+)
+from .utils import LimitedSizeDict, TraceMemoryBudget
 
 DOMAIN = "trace"
 
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN, default={}): vol.Schema(
+            {
+                vol.Optional(
+                    CONF_MEMORY_BUDGET, default=DEFAULT_MEMORY_BUDGET
+                ): cv.positive_int
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 TRACE_CONFIG_SCHEMA = {
     vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
 }
@@ -32,7 +53,11 @@ TRACE_CONFIG_SCHEMA = {
 
 async def async_setup(hass, config):
     """Initialize the trace integration."""
-    hass.data[DATA_TRACE] = {}
+    conf = config.get(DOMAIN) or {}
+    hass.data[DATA_TRACE] = traces = {}
+    hass.data[DATA_TRACE_BUDGET] = TraceMemoryBudget(
+        hass, traces, conf.get(CONF_MEMORY_BUDGET, DEFAULT_MEMORY_BUDGET)
+    )
     websocket_api.async_setup(hass)
     return True
 
@@ -42,11 +67,16 @@ def async_store_trace(hass, trace, stored_traces):
     key = trace.key
     if key[1]:
         traces = hass.data[DATA_TRACE]
+        budget = hass.data[DATA_TRACE_BUDGET]
         if key not in traces:
-            traces[key] = LimitedSizeDict(size_limit=stored_traces)
+            traces[key] = LimitedSizeDict(
+                size_limit=stored_traces,
+                on_evict=lambda run_id, _: budget.remove(key, run_id),
+            )
         else:
             traces[key].size_limit = stored_traces
         traces[key][trace.run_id] = trace
+        trace.finished_callback = budget.async_add
 
 
 class ActionTrace:
@@ -63,6 +93,9 @@ class ActionTrace:
     ) -> None:
         """Container for script trace."""
         self._trace: dict[str, deque[TraceElement]] | None = None
+        self._trace_json: str | None = None
+        self._last_step: str | None = None
+        self.finished_callback: Callable[[ActionTrace], None] | None = None
         self._config: dict[str, Any] = config
         self._blueprint_inputs: dict[str, Any] = blueprint_inputs
         self.context: Context = context
@@ -90,16 +123,44 @@ class ActionTrace:
         self._timestamp_finish = dt_util.utcnow()
         self._state = "stopped"
         self._script_execution = script_execution_get()
+        if self.finished_callback is not None:
+            self.finished_callback(self)
+
+    def serialize_trace(self) -> tuple[str | None, int]:
+        """Serialize the steps of a finished trace.
+
+        Return the JSON of the steps, None if there are none, and their
+        serialized size. This method is run in the executor.
+        """
+        if not self._trace:
+            return None, 0
+        trace_json = json_dumps(self._trace_as_dict(), extended=True)
+        return trace_json, len(trace_json)
+
+    def set_trace_json(self, trace_json: str) -> None:
+        """Replace the steps by their JSON, releasing the variables they reference."""
+        if self._trace:
+            self._last_step = list(self._trace)[-1]
+        self._trace_json = trace_json
+        self._trace = None
 
-    def as_dict(self) -> dict[str, Any]:
-        """Return dictionary version of this ActionTrace."""
-
-        result = self.as_short_dict()
+    def _trace_as_dict(self) -> dict[str, list[dict[str, Any]]]:
+        """Return dictionary version of the steps."""
+        if self._trace_json is not None:
+            return json_loads(self._trace_json)  # type: ignore[no-any-return]
 
         traces = {}
         if self._trace:
             for key, trace_list in self._trace.items():
                 traces[key] = [item.as_dict() for item in trace_list]
+        return traces
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return dictionary version of this ActionTrace."""
+
+        result = self.as_short_dict()
+
+        traces = self._trace_as_dict()
 
         result.update(
             {
@@ -116,7 +177,7 @@ class ActionTrace:
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this ActionTrace."""
 
-        last_step = None
+        last_step = self._last_step
 
         if self._trace:
             last_step = list(self._trace)[-1]
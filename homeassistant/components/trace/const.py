@@ -1,5 +1,8 @@
 """Shared constants for script and automation tracing and debugging."""
 
+CONF_MEMORY_BUDGET = "memory_budget"
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE = "trace"
+DATA_TRACE_BUDGET = "trace_budget"
+DEFAULT_MEMORY_BUDGET = 32 * 1024 * 1024  # Bytes of all stored traces
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
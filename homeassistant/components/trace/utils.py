@@ -1,6 +1,8 @@
 """Helpers for script and automation tracing and debugging."""
 from collections import OrderedDict
 
+from homeassistant.core import callback
+
 
 class LimitedSizeDict(OrderedDict):
     """OrderedDict limited in size."""
@@ -8,6 +10,7 @@ class LimitedSizeDict(OrderedDict):
     def __init__(self, *args, **kwds):
         """Initialize OrderedDict limited in size."""
         self.size_limit = kwds.pop("size_limit", None)
+        self.on_evict = kwds.pop("on_evict", None)
         OrderedDict.__init__(self, *args, **kwds)
         self._check_size_limit()
 
@@ -20,4 +23,66 @@ class LimitedSizeDict(OrderedDict):
         """Check dict size and evict items in FIFO order if needed."""
         if self.size_limit is not None:
             while len(self) > self.size_limit:
-                self.popitem(last=False)
+                key, value = self.popitem(last=False)
+                if self.on_evict is not None:
+                    self.on_evict(key, value)
+
+
+class TraceMemoryBudget:
+    """Byte budget of the stored traces of all scripts and automations.
+
+    Finished traces are serialized in the executor and accounted by the size
+    of their serialized steps, traces that can't be serialized too. When the
+    budget is exceeded the least recently used traces are evicted, the most
+    recent trace is always kept.
+    """
+
+    def __init__(self, hass, traces, max_bytes):
+        """Initialize the budget of the traces stored by key and run id."""
+        self.hass = hass
+        self._traces = traces
+        self.max_bytes = max_bytes
+        self.usage = 0
+        self._sizes = OrderedDict()
+
+    def __len__(self):
+        """Return the number of accounted traces."""
+        return len(self._sizes)
+
+    def _is_stored(self, trace):
+        """Return True if the trace is stored."""
+        stored = self._traces.get(trace.key)
+        return stored is not None and stored.get(trace.run_id) is trace
+
+    @callback
+    def async_add(self, trace):
+        """Serialize a finished trace and account it."""
+        if self._is_stored(trace):
+            self.hass.async_create_task(self._async_add(trace))
+
+    async def _async_add(self, trace):
+        """Account a finished trace once serialized and evict traces if needed."""
+        trace_json, size = await self.hass.async_add_executor_job(trace.serialize_trace)
+        if not self._is_stored(trace):
+            return
+        if trace_json is not None:
+            trace.set_trace_json(trace_json)
+        run = (trace.key, trace.run_id)
+        self.usage += size - self._sizes.pop(run, 0)
+        self._sizes[run] = size
+        while self.usage > self.max_bytes and len(self._sizes) > 1:
+            (key, run_id), size = self._sizes.popitem(last=False)
+            self.usage -= size
+            if (stored := self._traces.get(key)) is not None:
+                stored.pop(run_id, None)
+                if not stored:
+                    del self._traces[key]
+
+    def touch(self, key, run_id):
+        """Mark a trace as recently used."""
+        if (key, run_id) in self._sizes:
+            self._sizes.move_to_end((key, run_id))
+
+    def remove(self, key, run_id):
+        """Stop accounting a trace that was removed."""
+        self.usage -= self._sizes.pop((key, run_id), 0)
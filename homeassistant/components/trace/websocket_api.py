@@ -24,7 +24,7 @@ from homeassistant.helpers.script import (
     debug_stop,
 )
 
-from .const import DATA_TRACE
+from .const import DATA_TRACE, DATA_TRACE_BUDGET
 
 # mypy: allow-untyped-calls, allow-untyped-defs
 
@@ -37,6 +37,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, websocket_trace_get)
     websocket_api.async_register_command(hass, websocket_trace_list)
     websocket_api.async_register_command(hass, websocket_trace_contexts)
+    websocket_api.async_register_command(hass, websocket_trace_memory)
     websocket_api.async_register_command(hass, websocket_breakpoint_clear)
     websocket_api.async_register_command(hass, websocket_breakpoint_list)
     websocket_api.async_register_command(hass, websocket_breakpoint_set)
@@ -69,6 +70,7 @@ def websocket_trace_get(hass, connection, msg):
         )
         return
 
+    hass.data[DATA_TRACE_BUDGET].touch(key, run_id)
     message = websocket_api.messages.result_message(msg["id"], trace)
 
     connection.send_message(
@@ -76,6 +78,18 @@ def websocket_trace_get(hass, connection, msg):
     )
 
 
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "trace/memory"})
+def websocket_trace_memory(hass, connection, msg):
+    """Return the memory used by the stored traces."""
+    budget = hass.data[DATA_TRACE_BUDGET]
+    connection.send_result(
+        msg["id"],
+        {"usage": budget.usage, "budget": budget.max_bytes, "traces": len(budget)},
+    )
+
+
 def get_debug_traces(hass, key):
     """Return a serializable list of debug traces for a script or automation."""
     traces = []
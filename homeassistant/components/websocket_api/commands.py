@@ -52,6 +52,7 @@ def async_register_commands(
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_states_memory_usage)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
@@ -241,6 +242,18 @@ def handle_get_states(
     connection.send_message(messages.result_message(msg["id"], states))
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "states/memory_usage"})
+@decorators.require_admin
+def handle_states_memory_usage(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle states memory usage command."""
+    connection.send_message(
+        messages.result_message(msg["id"], hass.states.async_memory_usage())
+    )
+
+
 @decorators.websocket_command({vol.Required("type"): "get_services"})
 @decorators.async_response
 async def handle_get_services(
@@ -497,7 +510,7 @@ async def handle_test_condition(
     # pylint: disable=import-outside-toplevel
     from homeassistant.helpers import condition
 
-    check_condition = await condition.async_from_config(hass, msg["condition"])
+    check_condition = await condition.async_compiled_from_config(hass, msg["condition"])
     connection.send_result(
         msg["id"], {"result": check_condition(hass, msg.get("variables"))}
     )
@@ -27,6 +27,10 @@ from homeassistant.const import (
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.discovery_matcher import (
+    DiscoveryMatcherIndex,
+    get_matcher_stats,
+)
 from homeassistant.helpers.network import NoURLAvailableError, get_url
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import async_get_homekit, async_get_zeroconf, bind_hass
@@ -53,6 +57,9 @@ DEFAULT_IPV6 = True
 HOMEKIT_PAIRED_STATUS_FLAG = "sf"
 HOMEKIT_MODEL = "md"
 
+# Matchers are indexed by the OUI of their MAC address
+MAC_OUI_LENGTH = 6
+
 MDNS_TARGET_IP = "224.0.0.251"
 
 # Property key=value has a max length of 255
@@ -317,6 +324,13 @@ class ZeroconfDiscovery:
         self.zeroconf_types = zeroconf_types
         self.homekit_models = homekit_models
         self.ipv6 = ipv6
+        matcher_stats = get_matcher_stats(hass, DOMAIN)
+        self._matcher_indexes = {
+            service_type: DiscoveryMatcherIndex(
+                matchers, {"macaddress": MAC_OUI_LENGTH}, stats=matcher_stats
+            )
+            for service_type, matchers in zeroconf_types.items()
+        }
 
         self.flow_dispatcher: FlowDispatcher | None = None
         self.async_service_browser: HaAsyncServiceBrowser | None = None
@@ -424,26 +438,16 @@ class ZeroconfDiscovery:
 
         # Not all homekit types are currently used for discovery
         # so not all service type exist in zeroconf_types
-        for matcher in self.zeroconf_types.get(service_type, []):
-            if len(matcher) > 1:
-                if "macaddress" in matcher and (
-                    uppercase_mac is None
-                    or not fnmatch.fnmatch(uppercase_mac, matcher["macaddress"])
-                ):
-                    continue
-                if "name" in matcher and (
-                    lowercase_name is None
-                    or not fnmatch.fnmatch(lowercase_name, matcher["name"])
-                ):
-                    continue
-                if "manufacturer" in matcher and (
-                    lowercase_manufacturer is None
-                    or not fnmatch.fnmatch(
-                        lowercase_manufacturer, matcher["manufacturer"]
-                    )
-                ):
-                    continue
+        if (matcher_index := self._matcher_indexes.get(service_type)) is None:
+            return
 
+        for matcher in matcher_index.match(
+            {
+                "macaddress": uppercase_mac,
+                "name": lowercase_name,
+                "manufacturer": lowercase_manufacturer,
+            }
+        ):
             flow: ZeroconfFlow = {
                 "domain": matcher["domain"],
                 "context": {"source": config_entries.SOURCE_ZEROCONF},
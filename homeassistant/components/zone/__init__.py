@@ -18,6 +18,7 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_RADIUS,
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_UNAVAILABLE,
 )
@@ -35,12 +36,15 @@ from homeassistant.loader import bind_hass
 from homeassistant.util.location import distance
 
 from .const import ATTR_PASSIVE, ATTR_RADIUS, CONF_PASSIVE, DOMAIN, HOME_ZONE
+from .spatial_index import ZoneIndex
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_PASSIVE = False
 DEFAULT_RADIUS = 100
 
+DATA_ZONE_INDEX = f"{DOMAIN}.index"
+
 ENTITY_ID_FORMAT = "zone.{}"
 ENTITY_ID_HOME = ENTITY_ID_FORMAT.format(HOME_ZONE)
 
@@ -98,15 +102,25 @@ def async_active_zone(
 
     This method must be run in the event loop.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (
-        cast(State, hass.states.get(entity_id))
-        for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
-    )
+    if latitude is None or longitude is None:
+        return None
+
+    # The zones are looked up in the index of the zone integration, all zone
+    # states are checked when it isn't set up
+    zones: list[State]
+    if (zone_index := hass.data.get(DATA_ZONE_INDEX)) is not None:
+        zones = zone_index.async_candidates(latitude, longitude, radius)
+    else:
+        zones = [
+            cast(State, hass.states.get(entity_id))
+            for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
+        ]
 
     min_dist = None
     closest = None
 
+    # Zones are sorted by entity ID so that we are deterministic
+    # if equal distance to 2 zones
     for zone in zones:
         if zone.state == STATE_UNAVAILABLE or zone.attributes.get(ATTR_PASSIVE):
             continue
@@ -179,6 +193,7 @@ class ZoneStorageCollection(collection.StorageCollection):
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up configured zones as well as Home Assistant zone if necessary."""
+    _async_setup_zone_index(hass)
     component = entity_component.EntityComponent(_LOGGER, DOMAIN, hass)
     id_manager = collection.IDManager()
 
@@ -240,6 +255,38 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+@callback
+def _async_setup_zone_index(hass: HomeAssistant) -> None:
+    """Index the zone states, whichever entity or API wrote them."""
+    zone_index = hass.data[DATA_ZONE_INDEX] = ZoneIndex()
+    for entity_id in hass.states.async_entity_ids(DOMAIN):
+        zone_index.async_update(cast(State, hass.states.get(entity_id)))
+
+    @callback
+    def _async_zone_state_filter(event: Event) -> bool:
+        """Update the index while the state change is fired.
+
+        The index is updated before any lookup can run, so no listener job
+        is scheduled.
+        """
+        if not event.data["entity_id"].startswith(f"{DOMAIN}."):
+            return False
+        if (new_state := event.data["new_state"]) is None:
+            zone_index.async_remove(event.data["entity_id"])
+        else:
+            zone_index.async_update(new_state)
+        return False
+
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED, _async_zone_state_listener, _async_zone_state_filter
+    )
+
+
+@callback
+def _async_zone_state_listener(event: Event) -> None:
+    """Never called, the zone index is updated by the event filter."""
+
+
 @callback
 def _home_conf(hass: HomeAssistant) -> dict:
     """Return the home zone config."""
@@ -0,0 +1,120 @@
+"""Grid index of zones by the area they cover."""
+from __future__ import annotations
+
+import math
+from numbers import Real
+from typing import Tuple
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import State, callback
+
+from .const import ATTR_RADIUS
+
+# Size of the grid cells in degrees, about 11 km of latitude
+CELL_SIZE = 0.1
+GRID_COLUMNS = round(360 / CELL_SIZE)
+# Lower bound of the length of a degree of latitude in meters, so the cells
+# covering an area are never too few
+METERS_PER_DEGREE = 110_000
+# Areas spanning more cells or reaching the poles are checked on every lookup
+MAX_AREA_CELLS = 400
+MAX_INDEXED_LATITUDE = 80
+
+Cell = Tuple[int, int]
+
+
+def area_cells(latitude: float, longitude: float, radius: float) -> list[Cell] | None:
+    """Return the grid cells covering a circle, None if it covers too many."""
+    lat_delta = radius / METERS_PER_DEGREE
+    lat_far = abs(latitude) + lat_delta
+    if lat_far >= MAX_INDEXED_LATITUDE:
+        return None
+    lon_delta = lat_delta / math.cos(math.radians(lat_far))
+
+    min_row = math.floor((latitude - lat_delta) / CELL_SIZE)
+    max_row = math.floor((latitude + lat_delta) / CELL_SIZE)
+    min_col = math.floor((longitude - lon_delta) / CELL_SIZE)
+    max_col = math.floor((longitude + lon_delta) / CELL_SIZE)
+    if (max_row - min_row + 1) * (max_col - min_col + 1) > MAX_AREA_CELLS:
+        return None
+
+    return [
+        # Columns wrap around the antimeridian
+        (row, col % GRID_COLUMNS)
+        for row in range(min_row, max_row + 1)
+        for col in range(min_col, max_col + 1)
+    ]
+
+
+def _zone_cells(state: State) -> list[Cell] | None:
+    """Return the grid cells covered by a zone, None if it can't be indexed."""
+    latitude = state.attributes.get(ATTR_LATITUDE)
+    longitude = state.attributes.get(ATTR_LONGITUDE)
+    radius = state.attributes.get(ATTR_RADIUS)
+    if not (
+        isinstance(latitude, Real)
+        and isinstance(longitude, Real)
+        and isinstance(radius, Real)
+        and radius >= 0
+    ):
+        return None
+    return area_cells(latitude, longitude, radius)
+
+
+class ZoneIndex:
+    """Index of zone states by the grid cells covered by their area.
+
+    Zones that can't be indexed, because their area is too large or their
+    attributes are invalid, are candidates for every lookup.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._states: dict[str, State] = {}
+        self._cells: dict[Cell, set[str]] = {}
+        self._zone_cells: dict[str, list[Cell]] = {}
+        self._unindexed: set[str] = set()
+
+    def __len__(self) -> int:
+        """Return the number of zones."""
+        return len(self._states)
+
+    @callback
+    def async_update(self, state: State) -> None:
+        """Add a zone or update its area."""
+        entity_id = state.entity_id
+        self.async_remove(entity_id)
+        self._states[entity_id] = state
+
+        if (cells := _zone_cells(state)) is None:
+            self._unindexed.add(entity_id)
+            return
+        self._zone_cells[entity_id] = cells
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(entity_id)
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Remove a zone."""
+        if self._states.pop(entity_id, None) is None:
+            return
+        self._unindexed.discard(entity_id)
+        for cell in self._zone_cells.pop(entity_id, ()):
+            entity_ids = self._cells[cell]
+            entity_ids.discard(entity_id)
+            if not entity_ids:
+                del self._cells[cell]
+
+    @callback
+    def async_candidates(
+        self, latitude: float, longitude: float, radius: float = 0
+    ) -> list[State]:
+        """Return the zones that may contain a location, sorted by entity id."""
+        if (cells := area_cells(latitude, longitude, max(radius, 0))) is None:
+            entity_ids: set[str] = set(self._states)
+        else:
+            entity_ids = set(self._unindexed)
+            for cell in cells:
+                if cell_entity_ids := self._cells.get(cell):
+                    entity_ids.update(cell_entity_ids)
+        return [self._states[entity_id] for entity_id in sorted(entity_ids)]
@@ -58,7 +58,11 @@ from homeassistant.helpers import config_per_platform, extract_domain_configs
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.loader import Integration, IntegrationNotFound
+from homeassistant.helpers.validation_cache import (
+    ValidationCache,
+    async_get_validation_cache,
+)
+from homeassistant.loader import Integration, IntegrationNotFound, async_get_integration
 from homeassistant.requirements import (
     RequirementsNotFound,
     async_get_integration_with_requirements,
@@ -840,16 +844,30 @@ async def async_process_component_config(  # noqa: C901
             _LOGGER.exception("Unknown error calling %s config validator", domain)
             return None
 
+    cache = await async_get_validation_cache(hass)
+
     # No custom config validator, proceed with schema validation
     if hasattr(component, "CONFIG_SCHEMA"):
+        domain_keys = extract_domain_configs(config, domain)
+        key = await cache.async_key(
+            "config",
+            {config_key: config[config_key] for config_key in domain_keys},
+            integrations=[integration],
+        )
+        if (cached := cache.async_get(key)) is not None:
+            return {**config_without_domain(config, domain), **cached}
+        cv.uncacheable_validation.set(False)
         try:
-            return component.CONFIG_SCHEMA(config)  # type: ignore
+            validated: ConfigType = component.CONFIG_SCHEMA(config)  # type: ignore
         except vol.Invalid as ex:
             async_log_exception(ex, domain, config, hass, integration.documentation)
             return None
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Unknown error calling %s CONFIG_SCHEMA", domain)
             return None
+        if not cv.uncacheable_validation.get():
+            _async_cache_domain_config(cache, key, config, validated, domain_keys)
+        return validated
 
     component_platform_schema = getattr(
         component, "PLATFORM_SCHEMA_BASE", getattr(component, "PLATFORM_SCHEMA", None)
@@ -860,9 +878,17 @@ async def async_process_component_config(  # noqa: C901
 
     platforms = []
     for p_name, p_config in config_per_platform(config, domain):
+        p_key = await _async_platform_key(
+            hass, cache, domain, integration, p_name, p_config
+        )
+        cached = cache.async_get(p_key)
+        cv.uncacheable_validation.set(False)
+
         # Validate component specific platform schema
         try:
-            p_validated = component_platform_schema(p_config)
+            p_validated = (
+                cached if cached is not None else component_platform_schema(p_config)
+            )
         except vol.Invalid as ex:
             async_log_exception(ex, domain, p_config, hass, integration.documentation)
             continue
@@ -878,6 +904,8 @@ async def async_process_component_config(  # noqa: C901
         # So if p_name is None we are not going to validate platform
         # (the automation component is one of them)
         if p_name is None:
+            if cached is None and not cv.uncacheable_validation.get():
+                cache.async_set(p_key, p_validated)
             platforms.append(p_validated)
             continue
 
@@ -894,7 +922,7 @@ async def async_process_component_config(  # noqa: C901
             continue
 
         # Validate platform specific schema
-        if hasattr(platform, "PLATFORM_SCHEMA"):
+        if cached is None and hasattr(platform, "PLATFORM_SCHEMA"):
             try:
                 p_validated = platform.PLATFORM_SCHEMA(p_config)  # type: ignore
             except vol.Invalid as ex:
@@ -914,6 +942,8 @@ async def async_process_component_config(  # noqa: C901
                 )
                 continue
 
+        if cached is None and not cv.uncacheable_validation.get():
+            cache.async_set(p_key, p_validated)
         platforms.append(p_validated)
 
     # Create a copy of the configuration with all config for current
@@ -924,6 +954,59 @@ async def async_process_component_config(  # noqa: C901
     return config
 
 
+async def _async_platform_key(
+    hass: HomeAssistant,
+    cache: ValidationCache,
+    domain: str,
+    integration: Integration,
+    p_name: Any,
+    p_config: Any,
+) -> str | None:
+    """Return the validation cache key of a platform config, None if unknown."""
+    integrations = [integration]
+    if p_name is not None:
+        if not isinstance(p_name, str):
+            return None
+        try:
+            integrations.append(await async_get_integration(hass, p_name))
+        except IntegrationNotFound:
+            return None
+    return await cache.async_key(
+        "platform", domain, p_config, integrations=integrations
+    )
+
+
+@callback
+def _async_cache_domain_config(
+    cache: ValidationCache,
+    key: str | None,
+    config: ConfigType,
+    validated: ConfigType,
+    domain_keys: Sequence[str],
+) -> None:
+    """Cache the domain config validated by a CONFIG_SCHEMA.
+
+    The config of other domains must be passed through unchanged, as the
+    cached config only replaces the config of the domain.
+    """
+    if not isinstance(validated, dict):
+        return
+    other_keys = {config_key for config_key in config if config_key not in domain_keys}
+    if any(
+        config_key not in validated or validated[config_key] is not config[config_key]
+        for config_key in other_keys
+    ):
+        return
+    cache.async_set(
+        key,
+        {
+            config_key: value
+            for config_key, value in validated.items()
+            if config_key not in other_keys
+        },
+    )
+
+
 @callback
 def config_without_domain(config: ConfigType, domain: str) -> ConfigType:
     """Return a config with all configuration for a domain removed."""
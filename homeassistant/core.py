@@ -15,6 +15,7 @@ import logging
 import os
 import pathlib
 import re
+import sys
 import threading
 from time import monotonic
 from types import MappingProxyType
@@ -67,6 +68,7 @@ from homeassistant.util.async_ import (
     shutdown_run_callback_threadsafe,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.executor import ExecutorPools
 from homeassistant.util.timeout import TimeoutManager
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
 import homeassistant.util.uuid as uuid_util
@@ -111,6 +113,25 @@ SOURCE_YAML = "yaml"
 # How long to wait until things that run on startup have to finish.
 TIMEOUT_EVENT_START = 15
 
+# Executor pools, so blocking jobs of some integrations can't starve others
+EXECUTOR_POOL_CAMERA = "camera"
+EXECUTOR_POOL_DATABASE = "database"
+EXECUTOR_POOL_POLLING = "polling"
+# Pools without a size get as many workers as the default executor
+DEFAULT_EXECUTOR_POOLS: dict[str, int | None] = {
+    EXECUTOR_POOL_CAMERA: 8,
+    EXECUTOR_POOL_DATABASE: 4,
+    EXECUTOR_POOL_POLLING: None,
+}
+# Pools of the jobs of integrations, or of their platforms. The jobs of other
+# integrations run in the default executor.
+DEFAULT_EXECUTOR_POOL_INTEGRATIONS = {
+    "camera": EXECUTOR_POOL_CAMERA,
+    "history": EXECUTOR_POOL_DATABASE,
+    "logbook": EXECUTOR_POOL_DATABASE,
+    "recorder": EXECUTOR_POOL_DATABASE,
+}
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -233,6 +254,11 @@ class HomeAssistant:
         self._stopped: asyncio.Event | None = None
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
+        self.executor_pools = ExecutorPools(
+            DEFAULT_EXECUTOR_POOLS,
+            DEFAULT_EXECUTOR_POOL_INTEGRATIONS,
+            self._default_executor_workers,
+        )
 
     @property
     def is_running(self) -> bool:
@@ -244,6 +270,16 @@ class HomeAssistant:
         """Return if Home Assistant is stopping."""
         return self.state in (CoreState.stopping, CoreState.final_write)
 
+    def _default_executor_workers(self) -> int | None:
+        """Return the number of workers of the default executor of the loop.
+
+        Returns None if the loop did not start its default executor yet, a pool
+        then gets the default size of a ThreadPoolExecutor, as the default
+        executor would.
+        """
+        executor = getattr(self.loop, "_default_executor", None)
+        return getattr(executor, "_max_workers", None)
+
     def start(self) -> int:
         """Start Home Assistant.
 
@@ -366,7 +402,7 @@ class HomeAssistant:
             return None
         else:
             task = self.loop.run_in_executor(  # type: ignore
-                None, hassjob.target, *args
+                self.executor_pools.for_target(hassjob.target), hassjob.target, *args
             )
 
         # If a task is scheduled
@@ -401,8 +437,27 @@ class HomeAssistant:
     def async_add_executor_job(
         self, target: Callable[..., T], *args: Any
     ) -> Awaitable[T]:
-        """Add an executor job from within the event loop."""
-        task = self.loop.run_in_executor(None, target, *args)
+        """Add an executor job from within the event loop.
+
+        The job runs in the executor pool of the integration of the target,
+        or in the default executor if the integration has no pool.
+        """
+        task = self.loop.run_in_executor(
+            self.executor_pools.for_target(target), target, *args
+        )
+
+        # If a task is scheduled
+        if self._track_task:
+            self._pending_tasks.append(task)
+
+        return task
+
+    @callback
+    def async_add_pool_executor_job(
+        self, pool: str, target: Callable[..., T], *args: Any
+    ) -> Awaitable[T]:
+        """Add an executor job to a named executor pool from within the event loop."""
+        task = self.loop.run_in_executor(self.executor_pools.get(pool), target, *args)
 
         # If a task is scheduled
         if self._track_task:
@@ -568,6 +623,8 @@ class HomeAssistant:
                 "Timed out waiting for shutdown stage 3 to complete, the shutdown will continue"
             )
 
+        await self.loop.run_in_executor(None, self.executor_pools.shutdown)
+
         self.exit_code = exit_code
         self.state = CoreState.stopped
 
@@ -859,6 +916,9 @@ class EventBus:
             )
 
 
+EMPTY_ATTRIBUTES: MappingProxyType[str, Any] = MappingProxyType({})
+
+
 class State:
     """Object to represent a state within the state machine.
 
@@ -878,7 +938,7 @@ class State:
         "attributes",
         "last_changed",
         "last_updated",
-        "context",
+        "_context",
         "domain",
         "object_id",
         "_as_dict",
@@ -894,7 +954,12 @@ class State:
         context: Context | None = None,
         validate_entity_id: bool | None = True,
     ) -> None:
-        """Initialize a new state."""
+        """Initialize a new state.
+
+        The entity id and domain are interned, attributes already wrapped in
+        a MappingProxyType are shared instead of wrapped again and the
+        context is only created when it is accessed.
+        """
         state = str(state)
 
         if validate_entity_id and not valid_entity_id(entity_id):
@@ -909,15 +974,34 @@ class State:
                 "State max length is 255 characters."
             )
 
-        self.entity_id = entity_id.lower()
+        self.entity_id = sys.intern(entity_id.lower())
         self.state = state
-        self.attributes = MappingProxyType(attributes or {})
+        if isinstance(attributes, MappingProxyType):
+            self.attributes = attributes
+        elif attributes:
+            self.attributes = MappingProxyType(attributes)
+        else:
+            self.attributes = EMPTY_ATTRIBUTES
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
-        self.context = context or Context()
-        self.domain, self.object_id = split_entity_id(self.entity_id)
+        self._context = context
+        domain, object_id = split_entity_id(self.entity_id)
+        self.domain = sys.intern(domain)
+        self.object_id = sys.intern(object_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
 
+    @property
+    def context(self) -> Context:
+        """Return the context in which the state was created."""
+        if self._context is None:
+            self._context = Context()
+        return self._context
+
+    @context.setter
+    def context(self, value: Context) -> None:
+        """Set the context."""
+        self._context = value
+
     @property
     def name(self) -> str:
         """Name of this state."""
@@ -1080,6 +1164,62 @@ class StateMachine:
             state for state in self._states.values() if state.domain in domain_filter
         ]
 
+    @callback
+    def async_memory_usage(self) -> dict[str, dict[str, int]]:
+        """Estimate the memory used by the current states, per domain.
+
+        Objects shared between states, such as attribute maps and contexts,
+        are only accounted once. Values nested in attributes are not
+        followed.
+
+        This method must be run in the event loop.
+        """
+        seen: set[int] = set()
+        usage: dict[str, dict[str, int]] = {}
+
+        def sizeof(obj: Any) -> int:
+            if id(obj) in seen:
+                return 0
+            seen.add(id(obj))
+            return sys.getsizeof(obj)
+
+        for state in self._states.values():
+            domain_usage = usage.setdefault(
+                state.domain,
+                {
+                    "states": 0,
+                    "bytes": 0,
+                    "attributes_bytes": 0,
+                    "shared_attributes": 0,
+                },
+            )
+            domain_usage["states"] += 1
+            size = (
+                sizeof(state)
+                + sizeof(state.entity_id)
+                + sizeof(state.object_id)
+                + sizeof(state.state)
+                + sizeof(state.last_updated)
+                + sizeof(state.last_changed)
+            )
+            if state._context is not None:  # pylint: disable=protected-access
+                size += sizeof(state._context)  # pylint: disable=protected-access
+            if state._as_dict is not None:  # pylint: disable=protected-access
+                size += sizeof(state._as_dict)  # pylint: disable=protected-access
+
+            attributes = state.attributes
+            if id(attributes) in seen:
+                domain_usage["shared_attributes"] += 1
+            else:
+                attributes_size = sizeof(attributes) + sys.getsizeof(dict(attributes))
+                for key, value in attributes.items():
+                    attributes_size += sizeof(key) + sizeof(value)
+                domain_usage["attributes_bytes"] += attributes_size
+                size += attributes_size
+            domain_usage["bytes"] += size
+
+        return usage
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -1211,6 +1351,11 @@ class StateMachine:
         if same_state and same_attr:
             return
 
+        if same_attr:
+            # Share the attributes of the previous state, so the states kept
+            # by listeners don't each hold their own copy
+            attributes = old_state.attributes  # type: ignore[union-attr]
+
         if context is None:
             context = Context()
 
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Sequence
+import hashlib
+from json import dumps as json_dumps
 import re
 from typing import TYPE_CHECKING, Any
 
@@ -42,3 +44,16 @@ def extract_domain_configs(config: ConfigType, domain: str) -> Sequence[str]:
     """
     pattern = re.compile(fr"^{domain}(| .+)$")
     return [key for key in config.keys() if pattern.match(key)]
+
+
+def config_hash(*configs: Any) -> str:
+    """Return a hash of raw configurations, to find the ones that changed.
+
+    Mappings are hashed independently of the order of their keys.
+    """
+    try:
+        data = json_dumps(configs, sort_keys=True, default=repr)
+    except TypeError:
+        # Keys of mixed types can't be sorted
+        data = repr(configs)
+    return hashlib.sha256(data.encode()).hexdigest()
@@ -10,7 +10,7 @@ import functools as ft
 import logging
 import re
 import sys
-from typing import Any, Callable, cast
+from typing import Any, Callable, Dict, Optional, Union, cast
 
 from homeassistant.components import zone as zone_cmp
 from homeassistant.components.device_automation import (
@@ -61,6 +61,7 @@ import homeassistant.util.dt as dt_util
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_id_get,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -82,6 +83,17 @@ INPUT_ENTITY_ID = re.compile(
 
 ConditionCheckerType = Callable[[HomeAssistant, TemplateVarsType], bool]
 
+# A compiled condition is a constant or a function also passed the states
+# looked up during the evaluation
+CompiledCheckerType = Callable[
+    [HomeAssistant, TemplateVarsType, Dict[str, Optional[State]]], bool
+]
+CompiledConditionType = Union[bool, CompiledCheckerType]
+
+# Conditions merged into a parent condition of the given type: and(and(a, b))
+# is and(a, b), or(or(a, b)) is or(a, b) and not(or(a, b)) is not(a, b)
+_FLATTENED_CONDITIONS = {"and": "and", "or": "or", "not": "or"}
+
 
 def condition_trace_append(variables: TemplateVarsType, path: str) -> TraceElement:
     """Append a TraceElement to trace[path]."""
@@ -187,6 +199,218 @@ async def async_from_config(
     return cast(ConditionCheckerType, factory(config, config_validation))
 
 
+async def async_compiled_from_config(
+    hass: HomeAssistant,
+    config: ConfigType | Template,
+    config_validation: bool = True,
+) -> ConditionCheckerType:
+    """Turn a condition configuration into a compiled method.
+
+    When the run is recorded in a trace, the method evaluates the condition
+    like the one returned by async_from_config. Otherwise it evaluates a
+    compiled version of the condition which doesn't trace: nested and, or
+    and not conditions are flattened, constant conditions are evaluated once
+    and each entity is looked up once per evaluation. Evaluations raising an
+    error are done again the traced way, so they report the same errors.
+
+    Should be run on the event loop.
+    """
+    if config_validation:
+        config = cv.CONDITION_SCHEMA(config)
+    traced = await async_from_config(hass, config, False)
+    compiled = await _async_compile(hass, config)
+    if isinstance(compiled, bool):
+        compiled = _constant_checker(compiled)
+
+    def compiled_condition(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Test the compiled condition."""
+        if trace_id_get() is not None:
+            return traced(hass, variables)
+
+        try:
+            return compiled(hass, variables, {})
+        except ConditionError:
+            return traced(hass, variables)
+
+    return compiled_condition
+
+
+def _constant_checker(result: bool) -> CompiledCheckerType:
+    """Return a compiled checker of a constant condition."""
+
+    def constant(
+        hass: HomeAssistant,
+        variables: TemplateVarsType,
+        states: dict[str, State | None],
+    ) -> bool:
+        return result
+
+    return constant
+
+
+def _get_state(
+    hass: HomeAssistant, states: dict[str, State | None], entity_id: str
+) -> State | None:
+    """Return the state of an entity, looking it up once per evaluation."""
+    try:
+        return states[entity_id]
+    except KeyError:
+        state_obj = states[entity_id] = hass.states.get(entity_id)
+        return state_obj
+
+
+def _flatten(config: ConfigType | Template) -> list[ConfigType | Template]:
+    """Return the sub conditions of a condition, merging nested ones."""
+    assert not isinstance(config, Template)
+    merged = _FLATTENED_CONDITIONS[config[CONF_CONDITION]]
+    flattened = []
+    for entry in config["conditions"]:
+        if isinstance(entry, dict) and entry[CONF_CONDITION] == merged:
+            flattened.extend(_flatten(entry))
+        else:
+            flattened.append(entry)
+    return flattened
+
+
+async def _async_compile(
+    hass: HomeAssistant, config: ConfigType | Template
+) -> CompiledConditionType:
+    """Compile a validated condition configuration."""
+    if isinstance(config, Template):
+        config = {CONF_CONDITION: "template", CONF_VALUE_TEMPLATE: config}
+
+    condition = config[CONF_CONDITION]
+    if condition in _FLATTENED_CONDITIONS:
+        checks = [await _async_compile(hass, entry) for entry in _flatten(config)]
+        return _compile_logic(condition, checks)
+    if condition == "template":
+        return _compile_template(hass, config[CONF_VALUE_TEMPLATE])
+    if condition == "state":
+        return _compile_state(config)
+    if condition == "numeric_state":
+        return _compile_numeric_state(hass, config)
+
+    checker = await async_from_config(hass, config, False)
+
+    def check_condition(
+        hass: HomeAssistant,
+        variables: TemplateVarsType,
+        states: dict[str, State | None],
+    ) -> bool:
+        return checker(hass, variables)
+
+    return check_condition
+
+
+def _compile_logic(
+    condition: str, compiled: list[CompiledConditionType]
+) -> CompiledConditionType:
+    """Compile an and, or or not condition, evaluating constants once.
+
+    Errors of sub conditions only matter when no other sub condition decides
+    the result, so a constant sub condition which does decides the result of
+    the whole condition.
+    """
+    # The sub condition result deciding the result of the condition, and
+    # the result of the condition then
+    deciding, decided = {"and": (False, False), "or": (True, True)}.get(
+        condition, (True, False)
+    )
+    if deciding in compiled:
+        return decided
+    checks = [check for check in compiled if not isinstance(check, bool)]
+    if not checks:
+        return not decided
+
+    def check_logic(
+        hass: HomeAssistant,
+        variables: TemplateVarsType,
+        states: dict[str, State | None],
+    ) -> bool:
+        for check in checks:
+            if check(hass, variables, states) == deciding:
+                return decided
+        return not decided
+
+    return check_logic
+
+
+def _compile_template(
+    hass: HomeAssistant, value_template: Template
+) -> CompiledConditionType:
+    """Compile a template condition, evaluating static templates once."""
+    value_template.hass = hass
+    if value_template.is_static:
+        return async_template(hass, value_template, trace_result=False)
+
+    def check_template(
+        hass: HomeAssistant,
+        variables: TemplateVarsType,
+        states: dict[str, State | None],
+    ) -> bool:
+        return async_template(hass, value_template, variables, trace_result=False)
+
+    return check_template
+
+
+def _compile_state(config: ConfigType) -> CompiledConditionType:
+    """Compile a state condition."""
+    entity_ids = [entity_id.lower() for entity_id in config.get(CONF_ENTITY_ID, [])]
+    req_states = config.get(CONF_STATE, [])
+    for_period = config.get("for")
+    attribute = config.get(CONF_ATTRIBUTE)
+
+    if not isinstance(req_states, list):
+        req_states = [req_states]
+
+    def check_state(
+        hass: HomeAssistant,
+        variables: TemplateVarsType,
+        states: dict[str, State | None],
+    ) -> bool:
+        for entity_id in entity_ids:
+            if (entity := _get_state(hass, states, entity_id)) is None:
+                raise ConditionErrorMessage("state", f"unknown entity {entity_id}")
+            if not state(hass, entity, req_states, for_period, attribute):
+                return False
+        return True
+
+    return check_state
+
+
+def _compile_numeric_state(
+    hass: HomeAssistant, config: ConfigType
+) -> CompiledConditionType:
+    """Compile a numeric state condition."""
+    entity_ids = [entity_id.lower() for entity_id in config.get(CONF_ENTITY_ID, [])]
+    attribute = config.get(CONF_ATTRIBUTE)
+    below = config.get(CONF_BELOW)
+    above = config.get(CONF_ABOVE)
+    value_template = config.get(CONF_VALUE_TEMPLATE)
+    if value_template is not None:
+        value_template.hass = hass
+
+    def check_numeric_state(
+        hass: HomeAssistant,
+        variables: TemplateVarsType,
+        states: dict[str, State | None],
+    ) -> bool:
+        for entity_id in entity_ids:
+            if (entity := _get_state(hass, states, entity_id)) is None:
+                raise ConditionErrorMessage(
+                    "numeric_state", f"unknown entity {entity_id}"
+                )
+            if not async_numeric_state(
+                hass, entity, below, above, value_template, variables, attribute
+            ):
+                return False
+        return True
+
+    return check_numeric_state
+
+
 async def async_and_from_config(
     hass: HomeAssistant, config: ConfigType, config_validation: bool = True
 ) -> ConditionCheckerType:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Hashable
+from contextvars import ContextVar
 from datetime import (
     date as date_sys,
     datetime as datetime_sys,
@@ -46,6 +47,7 @@ from homeassistant.const import (
     CONF_EVENT_DATA_TEMPLATE,
     CONF_FOR,
     CONF_ID,
+    CONF_PARALLEL,
     CONF_PLATFORM,
     CONF_REPEAT,
     CONF_SCAN_INTERVAL,
@@ -104,6 +106,12 @@ port = vol.All(vol.Coerce(int), vol.Range(min=1, max=65535))
 # typing typevar
 T = TypeVar("T")
 
+# Set by the validators checking the system or logging a warning, as their
+# result can't be cached
+uncacheable_validation: ContextVar[bool] = ContextVar(
+    "uncacheable_validation", default=False
+)
+
 
 def path(value: Any) -> str:
     """Validate it's a safe path."""
@@ -180,6 +188,7 @@ def whitespace(value: Any) -> str:
 
 def isdevice(value: Any) -> str:
     """Validate that value is a real device."""
+    uncacheable_validation.set(True)
     try:
         os.stat(value)
         return str(value)
@@ -221,6 +230,7 @@ def is_regex(value: Any) -> re.Pattern[Any]:
 
 def isfile(value: Any) -> str:
     """Validate that the value is an existing file."""
+    uncacheable_validation.set(True)
     if value is None:
         raise vol.Invalid("None is not file")
     file_in = os.path.expanduser(str(value))
@@ -234,6 +244,7 @@ def isfile(value: Any) -> str:
 
 def isdir(value: Any) -> str:
     """Validate that the value is an existing dir."""
+    uncacheable_validation.set(True)
     if value is None:
         raise vol.Invalid("not a directory")
     dir_in = os.path.expanduser(str(value))
@@ -746,6 +757,8 @@ def deprecated(
     def validator(config: dict) -> dict:
         """Check if key is in config and log warning."""
         if key in config:
+            # Validate the block again on the next start to log the warning
+            uncacheable_validation.set(True)
             try:
                 KeywordStyleAdapter(logging.getLogger(module_name)).warning(
                     warning.replace(
@@ -1202,6 +1215,32 @@ _SCRIPT_CHOOSE_SCHEMA = vol.Schema(
     }
 )
 
+
+def _parallel_sequence_action(value: Any) -> Any:
+    """Wrap a single action in a sequence."""
+    if isinstance(value, dict) and CONF_SEQUENCE in value:
+        return value
+    return {CONF_SEQUENCE: value}
+
+
+_PARALLEL_SEQUENCE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ALIAS): string,
+        vol.Required(CONF_SEQUENCE): SCRIPT_SCHEMA,
+    }
+)
+
+_SCRIPT_PARALLEL_SCHEMA = vol.Schema(
+    {
+        **SCRIPT_ACTION_BASE_SCHEMA,
+        vol.Required(CONF_PARALLEL): vol.All(
+            ensure_list,
+            vol.Length(min=1),
+            [vol.All(_parallel_sequence_action, _PARALLEL_SEQUENCE_SCHEMA)],
+        ),
+    }
+)
+
 _SCRIPT_WAIT_FOR_TRIGGER_SCHEMA = vol.Schema(
     {
         **SCRIPT_ACTION_BASE_SCHEMA,
@@ -1229,6 +1268,7 @@ SCRIPT_ACTION_REPEAT = "repeat"
 SCRIPT_ACTION_CHOOSE = "choose"
 SCRIPT_ACTION_WAIT_FOR_TRIGGER = "wait_for_trigger"
 SCRIPT_ACTION_VARIABLES = "variables"
+SCRIPT_ACTION_PARALLEL = "parallel"
 
 
 def determine_script_action(action: dict[str, Any]) -> str:
@@ -1263,6 +1303,9 @@ def determine_script_action(action: dict[str, Any]) -> str:
     if CONF_VARIABLES in action:
         return SCRIPT_ACTION_VARIABLES
 
+    if CONF_PARALLEL in action:
+        return SCRIPT_ACTION_PARALLEL
+
     return SCRIPT_ACTION_CALL_SERVICE
 
 
@@ -1278,6 +1321,7 @@ ACTION_TYPE_SCHEMAS: dict[str, Callable[[Any], dict]] = {
     SCRIPT_ACTION_CHOOSE: _SCRIPT_CHOOSE_SCHEMA,
     SCRIPT_ACTION_WAIT_FOR_TRIGGER: _SCRIPT_WAIT_FOR_TRIGGER_SCHEMA,
     SCRIPT_ACTION_VARIABLES: _SCRIPT_SET_SCHEMA,
+    SCRIPT_ACTION_PARALLEL: _SCRIPT_PARALLEL_SCHEMA,
 }
 
 
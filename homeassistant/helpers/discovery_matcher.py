@@ -0,0 +1,167 @@
+"""Compiled index of the discovery matchers of integration manifests."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+import fnmatch
+import re
+from typing import Any, Callable
+
+import attr
+
+from homeassistant.core import HomeAssistant
+
+GLOB_CHARS = frozenset("*?[")
+
+DATA_MATCHER_STATS = "discovery_matcher_stats"
+
+
+def compile_glob(pattern: str) -> Callable[[str], bool]:
+    """Compile a case sensitive glob pattern into a matching function.
+
+    Patterns without wildcards are compared for equality and patterns with
+    a single trailing * are compared by prefix, only the others are
+    translated to a regular expression.
+    """
+    if not GLOB_CHARS.intersection(pattern):
+        return pattern.__eq__
+    prefix = pattern[:-1]
+    if pattern[-1] == "*" and not GLOB_CHARS.intersection(prefix):
+        return lambda value: value.startswith(prefix)
+    return re.compile(fnmatch.translate(pattern)).match  # type: ignore[return-value]
+
+
+@attr.s(slots=True)
+class DiscoveryMatcherStats:
+    """Counters of a discovery matcher index."""
+
+    lookups: int = attr.ib(default=0)
+    candidates: int = attr.ib(default=0)
+    matches: int = attr.ib(default=0)
+
+    @property
+    def match_rate(self) -> float:
+        """Return the ratio of candidate matchers that matched."""
+        if not self.candidates:
+            return 0.0
+        return self.matches / self.candidates
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters as a dictionary."""
+        return {
+            "lookups": self.lookups,
+            "candidates": self.candidates,
+            "matches": self.matches,
+            "match_rate": round(self.match_rate, 4),
+        }
+
+
+def get_matcher_stats(hass: HomeAssistant, source: str) -> DiscoveryMatcherStats:
+    """Return the counters of the matcher indexes of a discovery source."""
+    all_stats: dict[str, DiscoveryMatcherStats] = hass.data.setdefault(
+        DATA_MATCHER_STATS, {}
+    )
+    if (stats := all_stats.get(source)) is None:
+        stats = all_stats[source] = DiscoveryMatcherStats()
+    return stats
+
+
+def matcher_stats_as_dict(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Return the counters of the matchers of each discovery source."""
+    all_stats: dict[str, DiscoveryMatcherStats] = hass.data.get(DATA_MATCHER_STATS, {})
+    return {source: stats.as_dict() for source, stats in all_stats.items()}
+
+
+class _CompiledMatcher:
+    """A discovery matcher with its values compiled."""
+
+    __slots__ = ("order", "matcher", "tests")
+
+    def __init__(self, order: int, matcher: Mapping[str, str], glob: bool) -> None:
+        """Compile the matcher."""
+        self.order = order
+        self.matcher = matcher
+        self.tests: list[tuple[str, Callable[[str], bool]]] = [
+            (key, compile_glob(value) if glob else value.__eq__)
+            for key, value in matcher.items()
+            if key != "domain"
+        ]
+
+    def matches(self, data: Mapping[str, str | None]) -> bool:
+        """Return True if the discovery data matches."""
+        for key, test in self.tests:
+            if (value := data.get(key)) is None or not test(value):
+                return False
+        return True
+
+
+class DiscoveryMatcherIndex:
+    """Index of discovery matchers by their most selective key.
+
+    Each matcher is indexed under the first of the index keys whose value,
+    truncated to the key length, is free of wildcards. Matching the
+    discovery data only tests the matchers found under its own values and
+    the matchers that could not be indexed.
+    """
+
+    def __init__(
+        self,
+        matchers: Iterable[Mapping[str, str]],
+        index_keys: Mapping[str, int | None],
+        glob: bool = True,
+        stats: DiscoveryMatcherStats | None = None,
+    ) -> None:
+        """Compile and index the matchers.
+
+        index_keys maps the keys to index on, in order of selectivity, to the
+        length of their value to index, None to index the whole value. The
+        stats can be shared between indexes of the same discovery source.
+        """
+        self._index_keys = index_keys
+        self._index: dict[str, dict[str, list[_CompiledMatcher]]] = {
+            key: {} for key in index_keys
+        }
+        self._unindexed: list[_CompiledMatcher] = []
+        self.stats = stats or DiscoveryMatcherStats()
+
+        for order, matcher in enumerate(matchers):
+            compiled = _CompiledMatcher(order, matcher, glob)
+            for key, length in index_keys.items():
+                if (value := matcher.get(key)) is None:
+                    continue
+                if length is not None:
+                    if len(value) < length:
+                        continue
+                    value = value[:length]
+                if glob and GLOB_CHARS.intersection(value):
+                    continue
+                self._index[key].setdefault(value, []).append(compiled)
+                break
+            else:
+                self._unindexed.append(compiled)
+
+    def __len__(self) -> int:
+        """Return the number of matchers."""
+        return len(self._unindexed) + sum(
+            len(bucket)
+            for buckets in self._index.values()
+            for bucket in buckets.values()
+        )
+
+    def match(self, data: Mapping[str, str | None]) -> list[Mapping[str, str]]:
+        """Return the matchers matching the discovery data, in their original order."""
+        candidates = self._unindexed
+        for key, length in self._index_keys.items():
+            if (value := data.get(key)) is None:
+                continue
+            if length is not None:
+                value = value[:length]
+            if bucket := self._index[key].get(value):
+                candidates = [*candidates, *bucket]
+
+        stats = self.stats
+        stats.lookups += 1
+        stats.candidates += len(candidates)
+        matched = [compiled for compiled in candidates if compiled.matches(data)]
+        stats.matches += len(matched)
+        matched.sort(key=lambda compiled: compiled.order)
+        return [compiled.matcher for compiled in matched]
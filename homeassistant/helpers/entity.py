@@ -625,7 +625,12 @@ class Entity(ABC):
             if hasattr(self, "async_update"):
                 task = self.hass.async_create_task(self.async_update())  # type: ignore
             elif hasattr(self, "update"):
-                task = self.hass.async_add_executor_job(self.update)  # type: ignore
+                if self.platform is None:
+                    task = self.hass.async_add_executor_job(self.update)  # type: ignore
+                else:
+                    task = self.hass.async_add_pool_executor_job(
+                        self.platform.executor_pool, self.update  # type: ignore
+                    )
             else:
                 return
 
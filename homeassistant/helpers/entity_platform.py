@@ -20,6 +20,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
+    EXECUTOR_POOL_POLLING,
     CoreState,
     HomeAssistant,
     ServiceCall,
@@ -44,6 +45,7 @@ from . import (
 from .device_registry import DeviceRegistry
 from .entity_registry import DISABLED_INTEGRATION, EntityRegistry
 from .event import async_call_later, async_track_time_interval
+from .polling import AdaptivePolling, PollingStats
 from .typing import ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -105,6 +107,27 @@ class EntityPlatform:
         self._process_updates: asyncio.Lock | None = None
 
         self.parallel_updates: asyncio.Semaphore | None = None
+        # Executor pool of the blocking updates of the entities
+        self.executor_pool: str = getattr(
+            platform, "EXECUTOR_POOL", EXECUTOR_POOL_POLLING
+        )
+
+        self.polling_stats = PollingStats()
+        # Entities are polled on adaptive intervals if the platform bounds them
+        self._adaptive_polling: AdaptivePolling | None = None
+        min_scan_interval = getattr(platform, "MIN_SCAN_INTERVAL", None)
+        max_scan_interval = getattr(platform, "MAX_SCAN_INTERVAL", None)
+        if min_scan_interval is not None or max_scan_interval is not None:
+            self._adaptive_polling = AdaptivePolling(
+                hass,
+                logger,
+                f"{platform_name} {domain}",
+                self.entities,
+                scan_interval,
+                min_scan_interval or scan_interval,
+                max_scan_interval or scan_interval,
+                self.polling_stats,
+            )
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -395,13 +418,19 @@ class EntityPlatform:
             )
             raise
 
-        if (
-            (self.config_entry and self.config_entry.pref_disable_polling)
-            or self._async_unsub_polling is not None
-            or not any(entity.should_poll for entity in self.entities.values())
+        if (self.config_entry and self.config_entry.pref_disable_polling) or not any(
+            entity.should_poll for entity in self.entities.values()
         ):
             return
 
+        if self._adaptive_polling is not None:
+            self._adaptive_polling.async_schedule(self.entities.values())
+            self._async_unsub_polling = self._adaptive_polling.async_cancel
+            return
+
+        if self._async_unsub_polling is not None:
+            return
+
         self._async_unsub_polling = async_track_time_interval(
             self.hass,
             self._update_entity_states,
@@ -689,6 +718,7 @@ class EntityPlatform:
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
         if self._process_updates.locked():
+            self.polling_stats.skipped += 1
             self.logger.warning(
                 "Updating %s %s took longer than the scheduled update interval %s",
                 self.platform_name,
@@ -705,7 +735,9 @@ class EntityPlatform:
                 tasks.append(entity.async_update_ha_state(True))
 
             if tasks:
+                start = self.hass.loop.time()
                 await asyncio.gather(*tasks)
+                self.polling_stats.add_poll(self.hass.loop.time() - start)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
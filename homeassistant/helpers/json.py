@@ -1,8 +1,19 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
+from __future__ import annotations
+
 from datetime import datetime, timedelta
 import json
+import math
+from types import MappingProxyType
 from typing import Any
 
+from homeassistant.core import Context, Event, State
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 class JSONEncoder(json.JSONEncoder):
     """JSONEncoder that supports Home Assistant objects."""
@@ -16,6 +27,8 @@ class JSONEncoder(json.JSONEncoder):
             return o.isoformat()
         if isinstance(o, set):
             return list(o)
+        if isinstance(o, MappingProxyType):
+            return dict(o)
         if hasattr(o, "as_dict"):
             return o.as_dict()
 
@@ -36,3 +49,137 @@ class ExtendedJSONEncoder(JSONEncoder):
             return super().default(o)
         except TypeError:
             return {"__type": str(type(o)), "repr": repr(o)}
+
+
+def json_encoder_default(obj: Any) -> Any:
+    """Convert the Home Assistant objects orjson doesn't support natively."""
+    if isinstance(obj, set):
+        return list(obj)
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    raise TypeError
+
+
+def extended_json_encoder_default(obj: Any) -> Any:
+    """Convert the objects orjson doesn't support, falling back to repr(obj)."""
+    if isinstance(obj, timedelta):
+        return {"__type": str(type(obj)), "total_seconds": obj.total_seconds()}
+    try:
+        return json_encoder_default(obj)
+    except TypeError:
+        return {"__type": str(type(obj)), "repr": repr(obj)}
+
+
+# Standard library encoders by (extended, allow_nan)
+_STDLIB_ENCODERS = {
+    (extended, allow_nan): encoder(
+        separators=(",", ":"), ensure_ascii=False, allow_nan=allow_nan
+    ).encode
+    for extended, encoder in ((False, JSONEncoder), (True, ExtendedJSONEncoder))
+    for allow_nan in (False, True)
+}
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS if orjson else 0
+)
+# Types checked for non-finite floats by the exact type, the fastest way
+_SKIPPED_TYPES = frozenset((str, int, bool, type(None), datetime, Context))
+_MAPPING_TYPES = frozenset((dict, MappingProxyType))
+_SEQUENCE_TYPES = frozenset((list, tuple, set))
+_INFINITIES = (math.inf, -math.inf)
+
+
+def json_dumps(data: Any, *, allow_nan: bool = False, extended: bool = False) -> str:
+    """Serialize data to compact JSON, with orjson when it is installed.
+
+    Non-finite floats are written as null, like orjson does, or as NaN and
+    Infinity with allow_nan. Only data serialized with allow_nan is checked
+    for them. The standard library serializes the data when orjson is not
+    installed or can't serialize it, such as integers larger than 64 bits,
+    and gives the same output.
+
+    With extended, timedeltas and objects that can't be serialized are
+    written like ExtendedJSONEncoder does.
+    """
+    if orjson is not None:
+        default = extended_json_encoder_default if extended else json_encoder_default
+        try:
+            dumped = orjson.dumps(data, option=_ORJSON_OPTIONS, default=default)
+        except TypeError:
+            pass
+        else:
+            if (
+                not allow_nan
+                or b"null" not in dumped
+                or not _has_non_finite_float(data)
+            ):
+                return dumped.decode()
+    try:
+        return _STDLIB_ENCODERS[extended, allow_nan](data)
+    except ValueError:
+        # The data holds non-finite floats, written as null
+        return _STDLIB_ENCODERS[extended, allow_nan](_finite(data))
+
+
+def _finite(data: Any) -> Any:
+    """Return a copy of serializable data with non-finite floats replaced by None."""
+    data_type = type(data)
+    if data_type in _SKIPPED_TYPES:
+        return data
+    if data_type is float:
+        if data != data or data in _INFINITIES:
+            return None
+        return data
+    if isinstance(data, (dict, MappingProxyType)):
+        return {key: _finite(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple, set)):
+        return [_finite(value) for value in data]
+    if hasattr(data, "as_dict"):
+        return _finite(data.as_dict())
+    return data
+
+
+def _has_non_finite_float(data: Any) -> bool:
+    """Return True if serializable data holds a non-finite float."""
+    stack = [data]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        obj = pop()
+        obj_type = type(obj)
+        if obj_type in _SKIPPED_TYPES:
+            continue
+        if obj_type is float:
+            if obj != obj or obj in _INFINITIES:
+                return True
+        elif obj_type is State:
+            # The other fields of states are strings and datetimes
+            extend(obj.attributes.values())
+        elif obj_type in _MAPPING_TYPES:
+            extend(obj.values())
+        elif obj_type in _SEQUENCE_TYPES:
+            extend(obj)
+        elif obj_type is Event:
+            extend(obj.data.values())
+        elif isinstance(obj, (dict, MappingProxyType)):
+            extend(obj.values())
+        elif isinstance(obj, (list, tuple, set)):
+            extend(obj)
+        elif hasattr(obj, "as_dict"):
+            stack.append(obj.as_dict())
+    return False
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON, with orjson when it is installed.
+
+    The NaN and Infinity written by the standard library are parsed with it.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
@@ -0,0 +1,202 @@
+"""Adaptive polling of the entities of a platform."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import timedelta
+from logging import Logger
+from typing import TYPE_CHECKING, Any, Iterable
+
+from homeassistant.core import HomeAssistant, State, callback
+
+if TYPE_CHECKING:
+    from .entity import Entity
+
+# Consecutive unchanged polls before the interval of an entity grows
+UNCHANGED_BEFORE_BACKOFF = 3
+BACKOFF_FACTOR = 1.5
+ERROR_BACKOFF_FACTOR = 2.0
+SPEEDUP_FACTOR = 0.5
+
+
+@dataclass
+class PollingStats:
+    """Statistics of the polls of a platform."""
+
+    polls: int = 0
+    changed: int = 0
+    errors: int = 0
+    skipped: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    intervals: dict[str, float] = field(default_factory=dict)
+
+    def add_poll(self, latency: float) -> None:
+        """Add the latency of a poll."""
+        self.polls += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            "polls": self.polls,
+            "changed": self.changed,
+            "errors": self.errors,
+            "skipped": self.skipped,
+            "latency_avg": round(self.latency_total / self.polls, 6)
+            if self.polls
+            else 0.0,
+            "latency_max": round(self.latency_max, 6),
+            "intervals": {
+                entity_id: round(interval, 3)
+                for entity_id, interval in self.intervals.items()
+            },
+        }
+
+
+@dataclass
+class _EntityPoll:
+    """Schedule of the polls of an entity."""
+
+    entity: Entity
+    interval: float
+    unchanged: int = 0
+    timer: asyncio.TimerHandle | None = None
+
+
+class AdaptivePolling:
+    """Poll each entity of a platform on its own interval.
+
+    Entities added together have their polls spread evenly across the scan
+    interval instead of polled all at once. The interval of an entity then
+    grows after repeatedly unchanged states or failed updates, and shrinks
+    after changed states, within the bounds of the platform.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        logger: Logger,
+        name: str,
+        entities: dict[str, Entity],
+        scan_interval: timedelta,
+        min_interval: timedelta,
+        max_interval: timedelta,
+        stats: PollingStats,
+    ) -> None:
+        """Initialize the adaptive polling."""
+        self.hass = hass
+        self.logger = logger
+        self.name = name
+        self.scan_interval = scan_interval.total_seconds()
+        self.min_interval = min(min_interval.total_seconds(), self.scan_interval)
+        self.max_interval = max(max_interval.total_seconds(), self.scan_interval)
+        self.stats = stats
+        self._entities = entities
+        self._polls: dict[str, _EntityPoll] = {}
+
+    @callback
+    def async_schedule(self, entities: Iterable[Entity]) -> None:
+        """Schedule the polls of the entities not polled yet.
+
+        Their first polls are spread evenly across the scan interval.
+        """
+        new_entities = [
+            entity
+            for entity in entities
+            if entity.should_poll and entity.entity_id not in self._polls
+        ]
+        for index, entity in enumerate(new_entities, 1):
+            poll = self._polls[entity.entity_id] = _EntityPoll(
+                entity, self.scan_interval
+            )
+            self.stats.intervals[entity.entity_id] = poll.interval
+            self._async_schedule_poll(
+                poll, self.scan_interval * index / len(new_entities)
+            )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the polls of all entities."""
+        for poll in self._polls.values():
+            if poll.timer is not None:
+                poll.timer.cancel()
+        self._polls.clear()
+        self.stats.intervals.clear()
+
+    @callback
+    def _async_schedule_poll(self, poll: _EntityPoll, delay: float) -> None:
+        """Schedule the next poll of an entity."""
+        poll.timer = self.hass.loop.call_later(delay, self._async_poll_due, poll)
+
+    @callback
+    def _async_poll_due(self, poll: _EntityPoll) -> None:
+        """Poll an entity which is due, if it is still on the platform."""
+        entity = poll.entity
+        if self._entities.get(entity.entity_id) is not entity:
+            if self._polls.get(entity.entity_id) is poll:
+                del self._polls[entity.entity_id]
+                self.stats.intervals.pop(entity.entity_id, None)
+            return
+        if not entity.should_poll:
+            self._async_schedule_poll(poll, poll.interval)
+            return
+        poll.timer = None
+        self.hass.async_create_task(self._async_poll(poll))
+
+    async def _async_poll(self, poll: _EntityPoll) -> None:
+        """Update an entity and adapt the interval of its next poll."""
+        entity = poll.entity
+        before = self.hass.states.get(entity.entity_id)
+        start = self.hass.loop.time()
+        try:
+            await entity.async_device_update()
+        except Exception:  # pylint: disable=broad-except
+            self.logger.exception("Update for %s fails", entity.entity_id)
+            failed = True
+        else:
+            entity.async_write_ha_state()
+            failed = not entity.available
+        latency = self.hass.loop.time() - start
+        self.stats.add_poll(latency)
+
+        if failed:
+            self.stats.errors += 1
+            poll.unchanged = 0
+            poll.interval *= ERROR_BACKOFF_FACTOR
+        elif _state_changed(before, self.hass.states.get(entity.entity_id)):
+            self.stats.changed += 1
+            poll.unchanged = 0
+            poll.interval *= SPEEDUP_FACTOR
+        else:
+            poll.unchanged += 1
+            if poll.unchanged >= UNCHANGED_BEFORE_BACKOFF:
+                poll.interval *= BACKOFF_FACTOR
+        poll.interval = min(max(poll.interval, self.min_interval), self.max_interval)
+
+        if self._polls.get(entity.entity_id) is not poll:
+            # Polling was cancelled during the update
+            return
+        self.stats.intervals[entity.entity_id] = poll.interval
+
+        delay = poll.interval - latency
+        if delay < 0:
+            self.logger.warning(
+                "Updating %s %s took longer than the scheduled update interval %s",
+                self.name,
+                entity.entity_id,
+                timedelta(seconds=poll.interval),
+            )
+            self.stats.skipped += int(latency // poll.interval)
+            delay = poll.interval - latency % poll.interval
+        self._async_schedule_poll(poll, delay)
+
+
+def _state_changed(before: State | None, after: State | None) -> bool:
+    """Return True if the state or the attributes of an entity changed."""
+    if after is before:
+        return False
+    if before is None or after is None:
+        return True
+    return before.state != after.state or before.attributes != after.attributes
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterator, MutableMapping
 from datetime import datetime, timedelta
 import logging
 from typing import Any, cast
@@ -28,6 +29,7 @@ DATA_RESTORE_STATE_TASK = "restore_state_task"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
+STORAGE_KEY_DELTA = "core.restore_state_delta"
 STORAGE_VERSION = 1
 
 # How long between periodically saving the current states to disk
@@ -36,6 +38,15 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long between rewriting all the stored states, dumps in between only
+# write the states that changed since then. This also bounds how outdated
+# the last_seen of the unchanged states can be.
+STATE_COMPACT_INTERVAL = timedelta(days=1)
+
+# Rewrite all the stored states sooner when the changed states are more
+# than this share of them
+STATE_COMPACT_RATIO = 0.25
+
 
 class StoredState:
     """Object to represent a stored state."""
@@ -60,6 +71,54 @@ class StoredState:
         return cls(State.from_dict(json_dict["state"]), last_seen)
 
 
+def _parse_last_seen(json_dict: dict) -> datetime | None:
+    """Return the last_seen of a stored state dict."""
+    last_seen = json_dict["last_seen"]
+    if isinstance(last_seen, str):
+        return dt_util.parse_datetime(last_seen)
+    return cast(datetime, last_seen)
+
+
+class LazyStoredStates(MutableMapping[str, StoredState]):
+    """Stored states by entity id, created from their dicts when accessed."""
+
+    def __init__(self, stored_dicts: dict[str, dict]) -> None:
+        """Initialize the mapping."""
+        self._dicts = stored_dicts
+        self._states: dict[str, StoredState] = {}
+
+    def __getitem__(self, entity_id: str) -> StoredState:
+        """Return the stored state of an entity."""
+        if (stored_state := self._states.get(entity_id)) is not None:
+            return stored_state
+        stored_state = StoredState.from_dict(self._dicts.pop(entity_id))
+        self._states[entity_id] = stored_state
+        return stored_state
+
+    def __setitem__(self, entity_id: str, stored_state: StoredState) -> None:
+        """Set the stored state of an entity."""
+        self._dicts.pop(entity_id, None)
+        self._states[entity_id] = stored_state
+
+    def __delitem__(self, entity_id: str) -> None:
+        """Remove the stored state of an entity."""
+        if self._states.pop(entity_id, None) is None:
+            del self._dicts[entity_id]
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Return True if a state is stored for the entity."""
+        return entity_id in self._states or entity_id in self._dicts
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the entity ids."""
+        yield from list(self._states)
+        yield from list(self._dicts)
+
+    def __len__(self) -> int:
+        """Return the number of stored states."""
+        return len(self._states) + len(self._dicts)
+
+
 class RestoreStateData:
     """Helper class for managing the helper saved data."""
 
@@ -73,20 +132,20 @@ class RestoreStateData:
             data = cls(hass)
 
             try:
-                stored_states = await data.store.async_load()
+                stored_states, delta = await asyncio.gather(
+                    data.store.async_load(), data.delta_store.async_load()
+                )
             except HomeAssistantError as exc:
                 _LOGGER.error("Error loading last states", exc_info=exc)
-                stored_states = None
+                stored_states = delta = None
 
-            if stored_states is None:
+            if stored_states is None and delta is None:
                 _LOGGER.debug("Not creating cache - no saved states found")
                 data.last_states = {}
             else:
-                data.last_states = {
-                    item["state"]["entity_id"]: StoredState.from_dict(item)
-                    for item in stored_states
-                    if valid_entity_id(item["state"]["entity_id"])
-                }
+                data.last_states = LazyStoredStates(
+                    _merge_stored_states(stored_states or [], delta)
+                )
                 _LOGGER.debug("Created cache with %s", list(data.last_states))
 
             if hass.state == CoreState.running:
@@ -112,8 +171,21 @@ class RestoreStateData:
         self.store: Store = Store(
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
-        self.last_states: dict[str, StoredState] = {}
+        # States changed or removed since all the states were last written
+        self.delta_store: Store = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY_DELTA, encoder=JSONEncoder
+        )
+        self.last_states: MutableMapping[str, StoredState] = {}
         self.entity_ids: set[str] = set()
+        # last_updated of the written states by entity id, None until the
+        # first dump writes all the states
+        self._written: dict[str, datetime] | None = None
+        self._last_compacted: datetime | None = None
+        self._delta_states: dict[str, StoredState] = {}
+        self._delta_removed: dict[str, datetime] = {}
+        # Stored states of the previous run replaced since the last dump
+        self._changed_last_states: set[str] = set()
+        self._dump_lock: asyncio.Lock | None = None
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -142,13 +214,14 @@ class RestoreStateData:
         ]
         expiration_time = now - STATE_EXPIRATION
 
-        for entity_id, stored_state in self.last_states.items():
+        for entity_id in self.last_states:
             # Don't save old states that have entities in the current run
             # They are either registered and already part of stored_states,
             # or no longer care about restoring.
             if entity_id in current_entity_ids:
                 continue
 
+            stored_state = self.last_states[entity_id]
             # Don't save old states that have expired
             if stored_state.last_seen < expiration_time:
                 continue
@@ -158,17 +231,111 @@ class RestoreStateData:
         return stored_states
 
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the current state machine to storage.
+
+        Only the states changed since all the states were last written are
+        saved, until there are enough of them to rewrite all the states.
+        """
+        if self._dump_lock is None:
+            self._dump_lock = asyncio.Lock()
+        async with self._dump_lock:
+            await self._async_dump_states()
+
+    async def _async_dump_states(self) -> None:
+        """Save the states changed since the last dump."""
         _LOGGER.debug("Dumping states")
+        now = dt_util.utcnow()
+        written = self._written
+
+        if written is None or (
+            self._last_compacted is not None
+            and now - self._last_compacted >= STATE_COMPACT_INTERVAL
+        ):
+            await self._async_compact(self.async_get_stored_states(), now)
+            return
+
+        # Only the states updated since they were written are stored again,
+        # the stored states of the previous run only when they weren't
+        # written or an entity was removed since. Expired stored states are
+        # dropped when all states are written.
+        current: dict[str, datetime] = {}
+        current_entity_ids = set()
+        for state in self.hass.states.async_all():
+            if state.attributes.get(entity_registry.ATTR_RESTORED):
+                continue
+            entity_id = state.entity_id
+            current_entity_ids.add(entity_id)
+            if entity_id not in self.entity_ids:
+                continue
+            current[entity_id] = state.last_updated
+            if written.get(entity_id) != state.last_updated:
+                self._delta_states[entity_id] = StoredState(state, now)
+                self._delta_removed.pop(entity_id, None)
+        expiration_time = now - STATE_EXPIRATION
+        for entity_id in self._changed_last_states.union(
+            self.last_states.keys() - written.keys()
+        ):
+            if entity_id in current_entity_ids or entity_id not in self.last_states:
+                continue
+            stored_state = self.last_states[entity_id]
+            if stored_state.last_seen < expiration_time:
+                continue
+            current[entity_id] = stored_state.state.last_updated
+            self._delta_states[entity_id] = stored_state
+            self._delta_removed.pop(entity_id, None)
+        self._changed_last_states.clear()
+        removed = [
+            entity_id
+            for entity_id in written.keys() - current.keys()
+            if entity_id in current_entity_ids or entity_id not in self.last_states
+        ]
+        for entity_id in removed:
+            self._delta_states.pop(entity_id, None)
+            self._delta_removed[entity_id] = now
+
+        if len(self._delta_states) + len(self._delta_removed) > max(
+            len(written) * STATE_COMPACT_RATIO, 1
+        ):
+            await self._async_compact(self.async_get_stored_states(), now)
+            return
+
+        try:
+            await self.delta_store.async_save(
+                {
+                    "states": [
+                        stored_state.as_dict()
+                        for stored_state in self._delta_states.values()
+                    ],
+                    "removed": self._delta_removed,
+                }
+            )
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+        written.update(current)
+        for entity_id in removed:
+            del written[entity_id]
+
+    async def _async_compact(
+        self, stored_states: list[StoredState], now: datetime
+    ) -> None:
+        """Write all the states and clear the changed states."""
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [stored_state.as_dict() for stored_state in stored_states]
             )
+            await self.delta_store.async_remove()
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+        self._written = {
+            stored_state.state.entity_id: stored_state.state.last_updated
+            for stored_state in stored_states
+        }
+        self._last_compacted = now
+        self._delta_states = {}
+        self._delta_removed = {}
+        self._changed_last_states.clear()
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -214,10 +381,45 @@ class RestoreStateData:
             state = State.from_dict(_encode_complex(state.as_dict()))
         if state is not None:
             self.last_states[entity_id] = StoredState(state, dt_util.utcnow())
+            self._changed_last_states.add(entity_id)
 
         self.entity_ids.remove(entity_id)
 
 
+def _merge_stored_states(
+    stored_states: list[dict], delta: dict | None
+) -> dict[str, dict]:
+    """Apply the changed and removed states to the stored state dicts.
+
+    The most recently seen state wins, so a delta left over from before the
+    last time all states were written doesn't override newer states.
+    """
+    merged = {
+        item["state"]["entity_id"]: item
+        for item in stored_states
+        if valid_entity_id(item["state"]["entity_id"])
+    }
+    if delta is None:
+        return merged
+
+    for item in delta["states"]:
+        entity_id = item["state"]["entity_id"]
+        if not valid_entity_id(entity_id):
+            continue
+        if (existing := merged.get(entity_id)) is None or _parse_last_seen(
+            existing
+        ) <= _parse_last_seen(item):
+            merged[entity_id] = item
+
+    for entity_id, removed in delta["removed"].items():
+        if (existing := merged.get(entity_id)) is not None and _parse_last_seen(
+            existing
+        ) <= dt_util.parse_datetime(removed):
+            del merged[entity_id]
+
+    return merged
+
+
 def _encode(value: Any) -> Any:
     """Little helper to JSON encode a value."""
     try:
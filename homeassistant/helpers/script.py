@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Sequence
 from contextlib import asynccontextmanager, suppress
+from copy import copy
 from datetime import datetime, timedelta
 from functools import partial
 import itertools
@@ -35,6 +36,7 @@ from homeassistant.const import (
     CONF_EVENT_DATA,
     CONF_EVENT_DATA_TEMPLATE,
     CONF_MODE,
+    CONF_PARALLEL,
     CONF_REPEAT,
     CONF_SCENE,
     CONF_SEQUENCE,
@@ -83,6 +85,7 @@ from .trace import (
     trace_id_get,
     trace_path,
     trace_path_get,
+    trace_path_stack_cv,
     trace_set_result,
     trace_stack_cv,
     trace_stack_pop,
@@ -289,6 +292,12 @@ async def async_validate_action_config(
                 hass, choose_conf[CONF_SEQUENCE]
             )
 
+    elif action_type == cv.SCRIPT_ACTION_PARALLEL:
+        for parallel_conf in config[CONF_PARALLEL]:
+            parallel_conf[CONF_SEQUENCE] = await async_validate_actions_config(
+                hass, parallel_conf[CONF_SEQUENCE]
+            )
+
     else:
         raise ValueError(f"No validation for {action_type}")
 
@@ -346,11 +355,13 @@ class _ScriptRun:
         """Run script."""
         try:
             self._log("Running %s", self._script.running_description)
+            # pylint: disable=protected-access
+            handlers = self._script._get_step_handlers()
             for self._step, self._action in enumerate(self._script.sequence):
                 if self._stop.is_set():
                     script_execution_set("cancelled")
                     break
-                await self._async_step(log_exceptions=False)
+                await self._async_step(handlers[self._step], log_exceptions=False)
             else:
                 script_execution_set("finished")
         except _StopScript:
@@ -361,13 +372,12 @@ class _ScriptRun:
         finally:
             self._finish()
 
-    async def _async_step(self, log_exceptions):
+    async def _async_step(self, handler, log_exceptions):
         with trace_path(str(self._step)):
             async with trace_action(self._hass, self, self._stop, self._variables):
                 if self._stop.is_set():
                     return
                 try:
-                    handler = f"_async_{cv.determine_script_action(self._action)}_step"
                     await getattr(self, handler)()
                 except Exception as ex:
                     if not isinstance(ex, _StopScript) and (
@@ -760,6 +770,28 @@ class _ScriptRun:
             with trace_path(["default"]):
                 await self._async_run_script(choose_data["default"])
 
+    @async_trace_path("parallel")
+    async def _async_parallel_step(self) -> None:
+        """Run sequences in parallel."""
+        # pylint: disable=protected-access
+        scripts = await self._script._async_get_parallel_scripts(self._step)
+
+        async def async_run_with_trace(idx: int, script: Script) -> None:
+            # Each sequence is run in its own task, with its own trace stacks
+            trace_path_stack_cv.set(copy(trace_path_stack_cv.get()))
+            trace_stack_cv.set(copy(trace_stack_cv.get()))
+            with trace_path([str(idx), "sequence"]):
+                await self._async_run_script(script, {**self._variables})
+
+        self._step_log("parallel")
+        results = await asyncio.gather(
+            *(async_run_with_trace(idx, script) for idx, script in enumerate(scripts)),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
     async def _async_wait_for_trigger_step(self):
         """Wait for a trigger event."""
         if CONF_TIMEOUT in self._action:
@@ -822,11 +854,15 @@ class _ScriptRun:
             self._hass, self._variables, render_as_defaults=False
         )
 
-    async def _async_run_script(self, script: Script) -> None:
+    async def _async_run_script(
+        self, script: Script, variables: dict[str, Any] | None = None
+    ) -> None:
         """Execute a script."""
         await self._async_run_long_action(
             self._hass.async_create_task(
-                script.async_run(self._variables, self._context)
+                script.async_run(
+                    self._variables if variables is None else variables, self._context
+                )
             )
         )
 
@@ -993,6 +1029,8 @@ class Script:
         self._config_cache: dict[set[tuple], Callable[..., bool]] = {}
         self._repeat_script: dict[int, Script] = {}
         self._choose_data: dict[int, _ChooseData] = {}
+        self._parallel_scripts: dict[int, list[Script]] = {}
+        self._step_handlers: list[str] | None = None
         self._referenced_entities: set[str] | None = None
         self._referenced_devices: set[str] | None = None
         self._referenced_areas: set[str] | None = None
@@ -1032,6 +1070,9 @@ class Script:
                 script.update_logger(self._logger)
             if choose_data["default"] is not None:
                 choose_data["default"].update_logger(self._logger)
+        for scripts in self._parallel_scripts.values():
+            for script in scripts:
+                script.update_logger(self._logger)
 
     def _changed(self) -> None:
         if self._change_listener_job:
@@ -1222,6 +1263,15 @@ class Script:
             self._changed()
             raise
 
+    def _get_step_handlers(self) -> list[str]:
+        """Return the names of the run methods handling each step."""
+        if self._step_handlers is None:
+            self._step_handlers = [
+                f"_async_{cv.determine_script_action(action)}_step"
+                for action in self.sequence
+            ]
+        return self._step_handlers
+
     async def _async_stop(
         self, aws: list[asyncio.Task], update_state: bool, spare: _ScriptRun | None
     ) -> None:
@@ -1250,7 +1300,7 @@ class Script:
             config_cache_key = frozenset((k, str(v)) for k, v in config.items())
         cond = self._config_cache.get(config_cache_key)
         if not cond:
-            cond = await condition.async_from_config(self._hass, config, False)
+            cond = await condition.async_compiled_from_config(self._hass, config, False)
             self._config_cache[config_cache_key] = cond
         return cond
 
@@ -1332,6 +1382,37 @@ class Script:
             self._choose_data[step] = choose_data
         return choose_data
 
+    async def _async_prep_parallel_scripts(self, step: int) -> list[Script]:
+        action = self.sequence[step]
+        step_name = action.get(CONF_ALIAS, f"Parallel action at step {step+1}")
+        parallel_scripts: list[Script] = []
+        for idx, parallel_script in enumerate(action[CONF_PARALLEL], start=1):
+            parallel_name = parallel_script.get(CONF_ALIAS, f"parallel {idx}")
+            parallel_script = Script(
+                self._hass,
+                parallel_script[CONF_SEQUENCE],
+                f"{self.name}: {step_name}: {parallel_name}",
+                self.domain,
+                running_description=self.running_description,
+                script_mode=SCRIPT_MODE_PARALLEL,
+                max_runs=self.max_runs,
+                logger=self._logger,
+                top_level=False,
+            )
+            parallel_script.change_listener = partial(
+                self._chain_change_listener, parallel_script
+            )
+            parallel_scripts.append(parallel_script)
+
+        return parallel_scripts
+
+    async def _async_get_parallel_scripts(self, step: int) -> list[Script]:
+        parallel_scripts = self._parallel_scripts.get(step)
+        if not parallel_scripts:
+            parallel_scripts = await self._async_prep_parallel_scripts(step)
+            self._parallel_scripts[step] = parallel_scripts
+        return parallel_scripts
+
     def _log(
         self, msg: str, *args: Any, level: int = logging.INFO, **kwargs: Any
     ) -> None:
@@ -3,13 +3,16 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
+import copy
+import json
 from json import JSONEncoder
 import logging
 import os
-from typing import Any, Callable
+from typing import Any, Callable, cast
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import async_call_later
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
@@ -18,6 +21,11 @@ from homeassistant.util import json as json_util
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_UPSERT = "upsert"
+JOURNAL_DELETE = "delete"
+# Compact a journal once it has more operations than this and than items
+JOURNAL_COMPACT_MIN = 100
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -246,3 +254,261 @@ class Store:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+
+class JournaledStore(Store):
+    """Store of keyed items, saving changes by appending them to a journal.
+
+    Upserts and deletes are appended to a journal file next to the stored
+    data and synced to disk. All items are only written when the journal is
+    compacted, once it holds more operations than there are items. Loading
+    replays the journal on top of the stored items. Delayed saves journal
+    the changes between the stored items and the saved ones.
+
+    The items must be loaded before they are changed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        version: int,
+        key: str,
+        private: bool = False,
+        *,
+        encoder: type[JSONEncoder] | None = None,
+    ) -> None:
+        """Initialize journaled storage class."""
+        super().__init__(hass, version, key, private, encoder=encoder)
+        self._items: dict[str, Any] | None = None
+        # Sequence number of the last operation and number of operations in the journal
+        self._journal_seq = 0
+        self._journal_len = 0
+        self._pending: list[list] = []
+        self._flush_task: asyncio.Task | None = None
+
+    @property
+    def journal_path(self) -> str:
+        """Return the journal path."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
+    async def _async_load(self):
+        """Load the items and replay the journal, ensure the task is removed."""
+        try:
+            if self._items is None:
+                return await self._async_load_items()
+            return dict(self._items)
+        finally:
+            self._load_task = None
+
+    async def _async_load_items(self) -> dict | None:
+        """Load the stored items and replay the journal on top of them."""
+        data, operations = await self.hass.async_add_executor_job(self._read_files)
+
+        items: dict[str, Any] = {}
+        snapshot_seq = 0
+        if data:
+            items = data["data"]
+            snapshot_seq = data.get("journal_seq", 0)
+        for seq, operation, key, *value in operations:
+            # Operations already part of the stored items are left over
+            # from a compaction that didn't finish
+            if seq <= snapshot_seq:
+                continue
+            if operation == JOURNAL_UPSERT:
+                items[key] = value[0]
+            else:
+                items.pop(key, None)
+            snapshot_seq = seq
+        self._journal_seq = snapshot_seq
+        self._journal_len = len(operations)
+
+        if data and data["version"] != self.version:
+            _LOGGER.info(
+                "Migrating %s storage from %s to %s",
+                self.key,
+                data["version"],
+                self.version,
+            )
+            items = await self._async_migrate_func(data["version"], items)
+            # The journal must only hold operations on migrated items
+            self._items = items
+            await self.async_compact()
+        self._items = items
+
+        if not data and not operations:
+            return None
+        return dict(items)
+
+    def _read_files(self) -> tuple[dict, list[list]]:
+        """Read the stored items and the journal operations."""
+        data = json_util.load_json(self.path)
+        try:
+            with open(self.journal_path, "rb") as journal:
+                lines = journal.readlines()
+        except FileNotFoundError:
+            return cast(dict, data), []
+
+        operations = []
+        size = 0
+        for index, line in enumerate(lines):
+            try:
+                operations.append(json.loads(line))
+            except ValueError as err:
+                if index < len(lines) - 1:
+                    raise HomeAssistantError(
+                        f"Corrupt journal of {self.key} at line {index + 1}: {err}"
+                    ) from err
+                # Only the last operation can be partially written, drop it
+                # so the next operations aren't appended to it
+                _LOGGER.warning("Ignoring incomplete journal entry of %s", self.key)
+                os.truncate(self.journal_path, size)
+                break
+            size += len(line)
+        else:
+            if lines and not lines[-1].endswith(b"\n"):
+                with open(self.journal_path, "ab") as journal:
+                    journal.write(b"\n")
+        return cast(dict, data), operations
+
+    @callback
+    def async_upsert(self, key: str, value: Any) -> None:
+        """Insert or update an item."""
+        self._async_queue_operation([JOURNAL_UPSERT, key, value])
+        cast(dict, self._items)[key] = value
+
+    @callback
+    def async_delete(self, key: str) -> None:
+        """Delete an item."""
+        self._async_queue_operation([JOURNAL_DELETE, key])
+        cast(dict, self._items).pop(key, None)
+
+    @callback
+    def _async_queue_operation(self, operation: list) -> None:
+        """Queue an operation to be appended to the journal."""
+        if self._items is None:
+            raise HomeAssistantError(f"Storage {self.key} must be loaded first")
+        self._journal_seq += 1
+        self._pending.append([self._journal_seq, *operation])
+        if self._flush_task is None:
+            self._flush_task = self.hass.async_create_task(self._async_flush())
+
+    async def async_flush(self) -> None:
+        """Wait for the queued operations to be written."""
+        if self._flush_task is not None:
+            await self._flush_task
+
+    async def _async_flush(self) -> None:
+        """Append the queued operations to the journal."""
+        async with self._write_lock:
+            self._flush_task = None
+            operations, self._pending = self._pending, []
+            if not operations:
+                return
+            try:
+                await self.hass.async_add_executor_job(self._append_journal, operations)
+            except (json_util.SerializationError, json_util.WriteError) as err:
+                _LOGGER.error("Error writing journal for %s: %s", self.key, err)
+                return
+            self._journal_len += len(operations)
+            if self._journal_len > max(
+                JOURNAL_COMPACT_MIN, len(cast(dict, self._items))
+            ):
+                await self._async_compact()
+
+    def _append_journal(self, operations: list[list]) -> None:
+        """Append operations to the journal and sync it to disk."""
+        try:
+            lines = "".join(
+                f"{json.dumps(operation, cls=self._encoder)}\n"
+                for operation in operations
+            )
+        except TypeError as error:
+            raise json_util.SerializationError(
+                f"Failed to serialize journal of {self.key}: {error}"
+            ) from error
+
+        try:
+            os.makedirs(os.path.dirname(self.journal_path), exist_ok=True)
+            fd = os.open(
+                self.journal_path,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                0o600 if self._private else 0o644,
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as journal:
+                journal.write(lines)
+                journal.flush()
+                os.fsync(journal.fileno())
+        except OSError as error:
+            raise json_util.WriteError(error) from error
+
+    async def async_compact(self) -> None:
+        """Write all items and empty the journal."""
+        async with self._write_lock:
+            await self._async_compact()
+
+    async def _async_compact(self) -> None:
+        """Write all items and empty the journal, the write lock must be held."""
+        data = {
+            "version": self.version,
+            "key": self.key,
+            "journal_seq": self._journal_seq,
+            "data": dict(cast(dict, self._items)),
+        }
+        try:
+            await self.hass.async_add_executor_job(self._write_snapshot, data)
+        except (json_util.SerializationError, json_util.WriteError) as err:
+            _LOGGER.error("Error writing config for %s: %s", self.key, err)
+            return
+        self._journal_len = 0
+
+    def _write_snapshot(self, data: dict) -> None:
+        """Write the items, then empty the journal."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        _LOGGER.debug("Writing data for %s to %s", self.key, self.path)
+        json_util.save_json(self.path, data, self._private, encoder=self._encoder)
+        with suppress(FileNotFoundError):
+            os.truncate(self.journal_path, 0)
+
+    async def async_save(self, data: dict | list) -> None:
+        """Replace all items."""
+        self._items = dict(cast(dict, data))
+        self._journal_seq += 1
+        await self.async_compact()
+
+    async def _async_handle_write_data(self, *_args):
+        """Journal the changes of the items of a delayed save."""
+        self._async_cleanup_delay_listener()
+        self._async_cleanup_final_write_listener()
+
+        if self._data is None:
+            # Another write already consumed the data
+            return
+
+        data = self._data
+        self._data = None
+
+        if self._items is None:
+            await self.async_load()
+        if "data_func" in data:
+            data["data"] = data.pop("data_func")()
+        self._async_journal_changes(data["data"])
+        await self.async_flush()
+
+    @callback
+    def _async_journal_changes(self, items: dict) -> None:
+        """Journal the upserts and deletes turning the items into new ones."""
+        current = cast(dict, self._items)
+        for key in [key for key in current if key not in items]:
+            self.async_delete(key)
+        for key, value in items.items():
+            if key not in current or current[key] != value:
+                # The caller may change its items before the next save
+                self.async_upsert(key, copy.deepcopy(value))
+
+    async def async_remove(self) -> None:
+        """Remove all data."""
+        await super().async_remove()
+        with suppress(FileNotFoundError):
+            await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+        self._items = None
+        self._journal_len = 0
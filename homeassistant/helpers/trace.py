@@ -28,12 +28,18 @@ class TraceElement:
         if variables is None:
             variables = {}
         last_variables = variables_cv.get() or {}
-        variables_cv.set(dict(variables))
         changed_variables = {
             key: value
             for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
+            if key not in last_variables
+            or (
+                (last_value := last_variables[key]) is not value and last_value != value
+            )
         }
+        # Steps that don't change the variables share the copy of the last
+        # step that did, which also holds the same values
+        if changed_variables or len(variables) != len(last_variables):
+            variables_cv.set(dict(variables))
         self._variables = changed_variables
 
     def __repr__(self) -> str:
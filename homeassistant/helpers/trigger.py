@@ -63,11 +63,13 @@ async def async_initialize_triggers(
     log_cb: Callable,
     home_assistant_start: bool = False,
     variables: dict[str, Any] | MappingProxyType | None = None,
+    entity_id: str | None = None,
 ) -> CALLBACK_TYPE | None:
     """Initialize triggers."""
     info = {
         "domain": domain,
         "name": name,
+        "entity_id": entity_id,
         "home_assistant_start": home_assistant_start,
         "variables": variables,
     }
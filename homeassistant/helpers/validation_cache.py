@@ -0,0 +1,142 @@
+"""Cache of validated configuration blocks."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable
+import copy
+import math
+import pathlib
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import __version__
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_hash
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
+from homeassistant.util.yaml.objects import NodeListClass, NodeStrClass
+
+if TYPE_CHECKING:
+    from homeassistant.loader import Integration
+
+DATA_VALIDATION_CACHE = "config_validation_cache"
+STORAGE_KEY = "core.config_validation"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+_SCALAR_TYPES = (str, NodeStrClass, int, bool, type(None))
+_MAPPING_TYPES = (dict, OrderedDict)
+_LIST_TYPES = (list, NodeListClass)
+
+
+def is_storable(value: Any) -> bool:
+    """Return True if a value is restored from JSON with the same types."""
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
+        return True
+    if value_type is float:
+        return math.isfinite(value)
+    if value_type in _MAPPING_TYPES:
+        return all(
+            type(key) in (str, NodeStrClass) and is_storable(item)
+            for key, item in value.items()
+        )
+    if value_type in _LIST_TYPES:
+        return all(is_storable(item) for item in value)
+    return False
+
+
+class ValidationCache:
+    """Validated configuration blocks by a hash of the raw block.
+
+    Blocks are looked up by a hash of the raw configuration, of the version
+    of Home Assistant and of the versions and sources of the integrations
+    validating them, so changed blocks and blocks of edited integrations are
+    validated, and report their errors, as before.
+
+    Only validated blocks made of JSON types are cached, they are stored
+    and restored unchanged. Blocks holding templates, time periods or other
+    objects are validated every time. Without a store, as on development
+    versions of Home Assistant, nothing is cached.
+
+    Validated blocks hold the resolved values of their !secret tags, so they
+    are saved to a private store, like the other stores holding credentials.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, store: Store | None, blocks: dict[str, Any]
+    ) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._store = store
+        self._blocks = blocks
+        self._used: set[str] = set()
+        # Integration sources don't change while their modules are loaded
+        self._fingerprints: dict[str, str] = {}
+
+    async def async_key(
+        self, *raw_config: Any, integrations: Iterable[Integration]
+    ) -> str | None:
+        """Return the key of a raw configuration block, None if not cached."""
+        if self._store is None:
+            return None
+        sources = {}
+        for integration in integrations:
+            if (fingerprint := self._fingerprints.get(integration.domain)) is None:
+                fingerprint = await self.hass.async_add_executor_job(
+                    _source_fingerprint, integration.file_path
+                )
+                self._fingerprints[integration.domain] = fingerprint
+            sources[integration.domain] = [str(integration.version), fingerprint]
+        return config_hash(__version__, sources, *raw_config)
+
+    @callback
+    def async_get(self, key: str | None) -> Any:
+        """Return a copy of a validated block, None if it isn't cached."""
+        if key is None or (validated := self._blocks.get(key)) is None:
+            return None
+        self._used.add(key)
+        return copy.deepcopy(validated)
+
+    @callback
+    def async_set(self, key: str | None, validated: Any) -> None:
+        """Cache a validated block if it can be stored."""
+        if (
+            self._store is None
+            or key is None
+            or validated is None
+            or not is_storable(validated)
+        ):
+            return
+        self._blocks[key] = copy.deepcopy(validated)
+        self._used.add(key)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the blocks used since the start to store.
+
+        Blocks that weren't used belong to configurations that changed.
+        """
+        return {"blocks": {key: self._blocks[key] for key in self._used}}
+
+
+@singleton(DATA_VALIDATION_CACHE)
+async def async_get_validation_cache(hass: HomeAssistant) -> ValidationCache:
+    """Load the validation cache."""
+    if "dev" in __version__:
+        # Schemas of core are edited without changing the version
+        return ValidationCache(hass, None, {})
+    store = Store(hass, STORAGE_VERSION, STORAGE_KEY, private=True)
+    data = await store.async_load()
+    return ValidationCache(hass, store, data["blocks"] if data else {})
+
+
+def _source_fingerprint(path: pathlib.Path | None) -> str:
+    """Return a fingerprint of the Python sources of an integration."""
+    if path is None or not path.is_dir():
+        return ""
+    sources = []
+    for source in path.rglob("*.py"):
+        stat = source.stat()
+        sources.append((str(source.relative_to(path)), stat.st_mtime_ns, stat.st_size))
+    return config_hash(sorted(sources))
@@ -15,7 +15,7 @@ from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_dumps
 from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -390,6 +390,167 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def json_serialize_state_dump(hass):
+    """Serialize a dump of 10k realistic states 20 times with the JSON codec."""
+    now = dt_util.utcnow()
+    states = []
+    for idx in range(5000):
+        states.append(
+            core.State(
+                f"sensor.temperature_{idx}",
+                f"{20 + idx % 100 / 10}",
+                {
+                    "state_class": "measurement",
+                    "unit_of_measurement": "°C",
+                    "device_class": "temperature",
+                    "friendly_name": f"Temperature {idx}",
+                    "last_reset": now,
+                },
+                last_changed=now,
+                last_updated=now,
+            )
+        )
+        states.append(
+            core.State(
+                f"light.light_{idx}",
+                "on",
+                {
+                    "supported_color_modes": {"hs", "color_temp"},
+                    "color_mode": "hs",
+                    "brightness": 180,
+                    "hs_color": (30.5, 70.2),
+                    "rgb_color": (255, 170, 76),
+                    "xy_color": (0.542, 0.389),
+                    "effect_list": ["colorloop", "random"],
+                    "friendly_name": f"Light {idx}",
+                    "supported_features": 63,
+                },
+                last_changed=now,
+                last_updated=now,
+            )
+        )
+
+    start = timer()
+    for _ in range(20):
+        json_dumps(states)
+    return timer() - start
+
+
+@benchmark
+async def mqtt_topic_dispatch(hass):
+    """Match 500k MQTT messages against 4000 subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+    trie = TopicTrie()
+    trie.add("homeassistant/#", "discovery")
+    for idx in range(4000):
+        if idx % 100:
+            trie.add(f"zigbee2mqtt/device_{idx}", idx)
+        else:
+            trie.add(f"zigbee2mqtt/device_{idx}/+", idx)
+
+    # More topics than the match cache holds, so most lookups walk the trie
+    topics = [f"zigbee2mqtt/device_{idx}" for idx in range(4000)] + [
+        f"zigbee2mqtt/device_{idx}/availability" for idx in range(0, 4000, 100)
+    ]
+    size = len(topics)
+
+    start = timer()
+
+    for i in range(5 * 10 ** 5):
+        trie.match(topics[i % size])
+
+    return timer() - start
+
+
+@benchmark
+async def group_state_updates(hass):
+    """Update the state of 1000 member any and all groups 100k times."""
+    # pylint: disable=import-outside-toplevel, protected-access
+    from homeassistant.components import group
+
+    hass.data[group.REG_KEY] = group.GroupIntegrationRegistry()
+    entity_ids = [f"light.light_{idx}" for idx in range(1000)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "off")
+
+    groups = []
+    for mode in (None, True):
+        grp = group.Group(hass, "all_lights", entity_ids=entity_ids, mode=mode)
+        grp._reset_tracked_state()
+        groups.append(grp)
+
+    states = [
+        core.State(entity_id, state)
+        for entity_id in entity_ids[:10]
+        for state in ("on", "off")
+    ]
+    size = len(states)
+
+    start = timer()
+
+    for i in range(10 ** 5):
+        state = states[i % size]
+        for grp in groups:
+            grp._async_update_group_state(state)
+
+    return timer() - start
+
+
+@benchmark
+async def condition_deep_tree(hass):
+    """Evaluate a deep condition tree 10k times without tracing."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import condition
+
+    return await _condition_deep_tree(hass, condition.async_from_config)
+
+
+@benchmark
+async def condition_deep_tree_compiled(hass):
+    """Evaluate a deep compiled condition tree 10k times without tracing."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import condition
+
+    return await _condition_deep_tree(hass, condition.async_compiled_from_config)
+
+
+async def _condition_deep_tree(hass, from_config):
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.trace import trace_cv
+
+    # Nested or and and conditions, evaluated down to the deepest one
+    config = {"condition": "state", "entity_id": "light.kitchen", "state": "on"}
+    for level in range(20):
+        if level % 2:
+            sub_condition = {
+                "condition": "state",
+                "entity_id": "light.kitchen",
+                "state": "on",
+            }
+            config = {"condition": "and", "conditions": [sub_condition, config]}
+        else:
+            sub_condition = {
+                "condition": "numeric_state",
+                "entity_id": "sensor.temperature",
+                "below": 10,
+            }
+            config = {"condition": "or", "conditions": [sub_condition, config]}
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("sensor.temperature", "20")
+    check = await from_config(hass, config)
+
+    start = timer()
+    for _ in range(10 ** 4):
+        # Drop the elements traced by the previous evaluation
+        trace_cv.set(None)
+        assert check(hass)
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
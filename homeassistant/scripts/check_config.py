@@ -190,7 +190,7 @@ def check(config_dir, secrets=False):
 
     if secrets:
         # Ensure !secrets point to the patched function
-        yaml_loader.SafeLineLoader.add_constructor("!secret", yaml_loader.secret_yaml)
+        yaml_loader.add_constructor("!secret", yaml_loader.secret_yaml)
 
     def secrets_proxy(*args):
         secrets = Secrets(*args)
@@ -198,7 +198,10 @@ def check(config_dir, secrets=False):
         return secrets
 
     try:
-        with patch.object(yaml_loader, "Secrets", secrets_proxy):
+        # An empty file cache, so every file and secret is loaded and recorded
+        with patch.object(yaml_loader, "Secrets", secrets_proxy), patch.object(
+            yaml_loader, "YAML_FILE_CACHE", yaml_loader.YamlFileCache()
+        ):
             res["components"] = asyncio.run(async_check_config(config_dir))
         res["secret_cache"] = {
             str(key): val for key, val in res["secret_cache"].items()
@@ -218,9 +221,7 @@ def check(config_dir, secrets=False):
             pat.stop()
         if secrets:
             # Ensure !secrets point to the original function
-            yaml_loader.SafeLineLoader.add_constructor(
-                "!secret", yaml_loader.secret_yaml
-            )
+            yaml_loader.add_constructor("!secret", yaml_loader.secret_yaml)
 
     return res
 
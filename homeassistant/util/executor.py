@@ -1,14 +1,18 @@
 """Executor util helpers."""
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 import contextlib
+from dataclasses import asdict, dataclass
+import functools
 import logging
 import queue
 import sys
-from threading import Thread
+from threading import Lock, Thread
 import time
 import traceback
+from typing import Any
 
 from homeassistant.util.thread import async_raise
 
@@ -111,3 +115,172 @@ class InterruptibleThreadPoolExecutor(ThreadPoolExecutor):
             )
             if timeout_remaining <= 0:
                 return
+
+
+@dataclass
+class ExecutorMetrics:
+    """Counters of the jobs run by an executor."""
+
+    submitted: int = 0
+    completed: int = 0
+    queued: int = 0
+    max_queued: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+    run_total: float = 0.0
+
+
+class MeteredThreadPoolExecutor(InterruptibleThreadPoolExecutor):
+    """An InterruptibleThreadPoolExecutor measuring its queue.
+
+    Records how many jobs wait for a thread and how long they wait.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the executor."""
+        super().__init__(*args, **kwargs)
+        self.metrics = ExecutorMetrics()
+        self._metrics_lock = Lock()
+
+    def submit(  # type: ignore[override]
+        self, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Future:
+        """Submit a job, timing how long it waits for a thread."""
+        metrics = self.metrics
+        # The lock keeps the job from starting before it is counted as queued
+        with self._metrics_lock:
+            future = super().submit(
+                self._run_metered, time.monotonic(), fn, args, kwargs
+            )
+            metrics.submitted += 1
+            metrics.queued += 1
+            metrics.max_queued = max(metrics.max_queued, metrics.queued)
+        return future
+
+    def _run_metered(
+        self,
+        submitted: float,
+        fn: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Run a job, recording its wait and run times."""
+        started = time.monotonic()
+        metrics = self.metrics
+        with self._metrics_lock:
+            metrics.queued -= 1
+            metrics.wait_total += started - submitted
+            metrics.wait_max = max(metrics.wait_max, started - submitted)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._metrics_lock:
+                metrics.completed += 1
+                metrics.run_total += time.monotonic() - started
+
+    def metrics_as_dict(self) -> dict[str, Any]:
+        """Return the metrics and the size of the executor."""
+        with self._metrics_lock:
+            metrics = asdict(self.metrics)
+        return {
+            "max_workers": self._max_workers,  # type: ignore[attr-defined]
+            "threads": len(self._threads),  # type: ignore[attr-defined]
+            **metrics,
+        }
+
+
+class ExecutorPools:
+    """Named executor pools of limited size, started when first used.
+
+    Jobs are sent to the pool of the integration of their target, as given
+    by the integrations mapping. The integration of a module is also looked
+    up by its platform, so a mapping for "camera" covers every camera
+    platform. Jobs of other integrations return no pool.
+
+    A pool without a size gets as many workers as the default executor, as
+    returned by default_workers when the pool starts.
+    """
+
+    def __init__(
+        self,
+        sizes: dict[str, int | None],
+        integrations: dict[str, str],
+        default_workers: Callable[[], int | None] = lambda: None,
+    ) -> None:
+        """Initialize the pools."""
+        self._sizes = dict(sizes)
+        self._integrations = integrations
+        self._default_workers = default_workers
+        self._executors: dict[str, MeteredThreadPoolExecutor] = {}
+        self._module_pools: dict[str, str | None] = {}
+        self._lock = Lock()
+        self._shutdown = False
+
+    def add(self, name: str, max_workers: int | None) -> None:
+        """Add a pool, integrations can then send jobs to it."""
+        if name in self._sizes:
+            raise ValueError(f"Executor pool {name} already exists")
+        self._sizes[name] = max_workers
+
+    def get(self, name: str) -> MeteredThreadPoolExecutor:
+        """Return the executor of a pool, starting it if needed."""
+        if (executor := self._executors.get(name)) is not None:
+            return executor
+        with self._lock:
+            if (executor := self._executors.get(name)) is None:
+                if self._shutdown:
+                    raise RuntimeError("Executor pools were shut down")
+                if (max_workers := self._sizes[name]) is None:
+                    max_workers = self._default_workers()
+                executor = self._executors[name] = MeteredThreadPoolExecutor(
+                    thread_name_prefix=f"SyncWorker-{name}", max_workers=max_workers
+                )
+        return executor
+
+    def for_target(
+        self, target: Callable[..., Any]
+    ) -> MeteredThreadPoolExecutor | None:
+        """Return the executor of the pool of a job's target, if it has one."""
+        while isinstance(target, functools.partial):
+            target = target.func
+        module = getattr(target, "__module__", None)
+        if module is None:
+            return None
+        if (pool := self._module_pools.get(module, False)) is False:
+            pool = self._module_pools[module] = self._pool_for_module(module)
+        return None if pool is None else self.get(pool)
+
+    def _pool_for_module(self, module: str) -> str | None:
+        """Return the pool of the integration, or platform, of a module."""
+        parts = module.split(".")
+        if parts[0] == "custom_components":
+            parts = parts[1:]
+        elif parts[:2] == ["homeassistant", "components"]:
+            parts = parts[2:]
+        else:
+            return None
+        for name in parts[:2]:
+            if (pool := self._integrations.get(name)) is not None:
+                return pool
+        return None
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """Return the metrics of the started pools."""
+        return {
+            name: executor.metrics_as_dict()
+            for name, executor in self._executors.items()
+        }
+
+    def shutdown(self) -> None:
+        """Shut the pools down in parallel, interrupting threads still running."""
+        with self._lock:
+            self._shutdown = True
+            executors = list(self._executors.values())
+        threads = [
+            Thread(target=executor.shutdown, name=f"ExecutorPoolShutdown-{index}")
+            for index, executor in enumerate(executors)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
@@ -3,14 +3,26 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from collections.abc import Iterator
+from dataclasses import dataclass
 import fnmatch
 import logging
 import os
 from pathlib import Path
-from typing import Any, TextIO, TypeVar, Union, overload
+import pickle
+import threading
+import time
+from typing import Any, Hashable, TextIO, Tuple, TypeVar, Union, overload
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as FastestAvailableSafeLoader
+
+    HAS_C_LOADER = True
+except ImportError:
+    HAS_C_LOADER = False
+    from yaml import SafeLoader as FastestAvailableSafeLoader  # type: ignore[misc]
+
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import SECRET_YAML
@@ -23,6 +35,135 @@ DICT_T = TypeVar("DICT_T", bound=dict)  # pylint: disable=invalid-name
 
 _LOGGER = logging.getLogger(__name__)
 
+# Files modified this recently may still change without their modification
+# time or size changing, so they aren't cached
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Kind of dependency, file, dir or env, and its path or name
+DependencyKey = Tuple[str, str]
+
+_tracking = threading.local()
+
+
+def _file_signature(path: str) -> tuple[int, int] | None:
+    """Return the modification time and size of a file, None if missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _add_dependency(key: DependencyKey, value: Hashable) -> None:
+    """Record what the YAML file being loaded depends on."""
+    if stack := getattr(_tracking, "stack", None):
+        stack[-1][key] = value
+
+
+def _add_dependencies(dependencies: dict[DependencyKey, Hashable]) -> None:
+    """Record the dependencies of an included file."""
+    if stack := getattr(_tracking, "stack", None):
+        stack[-1].update(dependencies)
+
+
+def _dependency_value(key: DependencyKey) -> Hashable:
+    """Return the current value of a dependency of a cached file."""
+    kind, name = key
+    if kind == "file":
+        return _file_signature(name)
+    if kind == "dir":
+        return tuple(_find_files(name, "*.yaml"))
+    return os.environ.get(name)
+
+
+@dataclass
+class _CachedFile:
+    """A parsed YAML file and what it was built from."""
+
+    secrets_dir: Path | None
+    dependencies: dict[DependencyKey, Hashable]
+    data: bytes
+
+    def is_valid(self) -> bool:
+        """Return True if none of the dependencies changed."""
+        return all(
+            _dependency_value(key) == value for key, value in self.dependencies.items()
+        )
+
+
+def _recently_modified(dependencies: dict[DependencyKey, Hashable]) -> bool:
+    """Return True if a file was modified too recently to be cached."""
+    modified_after = time.time_ns() - _RACY_WINDOW_NS
+    return any(
+        kind == "file" and signature is not None and signature[0] > modified_after  # type: ignore[index]
+        for (kind, _), signature in dependencies.items()
+    )
+
+
+class YamlFileCache:
+    """Cache of parsed YAML files.
+
+    A file is parsed again when it, a file it includes, a directory it
+    includes or a secrets file or environment variable it uses changed.
+    Files are compared by modification time and size. Parsed files are
+    stored pickled, so each load returns a new copy callers can modify.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._files: dict[str, _CachedFile] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached files."""
+        return len(self._files)
+
+    def clear(self) -> None:
+        """Remove all files from the cache."""
+        self._files.clear()
+
+    def load(
+        self,
+        fname: str,
+        signature: tuple[int, int],
+        stream: TextIO,
+        secrets: Secrets | None,
+    ) -> JSON_TYPE:
+        """Return the content of an opened file, parsing it if it changed."""
+        secrets_dir = secrets.config_dir if secrets is not None else None
+        file_key = ("file", fname)
+        cached = self._files.get(fname)
+        if (
+            cached is not None
+            and cached.secrets_dir == secrets_dir
+            and cached.dependencies[file_key] == signature
+            and cached.is_valid()
+        ):
+            _add_dependencies(cached.dependencies)
+            return pickle.loads(cached.data)  # type: ignore[no-any-return]
+
+        dependencies: dict[DependencyKey, Hashable] = {file_key: signature}
+        if (stack := getattr(_tracking, "stack", None)) is None:
+            stack = _tracking.stack = []
+        stack.append(dependencies)
+        try:
+            data = parse_yaml(stream, secrets)
+        finally:
+            stack.pop()
+        _add_dependencies(dependencies)
+
+        self._files.pop(fname, None)
+        if _recently_modified(dependencies):
+            return data
+        try:
+            blob = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return data
+        self._files[fname] = _CachedFile(secrets_dir, dependencies, blob)
+        return data
+
+
+YAML_FILE_CACHE = YamlFileCache()
+
 
 class Secrets:
     """Store secrets while loading YAML."""
@@ -31,6 +172,7 @@ class Secrets:
         """Initialize secrets."""
         self.config_dir = config_dir
         self._cache: dict[Path, dict[str, str]] = {}
+        self._signatures: dict[Path, tuple[int, int] | None] = {}
 
     def get(self, requester_path: str, secret: str) -> str:
         """Return the value of a secret."""
@@ -47,6 +189,8 @@ class Secrets:
                 break
 
             secrets = self._load_secret_yaml(secret_dir)
+            secret_path = secret_dir / SECRET_YAML
+            _add_dependency(("file", str(secret_path)), self._signatures[secret_path])
 
             if secret in secrets:
                 _LOGGER.debug(
@@ -66,6 +210,7 @@ class Secrets:
             return self._cache[secret_path]
 
         _LOGGER.debug("Loading %s", secret_path)
+        self._signatures[secret_path] = _file_signature(str(secret_path))
         try:
             secrets = load_yaml(str(secret_path))
 
@@ -90,6 +235,25 @@ class Secrets:
         return secrets
 
 
+class FastSafeLoader(FastestAvailableSafeLoader):
+    """The fastest available safe loader, libyaml when it is installed."""
+
+    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+        """Initialize a safe loader."""
+        super().__init__(stream)
+        if HAS_C_LOADER:
+            # The C loader doesn't keep the stream and its name, which are
+            # used to record the file objects were loaded from
+            if isinstance(stream, str):
+                self.name = "<unicode string>"
+            elif isinstance(stream, bytes):
+                self.name = "<byte string>"
+            else:
+                self.name = getattr(stream, "name", "<file>")
+            self.stream = stream
+        self.secrets = secrets
+
+
 class SafeLineLoader(yaml.SafeLoader):
     """Loader class that keeps track of line numbers."""
 
@@ -106,11 +270,21 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+LoaderType = Union[FastSafeLoader, SafeLineLoader]
+
+
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
-    """Load a YAML file."""
+    """Load a YAML file, from the cache if it didn't change."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            try:
+                stat = os.fstat(conf_file.fileno())
+            except (OSError, TypeError, ValueError):
+                # Not a real file
+                return parse_yaml(conf_file, secrets)
+            return YAML_FILE_CACHE.load(
+                fname, (stat.st_mtime_ns, stat.st_size), conf_file, secrets
+            )
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
@@ -122,7 +296,7 @@ def parse_yaml(content: str | TextIO, secrets: Secrets | None = None) -> JSON_TY
         # If configuration file is empty YAML returns None
         # We convert that to an empty dict
         return (
-            yaml.load(content, Loader=lambda stream: SafeLineLoader(stream, secrets))
+            yaml.load(content, Loader=lambda stream: FastSafeLoader(stream, secrets))
             or OrderedDict()
         )
     except yaml.YAMLError as exc:
@@ -132,26 +306,24 @@ def parse_yaml(content: str | TextIO, secrets: Secrets | None = None) -> JSON_TY
 
 @overload
 def _add_reference(
-    obj: list | NodeListClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: list | NodeListClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeListClass:
     ...
 
 
 @overload
 def _add_reference(
-    obj: str | NodeStrClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: str | NodeStrClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeStrClass:
     ...
 
 
 @overload
-def _add_reference(
-    obj: DICT_T, loader: SafeLineLoader, node: yaml.nodes.Node
-) -> DICT_T:
+def _add_reference(obj: DICT_T, loader: LoaderType, node: yaml.nodes.Node) -> DICT_T:
     ...
 
 
-def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type: ignore
+def _add_reference(obj, loader: LoaderType, node: yaml.nodes.Node):  # type: ignore
     """Add file reference information to an object."""
     if isinstance(obj, list):
         obj = NodeListClass(obj)
@@ -162,7 +334,7 @@ def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type:
     return obj
 
 
-def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load another YAML file and embeds it using the !include tag.
 
     Example:
@@ -193,13 +365,18 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
-def _include_dir_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
-) -> OrderedDict:
+def _find_yaml_files(directory: str) -> list[str]:
+    """Find the YAML files included from a directory."""
+    files = list(_find_files(directory, "*.yaml"))
+    _add_dependency(("dir", directory), tuple(files))
+    return files
+
+
+def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
@@ -208,12 +385,12 @@ def _include_dir_named_yaml(
 
 
 def _include_dir_merge_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -223,24 +400,24 @@ def _include_dir_merge_named_yaml(
 
 
 def _include_dir_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> list[JSON_TYPE]:
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
     return [
         load_yaml(f, loader.secrets)
-        for f in _find_files(loc, "*.yaml")
+        for f in _find_yaml_files(loc)
         if os.path.basename(f) != SECRET_YAML
     ]
 
 
 def _include_dir_merge_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
     merged_list: list[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -249,7 +426,7 @@ def _include_dir_merge_list_yaml(
     return _add_reference(merged_list, loader, node)
 
 
-def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> OrderedDict:
+def _ordered_dict(loader: LoaderType, node: yaml.nodes.MappingNode) -> OrderedDict:
     """Load YAML mappings into an ordered dictionary to preserve key order."""
     loader.flatten_mapping(node)
     nodes = loader.construct_pairs(node)
@@ -281,15 +458,16 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
     return _add_reference(OrderedDict(nodes), loader, node)
 
 
-def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _construct_seq(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Add line number and file name to Load YAML sequence."""
     (obj,) = loader.construct_yaml_seq(node)
     return _add_reference(obj, loader, node)
 
 
-def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
+def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    _add_dependency(("env", args[0]), os.environ.get(args[0]))
 
     # Check for a default value
     if len(args) > 1:
@@ -300,7 +478,7 @@ def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     raise HomeAssistantError(node.value)
 
 
-def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
@@ -308,19 +486,19 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     return loader.secrets.get(loader.name, node.value)
 
 
-SafeLineLoader.add_constructor("!include", _include_yaml)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-SafeLineLoader.add_constructor("!env_var", _env_var_yaml)
-SafeLineLoader.add_constructor("!secret", secret_yaml)
-SafeLineLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-SafeLineLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
-SafeLineLoader.add_constructor("!input", Input.from_node)
+def add_constructor(tag: Any, constructor: Any) -> None:
+    """Add a constructor to the fast and the line tracking loaders."""
+    for loader in (FastSafeLoader, SafeLineLoader):
+        loader.add_constructor(tag, constructor)
+
+
+add_constructor("!include", _include_yaml)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq)
+add_constructor("!env_var", _env_var_yaml)
+add_constructor("!secret", secret_yaml)
+add_constructor("!include_dir_list", _include_dir_list_yaml)
+add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+add_constructor("!include_dir_named", _include_dir_named_yaml)
+add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
+add_constructor("!input", Input.from_node)
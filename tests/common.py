@@ -153,6 +153,20 @@ def get_test_home_assistant():
     return hass
 
 
+def _run_mock_executor_job(target, args):
+    """Run a mocked executor job in place, return None for other jobs."""
+    check_target = target
+    while isinstance(check_target, ft.partial):
+        check_target = check_target.func
+
+    if not isinstance(check_target, Mock):
+        return None
+
+    fut = asyncio.Future()
+    fut.set_result(target(*args))
+    return fut
+
+
 # pylint: disable=protected-access
 async def async_test_home_assistant(loop, load_registries=True):
     """Return a Home Assistant object pointing at test config dir."""
@@ -164,6 +178,7 @@ async def async_test_home_assistant(loop, load_registries=True):
 
     orig_async_add_job = hass.async_add_job
     orig_async_add_executor_job = hass.async_add_executor_job
+    orig_async_add_pool_executor_job = hass.async_add_pool_executor_job
     orig_async_create_task = hass.async_create_task
 
     def async_add_job(target, *args):
@@ -181,17 +196,18 @@ async def async_test_home_assistant(loop, load_registries=True):
 
     def async_add_executor_job(target, *args):
         """Add executor job."""
-        check_target = target
-        while isinstance(check_target, ft.partial):
-            check_target = check_target.func
-
-        if isinstance(check_target, Mock):
-            fut = asyncio.Future()
-            fut.set_result(target(*args))
+        if (fut := _run_mock_executor_job(target, args)) is not None:
             return fut
 
         return orig_async_add_executor_job(target, *args)
 
+    def async_add_pool_executor_job(pool, target, *args):
+        """Add executor job to a pool."""
+        if (fut := _run_mock_executor_job(target, args)) is not None:
+            return fut
+
+        return orig_async_add_pool_executor_job(pool, target, *args)
+
     def async_create_task(coroutine):
         """Create task."""
         if isinstance(coroutine, Mock) and not isinstance(coroutine, AsyncMock):
@@ -266,6 +282,7 @@ async def async_test_home_assistant(loop, load_registries=True):
 
     hass.async_add_job = async_add_job
     hass.async_add_executor_job = async_add_executor_job
+    hass.async_add_pool_executor_job = async_add_pool_executor_job
     hass.async_create_task = async_create_task
     hass.async_wait_for_task_count = types.MethodType(async_wait_for_task_count, hass)
     hass._await_count_and_log_pending = types.MethodType(
@@ -168,6 +168,32 @@ async def test_allgroup_turn_on_if_last_turns_on(hass):
     assert group_state.state == STATE_ON
 
 
+async def test_allgroup_counts_repeated_member_updates(hass):
+    """Group with all: true, repeated updates of a member are counted once."""
+    hass.states.async_set("light.Bowl", STATE_ON)
+    hass.states.async_set("light.Ceiling", STATE_OFF)
+
+    assert await async_setup_component(hass, "group", {})
+
+    test_group = await group.Group.async_create_group(
+        hass, "init_group", ["light.Bowl", "light.Ceiling"], False, mode=True
+    )
+
+    # Attribute updates of a member that is already on
+    hass.states.async_set("light.Bowl", STATE_ON, {"brightness": 100})
+    hass.states.async_set("light.Bowl", STATE_ON, {"brightness": 200})
+    await hass.async_block_till_done()
+    assert hass.states.get(test_group.entity_id).state == STATE_OFF
+
+    hass.states.async_set("light.Ceiling", STATE_ON)
+    await hass.async_block_till_done()
+    assert hass.states.get(test_group.entity_id).state == STATE_ON
+
+    hass.states.async_set("light.Bowl", STATE_OFF)
+    await hass.async_block_till_done()
+    assert hass.states.get(test_group.entity_id).state == STATE_OFF
+
+
 async def test_expand_entity_ids(hass):
     """Test expand_entity_ids method."""
     hass.states.async_set("light.Bowl", STATE_ON)
@@ -223,6 +249,97 @@ async def test_expand_entity_ids_recursive(hass):
     )
 
 
+async def test_expand_entity_ids_nested_cycle(hass, caplog):
+    """Test expand_entity_ids with nested groups containing each other."""
+    hass.states.async_set("group.upstairs", "on", {"entity_id": ["light.bedroom"]})
+    hass.states.async_set(
+        "group.downstairs",
+        "on",
+        {"entity_id": ["light.kitchen", "group.upstairs", "light.bedroom"]},
+    )
+    hass.states.async_set(
+        "group.upstairs", "on", {"entity_id": ["light.bedroom", "group.downstairs"]}
+    )
+
+    assert group.expand_entity_ids(hass, ["group.upstairs"]) == [
+        "light.bedroom",
+        "light.kitchen",
+    ]
+    assert group.expand_entity_ids(hass, ["group.downstairs"]) == [
+        "light.kitchen",
+        "light.bedroom",
+    ]
+    assert "Group group.downstairs contains group.upstairs" in caplog.text
+
+
+async def test_expand_entity_ids_follows_membership_changes(hass):
+    """Test expanded groups are updated as soon as a nested group changes."""
+    assert await async_setup_component(hass, "group", {})
+    membership = hass.data[group.MEMBERSHIP_KEY]
+    hass.states.async_set("group.lights", "on", {"entity_id": ["light.bowl"]})
+    hass.states.async_set("group.all", "on", {"entity_id": ["group.lights"]})
+    assert group.expand_entity_ids(hass, ["group.all"]) == ["light.bowl"]
+    cached = membership._expanded["group.all"]
+
+    # A state change keeping the members keeps the cached expansion
+    hass.states.async_set("group.lights", "off", {"entity_id": ["light.bowl"]})
+    assert group.expand_entity_ids(hass, ["group.all"]) == ["light.bowl"]
+    assert membership._expanded["group.all"] is cached
+
+    # Changes are seen without waiting for the state changed events
+    hass.states.async_set(
+        "group.lights", "on", {"entity_id": ["light.bowl", "light.ceiling"]}
+    )
+    assert group.expand_entity_ids(hass, ["group.all"]) == [
+        "light.bowl",
+        "light.ceiling",
+    ]
+    hass.states.async_set("group.all", "on", {"entity_id": ["light.kettle"]})
+    assert group.expand_entity_ids(hass, ["group.all"]) == ["light.kettle"]
+    hass.states.async_set("group.all", "on", {"entity_id": ["group.lights"]})
+
+    hass.states.async_remove("group.lights")
+    assert group.expand_entity_ids(hass, ["group.all"]) == []
+
+    # Removed groups are dropped
+    await hass.async_block_till_done()
+    assert "group.lights" not in membership._expanded
+
+    test_group = await group.Group.async_create_group(hass, "kitchen", ["light.bowl"])
+    assert group.expand_entity_ids(hass, ["group.kitchen"]) == ["light.bowl"]
+    await test_group.async_update_tracked_entity_ids(["switch.kettle"])
+    assert group.expand_entity_ids(hass, ["group.kitchen"]) == ["switch.kettle"]
+
+    await test_group.async_remove()
+    assert group.expand_entity_ids(hass, ["group.kitchen"]) == []
+    assert "group.kitchen" not in membership._expanded
+
+
+async def test_groups_with_entity(hass):
+    """Test finding the groups containing an entity."""
+    assert await async_setup_component(hass, "group", {})
+
+    lights = await group.Group.async_create_group(
+        hass, "lights", ["light.Bowl", "light.Ceiling"]
+    )
+    kitchen = await group.Group.async_create_group(
+        hass, "kitchen", ["light.bowl", "switch.kettle"]
+    )
+
+    assert group.groups_with_entity(hass, "light.bowl") == [
+        "group.lights",
+        "group.kitchen",
+    ]
+    assert group.groups_with_entity(hass, "switch.kettle") == ["group.kitchen"]
+
+    await kitchen.async_update_tracked_entity_ids(["switch.kettle"])
+    assert group.groups_with_entity(hass, "light.bowl") == ["group.lights"]
+
+    await lights.async_remove()
+    assert group.groups_with_entity(hass, "light.bowl") == []
+    assert group.groups_with_entity(hass, "switch.kettle") == ["group.kitchen"]
+
+
 async def test_expand_entity_ids_ignores_non_strings(hass):
     """Test that non string elements in lists are ignored."""
     assert [] == group.expand_entity_ids(hass, [5, True])
@@ -439,7 +556,8 @@ async def test_reloading_groups(hass):
         "group.second_group",
         "group.test_group",
     ]
-    assert hass.bus.async_listeners()["state_changed"] == 1
+    # The state change tracker of the members and the group membership graph
+    assert hass.bus.async_listeners()["state_changed"] == 2
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["hello.world"]) == 1
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.one"]) == 1
@@ -458,7 +576,7 @@ async def test_reloading_groups(hass):
         "group.all_tests",
         "group.hello",
     ]
-    assert hass.bus.async_listeners()["state_changed"] == 1
+    assert hass.bus.async_listeners()["state_changed"] == 2
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.one"]) == 1
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.two"]) == 1
@@ -9,6 +9,7 @@ import voluptuous as vol
 import homeassistant.components.automation as automation
 from homeassistant.components.homeassistant.triggers import (
     numeric_state as numeric_state_trigger,
+    state_index,
 )
 from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL, SERVICE_TURN_OFF
 from homeassistant.core import Context
@@ -1822,3 +1823,38 @@ async def test_template_variable(hass, calls, multiplier):
         assert len(calls) == 1
     else:
         assert len(calls) == 0
+
+
+async def test_not_evaluated_on_attribute_change(hass, calls):
+    """Test fixed thresholds are not evaluated when the value is unchanged."""
+    hass.states.async_set("test.entity", 9)
+    await hass.async_block_till_done()
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "alias": "below 10",
+                "trigger": {
+                    "platform": "numeric_state",
+                    "entity_id": "test.entity",
+                    "below": 10,
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+    stats = state_index.async_get_index(hass).stats[
+        ("automation", "automation.below_10", "below 10")
+    ]
+
+    hass.states.async_set("test.entity", 9, {"some": "attribute"})
+    await hass.async_block_till_done()
+    assert stats.evaluations == 0
+
+    hass.states.async_set("test.entity", 11)
+    await hass.async_block_till_done()
+    hass.states.async_set("test.entity", 9)
+    await hass.async_block_till_done()
+    assert stats.evaluations == 2
+    assert len(calls) == 1
@@ -1358,3 +1358,146 @@ async def test_variables_priority(hass, calls):
         await hass.async_block_till_done()
         assert len(calls) == 2
         assert calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_only_matching_triggers_are_evaluated(hass, calls, hass_ws_client):
+    """Test a state change only evaluates the triggers accepting the new state."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "alias": f"to {to_state}",
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": to_state,
+                    },
+                    "action": {"service": "test.automation"},
+                }
+                for to_state in ("world", "planet", "moon")
+            ]
+            + [
+                {
+                    "alias": "from hello",
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "from": "hello",
+                    },
+                    "action": {"service": "test.automation"},
+                },
+                {
+                    "alias": "any change",
+                    "trigger": {"platform": "state", "entity_id": "test.entity"},
+                    "action": {"service": "test.automation"},
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+    hass.states.async_set("test.entity", "world", {"some": "attribute"})
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "automation/trigger_stats"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    stats = {stats["name"]: stats for stats in msg["result"]}
+    assert stats["to world"] == {
+        "domain": "automation",
+        "entity_id": "automation.to_world",
+        "name": "to world",
+        "triggers": 1,
+        "evaluations": 1,
+        "matches": 1,
+    }
+    assert stats["to planet"]["evaluations"] == 0
+    assert stats["to moon"]["evaluations"] == 0
+    assert stats["from hello"]["evaluations"] == 1
+    assert stats["from hello"]["matches"] == 1
+    assert stats["any change"]["evaluations"] == 2
+    assert stats["any change"]["matches"] == 2
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    await client.send_json({"id": 6, "type": "automation/trigger_stats"})
+    msg = await client.receive_json()
+    assert msg["result"] == []
+
+
+async def test_stats_of_automations_with_the_same_name(hass, calls, hass_ws_client):
+    """Test automations with the same name have their own counters."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "alias": "same",
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": "test.entity",
+                        "to": to_state,
+                    },
+                    "action": {"service": "test.automation"},
+                }
+                for to_state in ("world", "planet")
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "automation/trigger_stats"})
+    msg = await client.receive_json()
+    stats = {stats["entity_id"]: stats for stats in msg["result"]}
+    assert stats["automation.same"]["triggers"] == 1
+    assert stats["automation.same"]["matches"] == 1
+    assert stats["automation.same_2"]["triggers"] == 1
+    assert stats["automation.same_2"]["matches"] == 0
+
+
+async def test_attribute_to_null_matches_any_value(hass, calls):
+    """Test an attribute trigger with to null fires for any new value."""
+    hass.states.async_set("test.entity", "on", {"name": "hello"})
+    await hass.async_block_till_done()
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "state",
+                    "entity_id": "test.entity",
+                    "attribute": "name",
+                    "to": None,
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("test.entity", "on", {"name": "world"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    hass.states.async_set("test.entity", "on", {"name": "world", "other": 1})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
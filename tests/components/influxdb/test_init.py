@@ -1,4 +1,5 @@
 """The tests for the InfluxDB component."""
+import asyncio
 from dataclasses import dataclass
 import datetime
 from unittest.mock import MagicMock, Mock, call, patch
@@ -15,6 +16,7 @@ from homeassistant.const import (
     STATE_STANDBY,
 )
 from homeassistant.core import split_entity_id
+from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.setup import async_setup_component
 
 INFLUX_PATH = "homeassistant.components.influxdb"
@@ -1522,6 +1524,157 @@ async def test_event_listener_backlog_full(
         assert get_write_api(mock_client).call_count == 0
 
 
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_mock_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_spool(
+    hass, mock_client, config_ext, get_write_api, get_mock_call, tmp_path, monkeypatch
+):
+    """Test events are spooled while InfluxDB is unreachable and replayed."""
+    monkeypatch.setattr(f"{INFLUX_PATH}.SPOOL_DIRECTORY", str(tmp_path))
+    config = {"spool": {}}
+    config.update(config_ext)
+    handler_method = await _setup(hass, mock_client, config, get_write_api)
+    instance = hass.data[influxdb.DOMAIN]
+
+    state = MagicMock(
+        state=1,
+        domain="fake",
+        entity_id="entity.id",
+        object_id="entity",
+        attributes={},
+    )
+    event = MagicMock(data={"new_state": state}, time_fired=12345)
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = IOError("foo")
+
+    # Write fails, the event is spooled
+    handler_method(event)
+    instance.block_till_done()
+    assert write_api.call_count == 1
+    assert instance.spool.metrics.backlog_points == 1
+    assert instance.write_errors == 0
+
+    # While unreachable, events are spooled without trying to write them
+    handler_method(event)
+    instance.block_till_done()
+    assert write_api.call_count == 1
+    assert instance.spool.metrics.backlog_points == 2
+
+    # Write works again, the spool is replayed
+    write_api.side_effect = None
+    instance.next_replay = 0
+    handler_method(event)
+    instance.block_till_done()
+    for _ in range(100):
+        if not instance.spool.backlog:
+            break
+        await asyncio.sleep(0.01)
+    assert not instance.spool.backlog
+    assert instance.spool.metrics.replayed_points == 3
+    assert not instance.unreachable
+    assert write_api.call_count == 2
+    body = [
+        {
+            "measurement": "entity.id",
+            "tags": {"domain": "fake", "entity_id": "entity"},
+            "time": 12345,
+            "fields": {"value": 1},
+        }
+    ] * 3
+    assert write_api.call_args == get_mock_call(body)
+
+    await async_update_entity(hass, "sensor.influxdb_spool_backlog")
+    sensor = hass.states.get("sensor.influxdb_spool_backlog")
+    assert sensor.state == "0"
+    assert sensor.attributes["spooled_points"] == 3
+    assert sensor.attributes["replayed_points"] == 3
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_mock_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_spool_replay_error(
+    hass,
+    caplog,
+    mock_client,
+    config_ext,
+    get_write_api,
+    get_mock_call,
+    tmp_path,
+    monkeypatch,
+):
+    """Test an error replaying the spool doesn't stop the writer."""
+    monkeypatch.setattr(f"{INFLUX_PATH}.SPOOL_DIRECTORY", str(tmp_path))
+    config = {"spool": {}}
+    config.update(config_ext)
+    handler_method = await _setup(hass, mock_client, config, get_write_api)
+    instance = hass.data[influxdb.DOMAIN]
+
+    state = MagicMock(
+        state=1,
+        domain="fake",
+        entity_id="entity.id",
+        object_id="entity",
+        attributes={},
+    )
+    event = MagicMock(data={"new_state": state}, time_fired=12345)
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = IOError("foo")
+    handler_method(event)
+    instance.block_till_done()
+    assert instance.spool.backlog
+
+    write_api.side_effect = None
+    instance.next_replay = 0
+    with patch.object(instance.spool, "read_batches", side_effect=OSError("bad")):
+        handler_method(event)
+        instance.block_till_done()
+        for _ in range(100):
+            if "Error replaying the InfluxDB spool" in caplog.text:
+                break
+            await asyncio.sleep(0.01)
+    assert "Error replaying the InfluxDB spool" in caplog.text
+    assert instance.unreachable
+    assert instance.next_replay > 0
+    assert instance.spool.backlog
+
+    # The writer keeps running
+    handler_method(event)
+    instance.block_till_done()
+    assert instance.is_alive()
+
+
 @pytest.mark.parametrize(
     "mock_client, config_ext, get_write_api, get_mock_call",
     [
@@ -0,0 +1,91 @@
+"""The tests for the InfluxDB spool."""
+import datetime
+
+from homeassistant.components.influxdb.spool import InfluxSpool
+
+
+def _points(count, start=0):
+    """Return points with distinct values."""
+    return [
+        {"measurement": "m", "tags": {"domain": "sensor"}, "fields": {"value": idx}}
+        for idx in range(start, start + count)
+    ]
+
+
+def test_append_and_replay(tmp_path):
+    """Test points are read back in batches sized by bytes."""
+    spool = InfluxSpool(str(tmp_path), 1024 * 1024, 10 * 1024 * 1024)
+    points = _points(10)
+    time_fired = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+    points[0]["time"] = time_fired
+    spool.append(points)
+    assert spool.backlog
+    assert spool.metrics.backlog_points == 10
+    assert spool.metrics.spooled_points == 10
+
+    path = spool.oldest_segment()
+    line_size = spool.metrics.backlog_bytes // 10
+    batches = list(spool.read_batches(path, line_size * 4))
+    assert [len(batch) for batch in batches] == [3, 4, 3]
+    read = [point for batch in batches for point in batch]
+    assert read[0]["time"] == time_fired.isoformat()
+    assert [point["fields"]["value"] for point in read] == list(range(10))
+
+    spool.remove_segment(path, 2)
+    assert not spool.backlog
+    assert spool.metrics.backlog_bytes == 0
+    assert spool.metrics.replayed_points == 10
+    assert spool.metrics.replay_points_per_second == 5
+    assert not list(tmp_path.iterdir())
+
+
+def test_segments_rotate_and_reload(tmp_path):
+    """Test segments are rotated and loaded again after a restart."""
+    spool = InfluxSpool(str(tmp_path), 100, 10 * 1024 * 1024)
+    spool.append(_points(5))
+    spool.append(_points(5, 5))
+    spool.close()
+    assert len(list(tmp_path.iterdir())) == 2
+
+    spool = InfluxSpool(str(tmp_path), 100, 10 * 1024 * 1024)
+    assert spool.metrics.backlog_points == 10
+    path = spool.oldest_segment()
+    assert [
+        point["fields"]["value"] for point in next(spool.read_batches(path, 1024))
+    ] == list(range(5))
+
+    spool.append(_points(1, 10))
+    assert len(list(tmp_path.iterdir())) == 3
+
+
+def test_max_size_drops_oldest_segments(tmp_path):
+    """Test the oldest segments are dropped when the spool is full."""
+    spool = InfluxSpool(str(tmp_path), 100, 500)
+    for idx in range(10):
+        spool.append(_points(2, idx * 2))
+
+    assert spool.metrics.backlog_bytes <= 500
+    assert spool.metrics.dropped_points > 0
+    assert (
+        spool.metrics.backlog_points + spool.metrics.dropped_points
+        == spool.metrics.spooled_points
+    )
+    # The newest points are kept
+    segments = sorted(tmp_path.iterdir())
+    last = list(spool.read_batches(str(segments[-1]), 1024))[-1]
+    assert last[-1]["fields"]["value"] == 19
+
+
+def test_corrupt_lines_are_skipped(tmp_path):
+    """Test lines which can't be decoded are skipped and counted."""
+    spool = InfluxSpool(str(tmp_path), 1024 * 1024, 10 * 1024 * 1024)
+    spool.append(_points(2))
+    path = spool.oldest_segment()
+    spool.close()
+    with open(path, "ab") as file:
+        file.write(b'{"measurement": "m", "fie')
+
+    spool = InfluxSpool(str(tmp_path), 1024 * 1024, 10 * 1024 * 1024)
+    batches = list(spool.read_batches(path, 1024))
+    assert [point["fields"]["value"] for point in batches[0]] == [0, 1]
+    assert spool.metrics.corrupt_points == 1
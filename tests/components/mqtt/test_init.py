@@ -11,6 +11,7 @@ import voluptuous as vol
 from homeassistant.components import mqtt, websocket_api
 from homeassistant.components.mqtt import debug_info
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
+from homeassistant.components.mqtt.models import ReceiveMessage
 from homeassistant.const import (
     ATTR_DOMAIN,
     ATTR_SERVICE,
@@ -321,6 +322,86 @@ async def test_all_subscriptions_run_when_decode_fails(
     assert len(calls) == 1
 
 
+async def test_payload_decoded_once_per_encoding(hass, mqtt_mock, calls, record_calls):
+    """Test the payload is decoded once for all subscriptions sharing an encoding."""
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls, encoding=None)
+
+    payload = MagicMock()
+    payload.decode.return_value = "test-payload"
+    mqtt_mock._mqtt_handle_message(ReceiveMessage("test-topic", payload, 0, False))
+
+    await hass.async_block_till_done()
+    assert payload.decode.call_count == 1
+    assert [call[0].payload for call in calls] == [
+        "test-payload",
+        "test-payload",
+        payload,
+    ]
+
+
+async def test_received_messages_handled_in_batches(
+    hass, mqtt_mock, calls, record_calls
+):
+    """Test messages received by the network thread are handled in one batch."""
+    await mqtt.async_subscribe(hass, "test-topic/+", record_calls)
+
+    with patch.object(
+        hass.loop, "call_soon_threadsafe", wraps=hass.loop.call_soon_threadsafe
+    ) as mock_call_soon_threadsafe:
+        for idx in range(3):
+            mqtt_mock._mqtt_on_message(
+                None, None, ReceiveMessage(f"test-topic/{idx}", b"payload", 0, False)
+            )
+        assert mock_call_soon_threadsafe.call_count == 1
+        await hass.async_block_till_done()
+
+    assert [call[0].topic for call in calls] == [
+        "test-topic/0",
+        "test-topic/1",
+        "test-topic/2",
+    ]
+    # Messages of a batch share the same receive timestamp
+    assert len({call[0].timestamp for call in calls}) == 1
+
+    mqtt_mock._mqtt_on_message(
+        None, None, ReceiveMessage("test-topic/3", b"payload", 0, False)
+    )
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+
+async def test_failing_callback_does_not_stop_the_batch(
+    hass, caplog, mqtt_mock, calls, record_calls
+):
+    """Test an error in a callback doesn't keep the other messages pending."""
+
+    @callback
+    def failing_callback(msg):
+        """Raise for the first message."""
+        if msg.topic == "test-topic/0":
+            raise ValueError("bad message")
+
+    await mqtt.async_subscribe(hass, "test-topic/+", failing_callback)
+    await mqtt.async_subscribe(hass, "test-topic/+", record_calls)
+
+    for idx in range(3):
+        mqtt_mock._mqtt_on_message(
+            None, None, ReceiveMessage(f"test-topic/{idx}", b"payload", 0, False)
+        )
+    await hass.async_block_till_done()
+
+    assert "Error handling message on test-topic/0" in caplog.text
+    assert [call[0].topic for call in calls] == ["test-topic/1", "test-topic/2"]
+
+    mqtt_mock._mqtt_on_message(
+        None, None, ReceiveMessage("test-topic/3", b"payload", 0, False)
+    )
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+
 async def test_subscribe_topic(hass, mqtt_mock, calls, record_calls):
     """Test the subscription of a topic."""
     unsub = await mqtt.async_subscribe(hass, "test-topic", record_calls)
@@ -689,6 +770,115 @@ async def test_restore_all_active_subscriptions_on_reconnect(
     assert mqtt_client_mock.subscribe.mock_calls == expected
 
 
+async def test_subscriptions_are_batched(hass, mqtt_client_mock, mqtt_mock):
+    """Test subscribe and unsubscribe requests are batched."""
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+
+    unsub_1 = await mqtt.async_subscribe(hass, "test/state_1", None)
+    await mqtt.async_subscribe(hass, "test/state_2", None, qos=1)
+    await hass.async_block_till_done()
+
+    assert mqtt_client_mock.subscribe.mock_calls == [
+        call([("test/state_1", 0), ("test/state_2", 1)])
+    ]
+
+    # Unsubscribing and subscribing again in the same batch cancels out
+    unsub_1()
+    await mqtt.async_subscribe(hass, "test/state_1", None)
+    unsub_2 = await mqtt.async_subscribe(hass, "test/state_3", None)
+    unsub_2()
+    await hass.async_block_till_done()
+
+    assert mqtt_client_mock.unsubscribe.mock_calls == [call("test/state_3")]
+    assert mqtt_client_mock.subscribe.mock_calls == [
+        call([("test/state_1", 0), ("test/state_2", 1)]),
+        call("test/state_1", 0),
+    ]
+
+    metrics = mqtt_mock().subscription_metrics
+    assert metrics.queue_depth == 0
+    assert metrics.max_queue_depth == 2
+    assert metrics.batches == 3
+    assert metrics.batched_topics == 4
+    assert metrics.last_batch_size == 1
+    assert metrics.max_batch_size == 2
+
+
+async def test_pending_subscriptions_dropped_on_disconnect(
+    hass, mqtt_client_mock, mqtt_mock
+):
+    """Test pending subscriptions are not sent while disconnected."""
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+
+    await mqtt.async_subscribe(hass, "test/state", None)
+    mqtt_mock._mqtt_on_disconnect(None, None, 0)
+    await hass.async_block_till_done()
+
+    assert mqtt_client_mock.subscribe.call_count == 0
+    assert mqtt_mock().subscription_metrics.queue_depth == 0
+
+
+async def test_subscription_failure_logged(hass, mqtt_client_mock, mqtt_mock, caplog):
+    """Test a failed batch is logged."""
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+
+    mqtt_client_mock.subscribe.side_effect = lambda *args: (1, 1)
+    await mqtt.async_subscribe(hass, "test/state", None)
+    await hass.async_block_till_done()
+
+    assert "Failed to subscribe to ['test/state']" in caplog.text
+
+
+async def test_failed_subscriptions_retried(hass, mqtt_client_mock, mqtt_mock):
+    """Test the active topics of a failed batch are subscribed to again."""
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+
+    subscribe = mqtt_client_mock.subscribe.side_effect
+    mqtt_client_mock.subscribe.side_effect = lambda *args: (1, 1)
+    await mqtt.async_subscribe(hass, "test/state_1", None, qos=1)
+    unsub = await mqtt.async_subscribe(hass, "test/state_2", None)
+    await hass.async_block_till_done()
+    unsub()
+    await hass.async_block_till_done()
+
+    mqtt_client_mock.subscribe.side_effect = subscribe
+    mqtt_client_mock.subscribe.reset_mock()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+
+    # Topics without subscriptions left are not retried
+    assert mqtt_client_mock.subscribe.mock_calls == [call("test/state_1", 1)]
+
+
+async def test_failed_subscriptions_restored_on_reconnect(
+    hass, mqtt_client_mock, mqtt_mock
+):
+    """Test the retry of a failed batch is replaced by the reconnect."""
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+
+    subscribe = mqtt_client_mock.subscribe.side_effect
+    mqtt_client_mock.subscribe.side_effect = lambda *args: (1, 1)
+    await mqtt.async_subscribe(hass, "test/state", None)
+    await hass.async_block_till_done()
+
+    mqtt_client_mock.subscribe.side_effect = subscribe
+    mqtt_client_mock.subscribe.reset_mock()
+    mqtt_mock._mqtt_on_disconnect(None, None, 0)
+    mqtt_mock._mqtt_on_connect(None, None, None, 0)
+    await hass.async_block_till_done()
+    assert mqtt_client_mock.subscribe.call_count == 1
+    assert ("test/state", 0) in mqtt_client_mock.subscribe.call_args[0][0]
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert mqtt_client_mock.subscribe.call_count == 1
+
+
 async def test_setup_logs_error_if_no_connect_broker(hass, caplog):
     """Test for setup failure if connection to broker is missing."""
     entry = MockConfigEntry(domain=mqtt.DOMAIN, data={mqtt.CONF_BROKER: "test-broker"})
@@ -885,16 +1075,18 @@ async def test_mqtt_subscribes_topics_on_connect(hass, mqtt_client_mock, mqtt_mo
     await mqtt.async_subscribe(hass, "still/pending", None)
     await mqtt.async_subscribe(hass, "still/pending", None, 1)
 
-    hass.add_job = MagicMock()
+    assert mqtt_client_mock.subscribe.call_count == 0
+
     mqtt_mock._mqtt_on_connect(None, None, 0, 0)
 
     await hass.async_block_till_done()
 
     assert mqtt_client_mock.disconnect.call_count == 0
 
+    # All topics are subscribed to in a single batch with the highest qos
     expected = {"topic/test": 0, "home/sensor": 2, "still/pending": 1}
-    calls = {call[1][1]: call[1][2] for call in hass.add_job.mock_calls}
-    assert calls == expected
+    assert mqtt_client_mock.subscribe.call_count == 1
+    assert dict(mqtt_client_mock.subscribe.call_args[0][0]) == expected
 
 
 async def test_setup_fails_without_config(hass):
@@ -994,6 +1186,31 @@ async def test_mqtt_ws_remove_discovered_device(
     assert device_entry is None
 
 
+async def test_mqtt_ws_subscription_metrics(hass, hass_ws_client, mqtt_mock):
+    """Test MQTT websocket subscription metrics."""
+    # Serialize the metrics of the MQTT client instead of the mock wrapping it
+    hass.data["mqtt"] = mqtt_mock()
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+
+    await mqtt.async_subscribe(hass, "test/state_1", None)
+    await mqtt.async_subscribe(hass, "test/state_2", None)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "mqtt/subscription_metrics"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "queue_depth": 0,
+        "max_queue_depth": 2,
+        "batches": 1,
+        "batched_topics": 2,
+        "last_batch_size": 2,
+        "max_batch_size": 2,
+    }
+
+
 async def test_mqtt_ws_remove_discovered_device_twice(
     hass, device_reg, hass_ws_client, mqtt_mock
 ):
@@ -0,0 +1,77 @@
+"""The tests for the MQTT topic trie."""
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    "topic_filter,topic,matches",
+    [
+        ("test/state", "test/state", True),
+        ("test/state", "test/state/", False),
+        ("test/+", "test/state", True),
+        ("test/+", "test/state/other", False),
+        ("test/+/other", "test/state/other", True),
+        ("test/#", "test/state/other", True),
+        ("test/#", "test", True),
+        ("test/#", "other/state", False),
+        ("+/+", "/state", True),
+        ("#", "test/state", True),
+        ("#", "$SYS/uptime", False),
+        ("+/uptime", "$SYS/uptime", False),
+        ("$SYS/#", "$SYS/uptime", True),
+        ("$SYS/+", "$SYS/uptime", True),
+    ],
+)
+def test_match(topic_filter, topic, matches):
+    """Test matching a topic against wildcard and exact topic filters."""
+    trie = TopicTrie()
+    trie.add(topic_filter, "value")
+    assert trie.match(topic) == (("value",) if matches else ())
+
+
+def test_match_order():
+    """Test matches are returned in insertion order."""
+    trie = TopicTrie()
+    trie.add("test/#", 1)
+    trie.add("test/state", 2)
+    trie.add("+/state", 3)
+    trie.add("test/state", 4)
+    trie.add("other/state", 5)
+    assert trie.match("test/state") == (1, 2, 3, 4)
+
+
+def test_add_and_remove_update_cached_matches():
+    """Test cached matches are updated when topic filters are added or removed."""
+    trie = TopicTrie()
+    trie.add("test/state", 1)
+    assert trie.match("test/state") == (1,)
+    assert trie.match("other/state") == ()
+
+    trie.add("+/state", 2)
+    assert trie.match("test/state") == (1, 2)
+    assert trie.match("other/state") == (2,)
+
+    trie.add("other/state", 3)
+    assert trie.match("other/state") == (2, 3)
+
+    trie.remove("+/state", 2)
+    assert trie.match("test/state") == (1,)
+    assert trie.match("other/state") == (3,)
+
+    trie.remove("test/state", 1)
+    assert trie.match("test/state") == ()
+    assert "test/state" not in trie
+    assert "other/state" in trie
+
+    with pytest.raises(KeyError):
+        trie.remove("test/state", 1)
+
+
+def test_cache_size():
+    """Test the cache of matches is bounded."""
+    trie = TopicTrie(cache_size=2)
+    trie.add("#", 1)
+    for idx in range(5):
+        assert trie.match(f"test/{idx}") == (1,)
+    assert len(trie._cache) == 2
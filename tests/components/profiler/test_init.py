@@ -1,9 +1,11 @@
 """Test the Profiler config flow."""
 from datetime import timedelta
 import os
+import time
 from unittest.mock import patch
 
 from homeassistant import setup
+from homeassistant.components import websocket_api
 from homeassistant.components.profiler import (
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
@@ -14,8 +16,14 @@ from homeassistant.components.profiler import (
     SERVICE_START_LOG_OBJECTS,
     SERVICE_STOP_LOG_OBJECTS,
 )
-from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.components.profiler.const import DOMAIN, LOOP_MONITOR
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.core import EXECUTOR_POOL_POLLING
+from homeassistant.helpers.discovery_matcher import (
+    DiscoveryMatcherIndex,
+    get_matcher_stats,
+)
+from homeassistant.helpers.entity_component import async_update_entity
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -192,3 +200,141 @@ async def test_log_scheduled(hass, caplog):
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+def _stall_loop():
+    time.sleep(0.06)
+
+
+async def test_loop_stats(hass, hass_ws_client):
+    """Test the slow callbacks of the event loop are reported."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    hass.loop.call_soon(_stall_loop)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "profiler/loop_stats"})
+    response = await client.receive_json()
+
+    assert response["success"]
+    stats = response["result"]
+    assert stats["handles"] > 0
+    assert stats["slow_callbacks"] >= 1
+    assert stats["max_duration"] >= 0.06
+    histogram = stats["integrations"]["tests"]
+    assert histogram["count"] == 1
+    assert histogram["slowest"] == f"{__name__}._stall_loop"
+    assert histogram["buckets"]["0.1"] == 1
+
+    await async_update_entity(hass, "sensor.profiler_event_loop_slow_callbacks")
+    state = hass.states.get("sensor.profiler_event_loop_slow_callbacks")
+    assert int(state.state) >= 1
+    assert state.attributes["max_duration"] >= 0.06
+    assert "tests" in state.attributes["slowest_integrations"]
+
+    monitor = hass.data[DOMAIN][LOOP_MONITOR]
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    # The loop isn't monitored anymore
+    hass.loop.call_soon(_stall_loop)
+    await hass.async_block_till_done()
+    assert monitor.histograms["tests"].count == 1
+
+    assert DOMAIN not in hass.data
+
+    await client.send_json({"id": 2, "type": "profiler/loop_stats"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"] == {
+        "code": websocket_api.ERR_NOT_FOUND,
+        "message": "Profiler is not loaded",
+    }
+
+
+async def test_executor_stats(hass, hass_ws_client):
+    """Test the metrics of the executor pools are reported."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    await hass.async_add_pool_executor_job(EXECUTOR_POOL_POLLING, time.sleep, 0)
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "profiler/executor_stats"})
+    response = await client.receive_json()
+
+    assert response["success"]
+    polling = response["result"][EXECUTOR_POOL_POLLING]
+    assert polling["submitted"] == 1
+    assert polling["completed"] == 1
+    assert polling["queued"] == 0
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_polling_stats(hass, hass_ws_client):
+    """Test the poll latencies of the entity platforms are reported."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "profiler/polling_stats"})
+    response = await client.receive_json()
+
+    assert response["success"]
+    stats = next(
+        platform for platform in response["result"] if platform["platform"] == DOMAIN
+    )
+    assert stats["domain"] == "sensor"
+    assert stats["config_entry_id"] == entry.entry_id
+    assert stats["polls"] == 1
+    assert stats["skipped"] == 0
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_discovery_stats(hass, hass_ws_client):
+    """Test the counters of the discovery matchers are reported."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    index = DiscoveryMatcherIndex(
+        [{"domain": "axis", "hostname": "axis-*"}],
+        {"hostname": None},
+        stats=get_matcher_stats(hass, "dhcp"),
+    )
+    index.match({"hostname": "axis-1"})
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "profiler/discovery_stats"})
+    response = await client.receive_json()
+
+    assert response["success"]
+    assert response["result"]["dhcp"] == {
+        "lookups": 1,
+        "candidates": 1,
+        "matches": 1,
+        "match_rate": 1.0,
+    }
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
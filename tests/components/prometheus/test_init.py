@@ -9,6 +9,8 @@ from homeassistant.components import climate, humidifier, sensor
 from homeassistant.components.demo.sensor import DemoSensor
 import homeassistant.components.prometheus as prometheus
 from homeassistant.const import (
+    ATTR_FRIENDLY_NAME,
+    ATTR_UNIT_OF_MEASUREMENT,
     CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
     CONTENT_TYPE_TEXT_PLAIN,
     DEGREE,
@@ -417,3 +419,51 @@ async def test_filtered_denylist(hass, mock_client):
         was_called = mock_client.labels.call_count == 1
         assert test.should_pass == was_called
         mock_client.labels.reset_mock()
+
+
+async def test_collect_on_scrape(hass, hass_client):
+    """Test metrics are collected from the states when scraped."""
+    config = {
+        prometheus.DOMAIN: {
+            prometheus.CONF_PROM_NAMESPACE: "scrape",
+            prometheus.CONF_COLLECT_ON_SCRAPE: True,
+        }
+    }
+    assert await async_setup_component(hass, prometheus.DOMAIN, config)
+    hass.states.async_set(
+        "sensor.meter",
+        "74",
+        {ATTR_FRIENDLY_NAME: "Meter", ATTR_UNIT_OF_MEASUREMENT: ENERGY_KILO_WATT_HOUR},
+    )
+    await hass.async_block_till_done()
+    client = await hass_client()
+    labels = 'domain="sensor",entity="sensor.meter",friendly_name="Meter"'
+
+    with mock.patch.object(
+        prometheus.PrometheusMetrics,
+        "_handle_state",
+        autospec=True,
+        side_effect=prometheus.PrometheusMetrics._handle_state,
+    ) as handle_state:
+        body = (await (await client.get(prometheus.API_ENDPOINT)).text()).split("\n")
+        assert f"scrape_sensor_unit_kwh{{{labels}}} 74.0" in body
+        assert f"scrape_state_change_total{{{labels}}} 1.0" in body
+        assert handle_state.call_count == 1
+
+        # States not updated since the last scrape are not rendered again
+        await client.get(prometheus.API_ENDPOINT)
+        assert handle_state.call_count == 1
+
+        hass.states.async_set(
+            "sensor.meter",
+            "75",
+            {
+                ATTR_FRIENDLY_NAME: "Meter",
+                ATTR_UNIT_OF_MEASUREMENT: ENERGY_KILO_WATT_HOUR,
+            },
+        )
+        await hass.async_block_till_done()
+        body = (await (await client.get(prometheus.API_ENDPOINT)).text()).split("\n")
+        assert f"scrape_sensor_unit_kwh{{{labels}}} 75.0" in body
+        assert f"scrape_state_change_total{{{labels}}} 2.0" in body
+        assert handle_state.call_count == 2
@@ -1,5 +1,6 @@
 """The tests for the Recorder component."""
 from datetime import datetime
+import math
 
 import pytest
 from sqlalchemy import create_engine
@@ -40,6 +41,22 @@ def test_from_event_to_db_state():
     assert state == States.from_event(event).to_native()
 
 
+def test_from_event_to_db_state_non_finite_floats():
+    """Test non-finite float attributes are stored like json.dumps does."""
+    state = ha.State("sensor.temperature", "18", {"value": float("nan")})
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+    )
+    db_state = States.from_event(event)
+    assert db_state.attributes == '{"value":NaN}'
+    assert math.isnan(db_state.to_native().attributes["value"])
+
+    # Rows written by json.dumps before
+    db_state.attributes = '{"value": Infinity}'
+    assert db_state.to_native().attributes == {"value": float("inf")}
+
+
 def test_from_event_to_delete_state():
     """Test converting deleting state event to db state."""
     event = ha.Event(
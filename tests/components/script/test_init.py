@@ -24,7 +24,11 @@ from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import bind_hass
 from homeassistant.setup import async_setup_component, setup_component
 
-from tests.common import async_mock_service, get_test_home_assistant
+from tests.common import (
+    async_capture_events,
+    async_mock_service,
+    get_test_home_assistant,
+)
 from tests.components.logbook.test_init import MockLazyEventPartialState
 
 ENTITY_ID = "script.test"
@@ -193,6 +197,53 @@ async def test_setup_with_invalid_configs(hass, value):
     assert len(hass.states.async_entity_ids("script")) == 0
 
 
+async def test_reload_service_only_changed_scripts(hass):
+    """Verify the reload service only replaces the scripts that changed."""
+
+    def script_config(event):
+        return {"sequence": [{"event": event}]}
+
+    assert await async_setup_component(
+        hass,
+        "script",
+        {
+            "script": {
+                "same": script_config("same"),
+                "changed": script_config("old"),
+                "removed": script_config("removed"),
+            }
+        },
+    )
+    component = hass.data[DOMAIN]
+    same = component.get_entity("script.same")
+    changed = component.get_entity("script.changed")
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        return_value={
+            "script": {
+                "added": script_config("added"),
+                "changed": script_config("new"),
+                "same": script_config("same"),
+            }
+        },
+    ):
+        await hass.services.async_call(DOMAIN, SERVICE_RELOAD, blocking=True)
+        await hass.async_block_till_done()
+
+    assert component.get_entity("script.same") is same
+    assert component.get_entity("script.changed") is not changed
+    assert hass.states.get("script.removed") is None
+    assert not hass.services.has_service(DOMAIN, "removed")
+    for object_id in ("same", "changed", "added"):
+        assert hass.states.get(f"script.{object_id}") is not None
+        assert hass.services.has_service(DOMAIN, object_id)
+
+    events = async_capture_events(hass, "new")
+    await hass.services.async_call(DOMAIN, "changed", blocking=True)
+    assert len(events) == 1
+
+
 @pytest.mark.parametrize("running", ["no", "same", "different"])
 async def test_reload_service(hass, running):
     """Verify the reload service."""
@@ -83,7 +83,9 @@ class SaveRecordWorkerSync:
         self._save_thread = None
         self.reset()
 
-    def recorder_save_worker(self, file_out: str, segments: deque[Segment]):
+    def recorder_save_worker(
+        self, file_out: str, segments: deque[Segment], remux: bool = True
+    ):
         """Mock method for patch."""
         logging.debug("recorder_save_worker thread started")
         assert self._save_thread is None
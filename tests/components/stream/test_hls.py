@@ -1,4 +1,5 @@
 """The tests for hls streams."""
+import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import patch
 from urllib.parse import urlparse
@@ -428,3 +429,171 @@ async def test_hls_max_segments_discontinuity(hass, hls_stream, stream_worker_sy
 
     stream_worker_sync.resume()
     stream.stop()
+
+
+def make_part(duration, has_keyframe=False):
+    """Create a part with a fake byte payload."""
+    return Part(duration=duration, has_keyframe=has_keyframe, data=FAKE_PAYLOAD)
+
+
+def make_ll_hls_playlist(sequence, segments, hint):
+    """Create a LL-HLS playlist response for tests to assert on."""
+    playlist = make_playlist(
+        sequence,
+        [
+            "#EXT-X-PART-INF:PART-TARGET=1.000",
+            "#EXT-X-SERVER-CONTROL:CAN-BLOCK-RELOAD=YES,PART-HOLD-BACK=3.000",
+            *segments,
+            f'#EXT-X-PRELOAD-HINT:TYPE=PART,URI="./segment/{hint}.m4s"',
+        ],
+    )
+    return playlist
+
+
+async def test_ll_hls_playlist_view(hass, hls_stream, stream_worker_sync):
+    """Test rendering the LL-HLS playlist with parts of the last two segments."""
+    await async_setup_component(hass, "stream", {"stream": {"ll_hls": True}})
+
+    stream = create_stream(hass, STREAM_SOURCE, {})
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+    for sequence in range(2):
+        segment = Segment(
+            sequence=sequence, duration=SEGMENT_DURATION, start_time=FAKE_TIME
+        )
+        segment.parts = [make_part(0.5, has_keyframe=True), make_part(0.5)]
+        hls.put(segment)
+    segment = Segment(sequence=2, start_time=FAKE_TIME)
+    segment.parts = [make_part(0.5, has_keyframe=True)]
+    hls.put(segment)
+    await hass.async_block_till_done()
+
+    hls_client = await hls_stream(stream)
+
+    resp = await hls_client.get("/playlist.m3u8")
+    assert resp.status == 200
+    assert await resp.text() == make_ll_hls_playlist(
+        sequence=0,
+        segments=[
+            make_segment(0),
+            '#EXT-X-PART:DURATION=0.500,URI="./segment/1.0.m4s",INDEPENDENT=YES',
+            '#EXT-X-PART:DURATION=0.500,URI="./segment/1.1.m4s"',
+            make_segment(1),
+            '#EXT-X-PART:DURATION=0.500,URI="./segment/2.0.m4s",INDEPENDENT=YES',
+        ],
+        hint="2.1",
+    )
+
+    stream_worker_sync.resume()
+    stream.stop()
+
+
+async def test_ll_hls_blocking_playlist_reload(hass, hls_stream, stream_worker_sync):
+    """Test a blocking playlist request is held until the part is available."""
+    await async_setup_component(hass, "stream", {"stream": {"ll_hls": True}})
+
+    stream = create_stream(hass, STREAM_SOURCE, {})
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+    segment = Segment(sequence=0, duration=SEGMENT_DURATION, start_time=FAKE_TIME)
+    segment.parts = [make_part(SEGMENT_DURATION, has_keyframe=True)]
+    hls.put(segment)
+    segment = Segment(sequence=1, start_time=FAKE_TIME)
+    hls.put(segment)
+    await hass.async_block_till_done()
+
+    hls_client = await hls_stream(stream)
+
+    # Parts that are already available are returned immediately
+    resp = await hls_client.get("/playlist.m3u8?_HLS_msn=0&_HLS_part=0")
+    assert resp.status == 200
+
+    request = hass.async_create_task(
+        hls_client.get("/playlist.m3u8?_HLS_msn=1&_HLS_part=0")
+    )
+    done, _ = await asyncio.wait([request], timeout=0.1)
+    assert not done
+
+    segment.parts.append(make_part(0.5, has_keyframe=True))
+    hls.part_put()
+    resp = await request
+    assert resp.status == 200
+    assert '#EXT-X-PART:DURATION=0.500,URI="./segment/1.0.m4s"' in await resp.text()
+
+    # A part past the end of a complete segment waits for the next segment
+    resp = await hls_client.get("/playlist.m3u8?_HLS_msn=0&_HLS_part=5")
+    assert resp.status == 200
+
+    stream_worker_sync.resume()
+    stream.stop()
+
+
+async def test_ll_hls_blocking_playlist_bad_request(
+    hass, hls_stream, stream_worker_sync
+):
+    """Test invalid blocking playlist requests are rejected."""
+    await async_setup_component(hass, "stream", {"stream": {"ll_hls": True}})
+
+    stream = create_stream(hass, STREAM_SOURCE, {})
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+    for sequence in range(2):
+        hls.put(
+            Segment(sequence=sequence, duration=SEGMENT_DURATION, start_time=FAKE_TIME)
+        )
+    await hass.async_block_till_done()
+
+    hls_client = await hls_stream(stream)
+
+    # More than two segments in the future
+    resp = await hls_client.get("/playlist.m3u8?_HLS_msn=4")
+    assert resp.status == 400
+
+    # A part without a segment
+    resp = await hls_client.get("/playlist.m3u8?_HLS_part=1")
+    assert resp.status == 400
+
+    resp = await hls_client.get("/playlist.m3u8?_HLS_msn=one")
+    assert resp.status == 400
+
+    stream_worker_sync.resume()
+    stream.stop()
+
+
+async def test_ll_hls_part_view(hass, hls_stream, stream_worker_sync):
+    """Test fetching parts, including the part advertised by the preload hint."""
+    await async_setup_component(hass, "stream", {"stream": {"ll_hls": True}})
+
+    stream = create_stream(hass, STREAM_SOURCE, {})
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+    segment = Segment(sequence=0, start_time=FAKE_TIME)
+    segment.parts = [make_part(0.5, has_keyframe=True)]
+    hls.put(segment)
+    await hass.async_block_till_done()
+
+    hls_client = await hls_stream(stream)
+
+    resp = await hls_client.get("/segment/0.0.m4s")
+    assert resp.status == 200
+    assert await resp.read() == FAKE_PAYLOAD
+
+    # Parts that are not the next one to be produced are not found
+    resp = await hls_client.get("/segment/0.2.m4s")
+    assert resp.status == 404
+    resp = await hls_client.get("/segment/1.0.m4s")
+    assert resp.status == 404
+
+    # The hinted part is held until it is produced
+    request = hass.async_create_task(hls_client.get("/segment/0.1.m4s"))
+    done, _ = await asyncio.wait([request], timeout=0.1)
+    assert not done
+
+    segment.parts.append(make_part(0.5))
+    hls.part_put()
+    resp = await request
+    assert resp.status == 200
+    assert await resp.read() == FAKE_PAYLOAD
+
+    stream_worker_sync.resume()
+    stream.stop()
@@ -167,6 +167,79 @@ async def test_recorder_discontinuity(tmpdir):
     assert os.path.exists(filename)
 
 
+def make_fragmented_video(source):
+    """Remux source into a fragmented mp4 and return its init and parts."""
+    av_source = av.open(source, "r")
+    output = BytesIO()
+    container = av.open(
+        output,
+        "w",
+        format="mp4",
+        container_options={"movflags": "empty_moov+default_base_moof+frag_keyframe"},
+    )
+    container.add_stream(template=av_source.streams.video[0])
+    for packet in av_source.demux(video=0):
+        if packet.dts is None:
+            continue
+        packet.stream = container.streams.video[0]
+        container.mux(packet)
+    container.close()
+    av_source.close()
+
+    data = output.getvalue()
+    moof_locs = list(find_box(data, b"moof")) + [len(data)]
+    parts = [
+        Part(duration=1, has_keyframe=True, data=data[start:end])
+        for start, end in zip(moof_locs[:-1], moof_locs[1:])
+    ]
+    return data, data[: moof_locs[0]], parts
+
+
+async def test_recorder_save_without_remux(tmpdir):
+    """Test recorder save concatenates the fragments of the segments."""
+    data, init, parts = make_fragmented_video(generate_h264_video())
+    filename = f"{tmpdir}/test.mp4"
+    half = len(parts) // 2
+    segment_1 = Segment(sequence=1, init=init, duration=4, parts=parts[:half])
+    segment_2 = Segment(sequence=2, init=init, duration=4, parts=parts[half:])
+
+    # The repeated segment overlaps with the lookback and is skipped
+    recorder_save_worker(filename, [segment_1, segment_2, segment_2], remux=False)
+
+    with open(filename, "rb") as file:
+        assert file.read() == data
+    result = av.open(filename, "r")
+    assert len(list(result.demux(video=0))) > 1
+    result.close()
+
+
+async def test_recorder_without_remux_discontinuity(tmpdir):
+    """Test recorder save falls back to remuxing across a discontinuity."""
+    _, init, parts = make_fragmented_video(generate_h264_video())
+    filename = f"{tmpdir}/test.mp4"
+    segment_1 = Segment(sequence=1, stream_id=0, init=init, duration=4, parts=parts)
+    segment_2 = Segment(sequence=2, stream_id=1, init=init, duration=4, parts=parts)
+
+    with patch(
+        "homeassistant.components.stream.recorder.write_fragmented_mp4"
+    ) as mock_write, patch(
+        "homeassistant.components.stream.recorder.av.open"
+    ) as mock_open:
+        recorder_save_worker(filename, [segment_1, segment_2], remux=False)
+
+    assert not mock_write.called
+    assert mock_open.called
+
+
+async def test_record_max_lookback(hass):
+    """Test the HLS output keeps enough segments for the configured lookback."""
+    await async_setup_component(hass, "stream", {"stream": {"max_lookback": 20}})
+
+    stream = create_stream(hass, "some-stream-source", {})
+    hls = stream.add_provider(HLS_PROVIDER)
+    assert hls.get_segments().maxlen == 11
+
+
 async def test_recorder_no_segments(tmpdir):
     """Test recorder behavior with a stream failure which causes no segments."""
     # Setup
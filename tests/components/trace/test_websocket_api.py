@@ -4,7 +4,11 @@ import asyncio
 import pytest
 
 from homeassistant.bootstrap import async_setup_component
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace.const import (
+    DATA_TRACE_BUDGET,
+    DEFAULT_MEMORY_BUDGET,
+    DEFAULT_STORED_TRACES,
+)
 from homeassistant.core import Context, callback
 from homeassistant.helpers.typing import UNDEFINED
 
@@ -425,6 +429,118 @@ async def test_trace_overflow(hass, hass_ws_client, domain, stored_traces):
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+async def test_trace_memory_budget(hass, hass_ws_client):
+    """Test the least recently used traces are evicted to stay within budget."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    moon_config = {
+        "id": "moon",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"event": "another_event"},
+    }
+    await _setup_automation_or_script(hass, "automation", [sun_config, moon_config])
+    client = await hass_ws_client()
+
+    await client.send_json({"id": 1, "type": "trace/memory"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "usage": 0,
+        "budget": DEFAULT_MEMORY_BUDGET,
+        "traces": 0,
+    }
+
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("test_event2")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 2, "type": "trace/list", "domain": "automation"})
+    response = await client.receive_json()
+    sun_run_id = _find_run_id(response["result"], "automation", "sun")
+    moon_run_id = _find_run_id(response["result"], "automation", "moon")
+
+    await client.send_json({"id": 3, "type": "trace/memory"})
+    response = await client.receive_json()
+    usage = response["result"]["usage"]
+    assert usage > 0
+    assert response["result"]["traces"] == 2
+
+    # Using the sun trace makes the first moon trace the least recently used
+    hass.data[DATA_TRACE_BUDGET].max_bytes = budget = usage + usage // 4
+    await client.send_json(
+        {
+            "id": 4,
+            "type": "trace/get",
+            "domain": "automation",
+            "item_id": "sun",
+            "run_id": sun_run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["trace"]["action/0"][0]["path"] == "action/0"
+
+    hass.bus.async_fire("test_event2")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 5, "type": "trace/list", "domain": "automation"})
+    response = await client.receive_json()
+    assert len(_find_traces(response["result"], "automation", "sun")) == 1
+    moon_traces = _find_traces(response["result"], "automation", "moon")
+    assert len(moon_traces) == 1
+    assert moon_traces[0]["run_id"] != moon_run_id
+    assert moon_traces[0]["last_step"] == "action/0"
+
+    await client.send_json({"id": 6, "type": "trace/memory"})
+    response = await client.receive_json()
+    assert response["result"]["usage"] <= budget
+    assert response["result"]["traces"] == 2
+
+
+async def test_trace_memory_budget_non_finite_floats(hass, hass_ws_client):
+    """Test traces with non-finite floats are serialized with null."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(hass, "automation", [sun_config])
+    client = await hass_ws_client()
+
+    hass.bus.async_fire("test_event", {"value": float("nan")})
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/memory"})
+    response = await client.receive_json()
+    assert response["result"]["usage"] > 0
+    assert response["result"]["traces"] == 1
+
+    await client.send_json({"id": 2, "type": "trace/list", "domain": "automation"})
+    response = await client.receive_json()
+    assert _find_traces(response["result"], "automation", "sun")[0]["last_step"] == (
+        "action/0"
+    )
+    run_id = _find_traces(response["result"], "automation", "sun")[0]["run_id"]
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "trace/get",
+            "domain": "automation",
+            "item_id": "sun",
+            "run_id": run_id,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["trace"]["trigger/0"][0]["changed_variables"]["trigger"][
+        "event"
+    ]["data"] == {"value": None}
+
+
 @pytest.mark.parametrize("domain", ["automation", "script"])
 async def test_trace_no_traces(hass, hass_ws_client, domain):
     """Test the storing traces for a script or automation can be disabled."""
@@ -412,6 +412,27 @@ async def test_get_states(hass, websocket_client):
     assert msg["result"] == states
 
 
+async def test_states_memory_usage(hass, websocket_client, hass_admin_user):
+    """Test states/memory_usage command."""
+    hass.states.async_set("greeting.hello", "world", {"friendly_name": "Hello"})
+
+    await websocket_client.send_json({"id": 5, "type": "states/memory_usage"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"]["greeting"]["states"] == 1
+    assert msg["result"]["greeting"]["bytes"] > 0
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 6, "type": "states/memory_usage"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_get_services(hass, websocket_client):
     """Test get_services command."""
     await websocket_client.send_json({"id": 5, "type": "get_services"})
@@ -526,15 +547,15 @@ async def test_states_filters_visible(hass, hass_admin_user, websocket_client):
     assert msg["result"][0]["entity_id"] == "test.entity"
 
 
-async def test_get_states_not_allows_nan(hass, websocket_client):
-    """Test get_states command not allows NaN floats."""
+async def test_get_states_nan_as_null(hass, websocket_client):
+    """Test get_states command serializes NaN floats as null."""
     hass.states.async_set("greeting.hello", "world", {"hello": float("NaN")})
 
     await websocket_client.send_json({"id": 5, "type": "get_states"})
 
     msg = await websocket_client.receive_json()
-    assert not msg["success"]
-    assert msg["error"]["code"] == const.ERR_UNKNOWN_ERROR
+    assert msg["success"]
+    assert msg["result"][0]["attributes"] == {"hello": None}
 
 
 async def test_subscribe_unsubscribe_events_whitelist(
@@ -199,6 +199,87 @@ async def test_active_zone_prefers_smaller_zone_if_same_distance_2(hass):
     assert active.entity_id == "zone.smallest_zone"
 
 
+async def test_active_zone_follows_zone_changes(hass):
+    """Test zone states set without the zone integration are followed."""
+    assert zone.async_active_zone(hass, 32.880600, -117.237561) is None
+
+    hass.states.async_set(
+        "zone.work",
+        "zoning",
+        {"latitude": 32.880600, "longitude": -117.237561, "radius": 250},
+    )
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, 32.880600, -117.237561).entity_id == (
+        "zone.work"
+    )
+
+    hass.states.async_set(
+        "zone.work",
+        "zoning",
+        {"latitude": -33.8688, "longitude": 151.2093, "radius": 250},
+    )
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, 32.880600, -117.237561) is None
+    assert zone.async_active_zone(hass, -33.8688, 151.2093).entity_id == "zone.work"
+
+    hass.states.async_remove("zone.work")
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, -33.8688, 151.2093) is None
+
+
+async def test_active_zone_large_zones_and_accuracy(hass):
+    """Test zones and locations covering too many grid cells are still matched."""
+    hass.states.async_set(
+        "zone.country",
+        "zoning",
+        {"latitude": 46.8, "longitude": 8.2, "radius": 200_000},
+    )
+    hass.states.async_set(
+        "zone.village",
+        "zoning",
+        {"latitude": 47.5, "longitude": 8.2, "radius": 1000},
+    )
+    hass.states.async_set(
+        "zone.antimeridian",
+        "zoning",
+        {"latitude": -16.8, "longitude": 179.99, "radius": 5000},
+    )
+    await hass.async_block_till_done()
+
+    assert zone.async_active_zone(hass, 46.0, 8.0).entity_id == "zone.country"
+    # The GPS accuracy reaches the village, which is closer
+    assert zone.async_active_zone(hass, 47.6, 8.2, 12_000).entity_id == ("zone.village")
+    assert zone.async_active_zone(hass, -16.8, -179.99).entity_id == (
+        "zone.antimeridian"
+    )
+
+
+async def test_active_zone_follows_zone_states(hass):
+    """Test zone states written outside the zone entities are indexed."""
+    assert await setup.async_setup_component(hass, zone.DOMAIN, {})
+    await hass.async_block_till_done()
+
+    hass.states.async_set(
+        "zone.work",
+        "zoning",
+        {"latitude": 32.880600, "longitude": -117.237561, "radius": 250},
+    )
+    assert zone.async_active_zone(hass, 32.880600, -117.237561).entity_id == (
+        "zone.work"
+    )
+
+    hass.states.async_set(
+        "zone.work",
+        "zoning",
+        {"latitude": -33.8688, "longitude": 151.2093, "radius": 250},
+    )
+    assert zone.async_active_zone(hass, 32.880600, -117.237561) is None
+    assert zone.async_active_zone(hass, -33.8688, 151.2093).entity_id == "zone.work"
+
+    hass.states.async_remove("zone.work")
+    assert zone.async_active_zone(hass, -33.8688, 151.2093) is None
+
+
 async def test_in_zone_works_for_passive_zones(hass):
     """Test working in passive zones."""
     latitude = 32.880600
@@ -429,6 +510,34 @@ async def test_update(hass, hass_ws_client, storage_setup):
     assert state.attributes["passive"] is True
 
 
+async def test_active_zone_follows_zone_entities(hass, hass_ws_client, storage_setup):
+    """Test the active zone follows zones updated and deleted through the API."""
+    assert await storage_setup()
+    assert zone.async_active_zone(hass, 1, 2).entity_id == "zone.from_storage"
+
+    client = await hass_ws_client(hass)
+    await client.send_json(
+        {
+            "id": 6,
+            "type": f"{DOMAIN}/update",
+            f"{DOMAIN}_id": "from_storage",
+            "latitude": 3,
+            "longitude": 4,
+        }
+    )
+    resp = await client.receive_json()
+    assert resp["success"]
+    assert zone.async_active_zone(hass, 1, 2) is None
+    assert zone.async_active_zone(hass, 3, 4).entity_id == "zone.from_storage"
+
+    await client.send_json(
+        {"id": 7, "type": f"{DOMAIN}/delete", f"{DOMAIN}_id": "from_storage"}
+    )
+    resp = await client.receive_json()
+    assert resp["success"]
+    assert zone.async_active_zone(hass, 3, 4) is None
+
+
 async def test_ws_create(hass, hass_ws_client, storage_setup):
     """Test create WS."""
     assert await storage_setup(items=[])
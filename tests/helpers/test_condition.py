@@ -2863,3 +2863,105 @@ async def test_platform_async_validate_condition_config(hass):
         platform.async_validate_condition_config.return_value = config
         await condition.async_validate_condition_config(hass, config)
         platform.async_validate_condition_config.assert_awaited()
+
+
+async def test_compiled_condition(hass):
+    """Test compiled conditions match traced ones without tracing."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {
+                "condition": "and",
+                "conditions": [
+                    {
+                        "condition": "state",
+                        "entity_id": ["sensor.temperature", "sensor.other"],
+                        "state": "100",
+                    },
+                    "{{ true }}",
+                ],
+            },
+            {
+                "condition": "not",
+                "conditions": [
+                    {
+                        "condition": "or",
+                        "conditions": [
+                            {
+                                "condition": "numeric_state",
+                                "entity_id": "sensor.temperature",
+                                "below": 50,
+                            },
+                            {"condition": "template", "value_template": "false"},
+                        ],
+                    },
+                ],
+            },
+        ],
+    }
+    traced = await condition.async_from_config(hass, config)
+    compiled = await condition.async_compiled_from_config(hass, config)
+
+    for temperature, other, expected in (
+        ("100", "100", True),
+        ("40", "100", False),
+        ("100", "0", False),
+    ):
+        hass.states.async_set("sensor.temperature", temperature)
+        hass.states.async_set("sensor.other", other)
+        trace.trace_clear()
+        assert compiled(hass) is expected
+        assert not trace.trace_get(clear=False)
+        assert traced(hass) is expected
+
+    # Errors are reported like traced conditions
+    hass.states.async_remove("sensor.other")
+    with pytest.raises(ConditionError) as compiled_err:
+        compiled(hass)
+    with pytest.raises(ConditionError) as traced_err:
+        traced(hass)
+    assert str(compiled_err.value) == str(traced_err.value)
+
+    # Recorded runs trace the compiled condition
+    trace.trace_clear()
+    hass.states.async_set("sensor.other", "100")
+    token = trace.trace_id_cv.set((("automation", "test"), "1"))
+    try:
+        assert compiled(hass)
+    finally:
+        trace.trace_id_cv.reset(token)
+    assert "conditions/0/conditions/1" in trace.trace_get(clear=False)
+
+
+async def test_compiled_condition_constants(hass):
+    """Test constant sub conditions decide the result of compiled conditions."""
+    with patch(
+        "homeassistant.helpers.condition.async_template",
+        wraps=condition.async_template,
+    ) as mock_template:
+        test = await condition.async_compiled_from_config(
+            hass,
+            {
+                "condition": "or",
+                "conditions": [
+                    {"condition": "state", "entity_id": "light.missing", "state": "on"},
+                    {"condition": "template", "value_template": "TRUE"},
+                ],
+            },
+        )
+        assert mock_template.call_count == 1
+        assert test(hass)
+        assert test(hass)
+        assert mock_template.call_count == 1
+
+    test = await condition.async_compiled_from_config(
+        hass,
+        {
+            "condition": "not",
+            "conditions": [
+                {"condition": "template", "value_template": "false"},
+                {"condition": "or", "conditions": ["{{ false }}"]},
+            ],
+        },
+    )
+    assert test(hass)
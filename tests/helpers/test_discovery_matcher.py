@@ -0,0 +1,116 @@
+"""Test the discovery matcher index."""
+import pytest
+
+from homeassistant.helpers.discovery_matcher import (
+    DiscoveryMatcherIndex,
+    compile_glob,
+    get_matcher_stats,
+    matcher_stats_as_dict,
+)
+
+
+@pytest.mark.parametrize(
+    "pattern,value,matches",
+    [
+        ("connect", "connect", True),
+        ("connect", "connected", False),
+        ("irobot-*", "irobot-abc", True),
+        ("irobot-*", "roomba", False),
+        ("*", "anything", True),
+        ("axis-00408c*", "axis-00408c1234", True),
+        ("tube*", "tube-123", True),
+        ("b?b*", "bob-123", True),
+        ("[ab]c*", "bcd", True),
+        ("[ab]c*", "ccd", False),
+        ("*shc", "bosch shc", True),
+    ],
+)
+def test_compile_glob(pattern, value, matches):
+    """Test compiled globs match like fnmatch."""
+    assert bool(compile_glob(pattern)(value)) is matches
+
+
+def test_index_matches_in_original_order():
+    """Test matching indexed and unindexed matchers."""
+    matchers = [
+        {"domain": "any"},
+        {"domain": "august", "hostname": "connect", "macaddress": "D86162*"},
+        {"domain": "roomba", "hostname": "irobot-*", "macaddress": "501479*"},
+        {"domain": "hostname_only", "hostname": "irobot-*"},
+        {"domain": "short_mac", "macaddress": "50*"},
+    ]
+    index = DiscoveryMatcherIndex(matchers, {"macaddress": 6})
+    assert len(index) == 5
+
+    assert [
+        matcher["domain"]
+        for matcher in index.match(
+            {"macaddress": "501479ABCDEF", "hostname": "irobot-1"}
+        )
+    ] == ["any", "roomba", "hostname_only", "short_mac"]
+    assert [
+        matcher["domain"]
+        for matcher in index.match(
+            {"macaddress": "D86162ABCDEF", "hostname": "irobot-1"}
+        )
+    ] == ["any", "hostname_only"]
+    assert [matcher["domain"] for matcher in index.match({"hostname": None})] == ["any"]
+
+    # Only the indexed bucket of the MAC address and the 3 unindexed matchers
+    # were tested
+    assert index.stats.lookups == 3
+    assert index.stats.candidates == 4 + 4 + 3
+    assert index.stats.matches == 4 + 2 + 1
+    assert index.stats.match_rate == 7 / 11
+
+
+def test_index_exact_values():
+    """Test matching values for equality instead of globs."""
+    matchers = [
+        {"domain": "axis", "manufacturer": "AXIS"},
+        {"domain": "control4", "st": "c4:director"},
+        {
+            "domain": "denonavr",
+            "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1",
+            "manufacturer": "Denon*",
+        },
+    ]
+    index = DiscoveryMatcherIndex(
+        matchers, {"st": None, "manufacturer": None}, glob=False
+    )
+
+    assert index.match({"st": "c4:director", "manufacturer": "AXIS"}) == matchers[:2]
+    assert index.match({"manufacturer": "AXIS*"}) == []
+    assert (
+        index.match(
+            {
+                "manufacturer": "Denon*",
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1",
+            }
+        )
+        == [matchers[2]]
+    )
+
+
+async def test_matcher_stats_per_source(hass):
+    """Test the indexes of a discovery source share their counters."""
+    assert matcher_stats_as_dict(hass) == {}
+
+    stats = get_matcher_stats(hass, "zeroconf")
+    assert get_matcher_stats(hass, "zeroconf") is stats
+    first = DiscoveryMatcherIndex([{"domain": "axis"}], {"name": None}, stats=stats)
+    second = DiscoveryMatcherIndex(
+        [{"domain": "hue", "name": "philips*"}], {"name": None}, stats=stats
+    )
+
+    assert first.match({"name": "axis-1"}) == [{"domain": "axis"}]
+    assert second.match({"name": "axis-1"}) == []
+
+    assert matcher_stats_as_dict(hass) == {
+        "zeroconf": {
+            "lookups": 2,
+            "candidates": 2,
+            "matches": 1,
+            "match_rate": 0.5,
+        }
+    }
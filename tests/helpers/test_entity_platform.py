@@ -2,12 +2,13 @@
 import asyncio
 from datetime import timedelta
 import logging
-from unittest.mock import Mock, patch
+import threading
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE
-from homeassistant.core import CoreState, callback
+from homeassistant.core import EXECUTOR_POOL_POLLING, CoreState, callback
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import (
     device_registry as dr,
@@ -355,6 +356,159 @@ async def test_parallel_updates_sync_platform_with_constant(hass):
     assert entity.parallel_updates._value == 2
 
 
+async def test_sync_update_executor_pool(hass):
+    """Test sync updates run in the executor pool of the platform."""
+    hass.executor_pools.add("test_pool", 1)
+    platform = MockPlatform()
+    platform.EXECUTOR_POOL = "test_pool"
+
+    mock_entity_platform(hass, "test_domain.platform", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    assert handle.executor_pool == "test_pool"
+
+    threads = []
+
+    class SyncEntity(MockEntity):
+        """Mock entity that has update."""
+
+        def update(self):
+            threads.append(threading.current_thread().name)
+
+    await handle.async_add_entities([SyncEntity()], update_before_add=True)
+    assert threads[0].startswith("SyncWorker-test_pool")
+
+    await component.async_add_entities([SyncEntity()], update_before_add=True)
+    assert threads[1].startswith(f"SyncWorker-{EXECUTOR_POOL_POLLING}")
+
+
+async def test_adaptive_polling_spreads_polls(hass):
+    """Test the polls of entities are spread across the scan interval."""
+    platform = MockPlatform()
+    platform.MAX_SCAN_INTERVAL = timedelta(seconds=60)
+    entity_platform = MockEntityPlatform(
+        hass, platform=platform, scan_interval=timedelta(seconds=20)
+    )
+
+    ent1 = MockEntity(should_poll=True, state="on")
+    ent1.async_update = AsyncMock()
+    ent2 = MockEntity(should_poll=True, state="on")
+    ent2.async_update = AsyncMock()
+    no_poll_ent = MockEntity(should_poll=False)
+    no_poll_ent.async_update = AsyncMock()
+
+    await entity_platform.async_add_entities([ent1, ent2, no_poll_ent])
+
+    now = dt_util.utcnow()
+    async_fire_time_changed(hass, now + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert ent1.async_update.call_count == 1
+    assert ent2.async_update.call_count == 0
+
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert ent1.async_update.call_count == 1
+    assert ent2.async_update.call_count == 1
+    assert not no_poll_ent.async_update.called
+
+    stats = entity_platform.polling_stats
+    assert stats.polls == 2
+    assert stats.intervals == {ent1.entity_id: 20, ent2.entity_id: 20}
+
+    entity_platform.async_unsub_polling()
+    async_fire_time_changed(hass, now + timedelta(seconds=60))
+    await hass.async_block_till_done()
+    assert ent1.async_update.call_count == 1
+    assert stats.intervals == {}
+
+
+async def test_adaptive_polling_intervals(hass):
+    """Test the intervals of entities adapt to their changes and errors."""
+    platform = MockPlatform()
+    platform.MIN_SCAN_INTERVAL = timedelta(seconds=10)
+    platform.MAX_SCAN_INTERVAL = timedelta(seconds=40)
+    entity_platform = MockEntityPlatform(
+        hass, platform=platform, scan_interval=timedelta(seconds=20)
+    )
+
+    ent = MockEntity(should_poll=True, state="on")
+    ent.async_update = AsyncMock()
+    await entity_platform.async_add_entities([ent])
+    stats = entity_platform.polling_stats
+
+    now = dt_util.utcnow()
+    for elapsed in (20, 40, 60):
+        async_fire_time_changed(hass, now + timedelta(seconds=elapsed))
+        await hass.async_block_till_done()
+    # Backs off after repeatedly unchanged states
+    assert ent.async_update.call_count == 3
+    assert stats.intervals[ent.entity_id] == 30
+
+    ent._values["state"] = "off"
+    async_fire_time_changed(hass, now + timedelta(seconds=90))
+    await hass.async_block_till_done()
+    # Speeds up after a change
+    assert ent.async_update.call_count == 4
+    assert stats.changed == 1
+    assert stats.intervals[ent.entity_id] == 15
+
+    ent.async_update.side_effect = HomeAssistantError("Update failed")
+    async_fire_time_changed(hass, now + timedelta(seconds=105))
+    await hass.async_block_till_done()
+    assert stats.errors == 1
+    assert stats.intervals[ent.entity_id] == 30
+
+    async_fire_time_changed(hass, now + timedelta(seconds=135))
+    await hass.async_block_till_done()
+    # Bounded by the maximum interval
+    assert stats.errors == 2
+    assert stats.intervals[ent.entity_id] == 40
+
+    ent.async_update.side_effect = None
+    ent._values["state"] = "on"
+    async_fire_time_changed(hass, now + timedelta(seconds=175))
+    await hass.async_block_till_done()
+    assert ent.async_update.call_count == 7
+    assert stats.intervals[ent.entity_id] == 20
+    assert stats.as_dict()["polls"] == 7
+
+    await entity_platform.async_reset()
+
+
+async def test_polling_stats_count_skipped_updates(hass, caplog):
+    """Test skipped polls of slow updates are counted."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    update_started = asyncio.Event()
+    finish_update = asyncio.Event()
+
+    async def slow_update():
+        update_started.set()
+        await finish_update.wait()
+
+    ent = MockEntity(should_poll=True)
+    ent.async_update = slow_update
+    await component.async_add_entities([ent])
+    stats = ent.platform.polling_stats
+
+    now = dt_util.utcnow()
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await update_started.wait()
+    async_fire_time_changed(hass, now + timedelta(seconds=40))
+    await asyncio.sleep(0)
+    assert stats.skipped == 1
+    assert "took longer than the scheduled update interval" in caplog.text
+
+    finish_update.set()
+    await hass.async_block_till_done()
+    assert stats.polls == 1
+
+
 async def test_raise_error_on_update(hass):
     """Test the add entity if they raise an error on update."""
     updates = []
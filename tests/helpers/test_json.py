@@ -1,10 +1,19 @@
 """Test Home Assistant remote methods and classes."""
 from datetime import timedelta
+import json
+import math
+from unittest.mock import patch
 
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder
+from homeassistant.helpers import json as json_helper
+from homeassistant.helpers.json import (
+    ExtendedJSONEncoder,
+    JSONEncoder,
+    json_dumps,
+    json_loads,
+)
 from homeassistant.util import dt as dt_util
 
 
@@ -63,3 +72,99 @@ def test_trace_json_encoder(hass):
     # Default method falls back to repr(o)
     o = object()
     assert ha_json_enc.default(o) == {"__type": str(type(o)), "repr": repr(o)}
+
+
+def test_json_dumps_matches_stdlib():
+    """Test the codec serializes Home Assistant objects like the stdlib."""
+    now = dt_util.utcnow()
+    context = core.Context()
+    state = core.State(
+        "light.kitchen",
+        "on",
+        {"friendly_name": "Küche", "rgb_color": (255, 0, 0), "effects": {"rainbow"}},
+        last_changed=now,
+        context=context,
+    )
+    data = {
+        "state": state,
+        "event": core.Event("test_event", {"when": now}, context=context),
+        "attributes": state.attributes,
+        "when": now,
+        "values": [1, 2.5, True, "text"],
+        1: "non string key",
+    }
+
+    assert json_dumps(data) == json.dumps(
+        data, cls=JSONEncoder, separators=(",", ":"), ensure_ascii=False
+    )
+    assert json_dumps({"value": None}) == '{"value":null}'
+
+
+def test_json_dumps_unsupported_by_orjson():
+    """Test data orjson can't serialize falls back to the stdlib."""
+    assert json_dumps({"big": 2 ** 70}) == '{"big":1180591620717411303424}'
+
+    with pytest.raises(TypeError):
+        json_dumps({"value": object()})
+
+
+@pytest.mark.parametrize("installed", [True, False])
+def test_json_dumps_non_finite_floats(installed):
+    """Test non-finite floats are written as null, or like the stdlib."""
+    with patch(
+        "homeassistant.helpers.json.orjson",
+        json_helper.orjson if installed else None,
+    ):
+        assert json_dumps({"value": float("nan")}) == '{"value":null}'
+
+        state = core.State("sensor.test", "on", {"value": float("-inf")})
+        assert json.loads(json_dumps([state]))[0]["attributes"] == {"value": None}
+
+        assert (
+            json_dumps([float("nan"), float("inf"), None], allow_nan=True)
+            == "[NaN,Infinity,null]"
+        )
+
+
+def test_json_dumps_without_orjson():
+    """Test the stdlib serializes data like orjson when it isn't installed."""
+    now = dt_util.utcnow()
+    data = {
+        "state": core.State("light.kitchen", "on", {"name": "Küche"}, now),
+        "values": [1, 2.5, None, {"set"}],
+        1: "non string key",
+    }
+    with patch("homeassistant.helpers.json.orjson", None):
+        dumped = json_dumps(data)
+        assert json_loads(dumped) == json.loads(dumped)
+    assert dumped == json_dumps(data)
+
+
+def test_json_loads():
+    """Test loading JSON."""
+    assert json_loads('{"a": [1, "b"]}') == {"a": [1, "b"]}
+    assert json_loads(b"[1]") == [1]
+
+    values = json_loads('{"nan": NaN, "inf": -Infinity}')
+    assert math.isnan(values["nan"])
+    assert values["inf"] == float("-inf")
+
+    with pytest.raises(ValueError):
+        json_loads("{invalid")
+
+
+def test_json_dumps_extended():
+    """Test extended json_dumps serializes like ExtendedJSONEncoder."""
+    data = {
+        "delta": timedelta(seconds=5),
+        "object": object,
+        "state": core.State("test.test", "hello"),
+    }
+    assert json.loads(json_dumps(data, extended=True)) == json.loads(
+        json.dumps(data, cls=ExtendedJSONEncoder)
+    )
+    with pytest.raises(TypeError):
+        json_dumps(data)
+    assert json.loads(
+        json_dumps({"value": float("nan"), "object": object}, extended=True)
+    ) == {"value": None, "object": {"__type": str(type(object)), "repr": repr(object)}}
@@ -9,6 +9,7 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE_TASK,
     STORAGE_KEY,
+    STORAGE_KEY_DELTA,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -222,6 +223,7 @@ async def test_dump_data(hass):
     await entity.async_internal_added_to_hass()
 
     data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
     now = dt_util.utcnow()
     data.last_states = {
         "input_boolean.b0": StoredState(State("input_boolean.b0", "off"), now),
@@ -266,14 +268,12 @@ async def test_dump_data(hass):
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         await data.async_dump_states()
 
+    # Only the removal is written
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
-    assert len(written_states) == 2
-    assert written_states[0]["state"]["entity_id"] == "input_boolean.b3"
-    assert written_states[0]["state"]["state"] == "off"
-    assert written_states[1]["state"]["entity_id"] == "input_boolean.b5"
-    assert written_states[1]["state"]["state"] == "off"
+    written_delta = args[0]
+    assert written_delta["states"] == []
+    assert list(written_delta["removed"]) == ["input_boolean.b1"]
 
 
 async def test_dump_error(hass):
@@ -375,3 +375,99 @@ async def test_restoring_invalid_entity_id(hass, hass_storage):
 
     state = await entity.async_get_last_state()
     assert state is None
+
+
+async def test_dump_changed_states(hass, hass_storage):
+    """Test only the states changed since all states were written are saved."""
+    for entity_id in ("input_boolean.b0", "input_boolean.b1", "input_boolean.b2"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        await entity.async_internal_added_to_hass()
+        hass.states.async_set(entity_id, "on")
+
+    data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+    await data.async_dump_states()
+    assert [item["state"]["state"] for item in hass_storage[STORAGE_KEY]["data"]] == [
+        "on",
+        "on",
+        "on",
+    ]
+    assert STORAGE_KEY_DELTA not in hass_storage
+
+    hass.states.async_set("input_boolean.b1", "off")
+    with patch(
+        "homeassistant.helpers.restore_state.StoredState", wraps=StoredState
+    ) as mock_stored_state:
+        await data.async_dump_states()
+    # Only the changed state is turned into a stored state
+    assert mock_stored_state.call_count == 1
+    assert [item["state"]["state"] for item in hass_storage[STORAGE_KEY]["data"]] == [
+        "on",
+        "on",
+        "on",
+    ]
+    delta = hass_storage[STORAGE_KEY_DELTA]["data"]
+    assert [item["state"]["entity_id"] for item in delta["states"]] == [
+        "input_boolean.b1"
+    ]
+    assert delta["states"][0]["state"]["state"] == "off"
+    assert delta["removed"] == {}
+
+    # Emulate a fresh load, the changed states are applied
+    entity_ids = data.entity_ids
+    hass.data[DATA_RESTORE_STATE_TASK] = None
+    data = await RestoreStateData.async_get_instance(hass)
+    assert data.last_states["input_boolean.b1"].state.state == "off"
+    assert data.last_states["input_boolean.b2"].state.state == "on"
+    data.entity_ids = entity_ids
+    await hass.async_block_till_done()
+
+    # All states are written again once enough of them changed
+    hass.states.async_set("input_boolean.b2", "off")
+    await data.async_dump_states()
+    assert STORAGE_KEY_DELTA in hass_storage
+    hass.states.async_set("input_boolean.b0", "off")
+    await data.async_dump_states()
+    assert STORAGE_KEY_DELTA not in hass_storage
+    assert [item["state"]["state"] for item in hass_storage[STORAGE_KEY]["data"]] == [
+        "off",
+        "off",
+        "off",
+    ]
+
+
+async def test_restore_changed_and_removed_states(hass, hass_storage):
+    """Test changed and removed states are applied by the most recently seen."""
+    older = datetime(2021, 1, 1, tzinfo=dt_util.UTC)
+    newer = datetime(2021, 1, 2, tzinfo=dt_util.UTC)
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            StoredState(State(f"input_boolean.b{idx}", "on"), newer).as_dict()
+            for idx in range(4)
+        ],
+    }
+    hass_storage[STORAGE_KEY_DELTA] = {
+        "version": 1,
+        "key": STORAGE_KEY_DELTA,
+        "data": {
+            "states": [
+                StoredState(State("input_boolean.b0", "off"), older).as_dict(),
+                StoredState(State("input_boolean.b1", "off"), newer).as_dict(),
+            ],
+            "removed": {
+                "input_boolean.b2": older.isoformat(),
+                "input_boolean.b3": newer.isoformat(),
+            },
+        },
+    }
+
+    data = await RestoreStateData.async_get_instance(hass)
+    assert len(data.last_states) == 3
+    assert data.last_states["input_boolean.b0"].state.state == "on"
+    assert data.last_states["input_boolean.b1"].state.state == "off"
+    assert data.last_states["input_boolean.b2"].state.state == "on"
+    assert "input_boolean.b3" not in data.last_states
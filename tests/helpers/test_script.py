@@ -39,8 +39,9 @@ ENTITY_ID = "script.test"
 
 @pytest.fixture(autouse=True)
 def prepare_tracing():
-    """Prepare tracing."""
+    """Prepare tracing, the runs are recorded like those of scripts."""
     trace.trace_get()
+    trace.trace_id_set((("script", "test"), "test"))
 
 
 def compare_trigger_item(actual_trigger, expected_trigger):
@@ -1526,6 +1527,48 @@ async def test_condition_all_cached(hass):
     assert len(script_obj._config_cache) == 2
 
 
+async def test_condition_compiled_unless_recorded(hass):
+    """Test conditions are only evaluated the traced way in recorded runs."""
+    event = "test_event"
+    events = async_capture_events(hass, event)
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"condition": "state", "entity_id": "test.entity", "state": "hello"},
+            {"event": event},
+        ]
+    )
+    script_obj = script.Script(
+        hass, sequence, "Test Name", "test_domain", script_mode="parallel"
+    )
+    traced_checkers = []
+    from_config = script.condition.async_from_config
+
+    async def async_traced_from_config(*args):
+        checker = mock.Mock(wraps=await from_config(*args))
+        traced_checkers.append(checker)
+        return checker
+
+    hass.states.async_set("test.entity", "hello")
+    token = trace.trace_id_cv.set(None)
+    try:
+        with patch(
+            "homeassistant.helpers.condition.async_from_config",
+            async_traced_from_config,
+        ):
+            await script_obj.async_run(context=Context())
+            await hass.async_block_till_done()
+    finally:
+        trace.trace_id_cv.reset(token)
+    assert len(events) == 1
+    assert len(traced_checkers) == 1
+    assert traced_checkers[0].call_count == 0
+
+    await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+    assert len(events) == 2
+    assert traced_checkers[0].call_count == 1
+
+
 @pytest.mark.parametrize("count", [3, script.ACTION_TRACE_NODE_MAX_LEN * 2])
 async def test_repeat_count(hass, caplog, count):
     """Test repeat action w/ count option."""
@@ -2094,6 +2137,7 @@ async def test_choose(hass, caplog, var, result):
         {"repeat": {"count": 1, "sequence": {"event": "abc"}}},
         {"choose": {"conditions": [], "sequence": {"event": "abc"}}},
         {"choose": [], "default": {"event": "abc"}},
+        {"parallel": {"event": "abc"}},
     ],
 )
 async def test_multiple_runs_repeat_choose(hass, caplog, action):
@@ -2118,6 +2162,147 @@ async def test_multiple_runs_repeat_choose(hass, caplog, action):
     assert len(events) == max_runs
 
 
+async def test_parallel(hass, caplog):
+    """Test parallel action."""
+    events = async_capture_events(hass, "test_event")
+    release = asyncio.Event()
+
+    async def async_block(call):
+        await release.wait()
+
+    hass.services.async_register("test", "block", async_block)
+
+    sequence = cv.SCRIPT_SCHEMA(
+        {
+            "alias": "parallel step",
+            "parallel": [
+                {
+                    "alias": "blocked sequence",
+                    "sequence": [
+                        {"service": "test.block"},
+                        {"event": "test_event", "event_data": {"from": 1}},
+                    ],
+                },
+                {"event": "test_event", "event_data": {"from": "{{ what }}"}},
+            ],
+        }
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    run_task = hass.async_create_task(
+        script_obj.async_run(MappingProxyType({"what": 2}), Context())
+    )
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert script_obj.is_running
+    assert [event.data["from"] for event in events] == [2]
+
+    release.set()
+    await run_task
+    await hass.async_block_till_done()
+
+    assert not script_obj.is_running
+    assert [event.data["from"] for event in events] == [2, 1]
+    assert "parallel step: blocked sequence: Executing step call service" in (
+        caplog.text
+    )
+
+    expected_trace = {
+        "0": [{}],
+        "0/parallel/0/sequence/0": [
+            {
+                "result": {
+                    "limit": SERVICE_CALL_LIMIT,
+                    "params": {
+                        "domain": "test",
+                        "service": "block",
+                        "service_data": {},
+                        "target": {},
+                    },
+                    "running_script": False,
+                }
+            }
+        ],
+        "0/parallel/1/sequence/0": [
+            {"result": {"event": "test_event", "event_data": {"from": 2}}}
+        ],
+        "0/parallel/0/sequence/1": [
+            {"result": {"event": "test_event", "event_data": {"from": 1}}}
+        ],
+    }
+    assert_action_trace(expected_trace)
+
+
+async def test_parallel_variables(hass):
+    """Test parallel sequences don't share the variables they set."""
+    events = async_capture_events(hass, "test_event")
+    sequence = cv.SCRIPT_SCHEMA(
+        {
+            "parallel": [
+                [
+                    {"variables": {"value": "first"}},
+                    {"event": "test_event", "event_data": {"value": "{{ value }}"}},
+                ],
+                [
+                    {"variables": {"value": "second"}},
+                    {"event": "test_event", "event_data": {"value": "{{ value }}"}},
+                ],
+            ]
+        }
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    await script_obj.async_run(MappingProxyType({"value": "initial"}), Context())
+    await hass.async_block_till_done()
+
+    assert sorted(event.data["value"] for event in events) == ["first", "second"]
+
+
+async def test_parallel_stop(hass):
+    """Test stopping a script stops its parallel sequences."""
+    events = async_capture_events(hass, "test_event")
+    sequence = cv.SCRIPT_SCHEMA(
+        {
+            "parallel": [
+                [{"delay": "00:10:00"}, {"event": "test_event"}],
+                [{"delay": "00:20:00"}, {"event": "test_event"}],
+            ]
+        }
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+    wait_started_flag = async_watch_for_action(script_obj, "delay")
+
+    hass.async_create_task(script_obj.async_run(context=Context()))
+    await asyncio.wait_for(wait_started_flag.wait(), 1)
+    assert script_obj.is_running
+
+    await script_obj.async_stop()
+    await hass.async_block_till_done()
+
+    assert not script_obj.is_running
+    assert len(events) == 0
+
+
+async def test_parallel_error(hass):
+    """Test an error in a parallel sequence is raised once the others finish."""
+    events = async_capture_events(hass, "test_event")
+    sequence = cv.SCRIPT_SCHEMA(
+        {
+            "parallel": [
+                {"service": "test.not_registered"},
+                {"event": "test_event"},
+            ]
+        }
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with pytest.raises(exceptions.ServiceNotFound):
+        await script_obj.async_run(context=Context())
+
+    assert len(events) == 1
+
+
 async def test_last_triggered(hass):
     """Test the last_triggered."""
     event = "test_event"
@@ -2901,6 +3086,9 @@ async def test_validate_action_config(hass):
             ]
         },
         cv.SCRIPT_ACTION_VARIABLES: {"variables": {"hello": "world"}},
+        cv.SCRIPT_ACTION_PARALLEL: {
+            "parallel": [{"sequence": [{"event": "parallel_event"}]}]
+        },
     }
 
     for key in cv.ACTION_TYPE_SCHEMAS:
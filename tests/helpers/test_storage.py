@@ -2,6 +2,7 @@
 import asyncio
 from datetime import timedelta
 import json
+import os
 from unittest.mock import Mock, patch
 
 import pytest
@@ -11,6 +12,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
 )
 from homeassistant.core import CoreState
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import storage
 from homeassistant.util import dt
 
@@ -279,3 +281,137 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+@pytest.fixture
+def journaled_store(hass, tmp_path):
+    """Fixture of a journaled store writing to a temporary directory."""
+    hass.config.config_dir = str(tmp_path)
+    yield storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+
+
+async def test_journaled_store(hass, journaled_store):
+    """Test changes are appended to the journal and replayed on load."""
+    assert await journaled_store.async_load() is None
+    journaled_store.async_upsert("a", {"value": 1})
+    journaled_store.async_upsert("b", {"value": 2})
+    journaled_store.async_delete("a")
+    await journaled_store.async_flush()
+
+    with open(journaled_store.journal_path) as journal:
+        assert [json.loads(line) for line in journal] == [
+            [1, "upsert", "a", {"value": 1}],
+            [2, "upsert", "b", {"value": 2}],
+            [3, "delete", "a"],
+        ]
+
+    store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+    assert await store.async_load() == {"b": {"value": 2}}
+    store.async_upsert("c", 3)
+    await store.async_flush()
+
+    store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+    assert await store.async_load() == {"b": {"value": 2}, "c": 3}
+
+
+async def test_journaled_store_must_be_loaded(hass, journaled_store):
+    """Test changes can't be made before the items are loaded."""
+    with pytest.raises(HomeAssistantError):
+        journaled_store.async_upsert("a", 1)
+
+
+async def test_journaled_store_compaction(hass, journaled_store):
+    """Test the journal is compacted into the stored items."""
+    await journaled_store.async_load()
+    with patch.object(storage, "JOURNAL_COMPACT_MIN", 2):
+        for idx in range(3):
+            journaled_store.async_upsert("a", idx)
+        await journaled_store.async_flush()
+
+    with open(journaled_store.path) as stored:
+        data = json.load(stored)
+    assert data["journal_seq"] == 3
+    assert data["data"] == {"a": 2}
+    assert os.path.getsize(journaled_store.journal_path) == 0
+
+    store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+    assert await store.async_load() == {"a": 2}
+
+
+async def test_journaled_store_replay(hass, journaled_store):
+    """Test compacted and incomplete journal operations are ignored."""
+    os.makedirs(os.path.dirname(journaled_store.path))
+    with open(journaled_store.path, "w") as stored:
+        json.dump(
+            {
+                "version": MOCK_VERSION,
+                "key": MOCK_KEY,
+                "journal_seq": 2,
+                "data": {"a": 2, "b": 1},
+            },
+            stored,
+        )
+    with open(journaled_store.journal_path, "w") as journal:
+        journal.write('[1, "upsert", "a", 1]\n')
+        journal.write('[2, "upsert", "a", 2]\n')
+        journal.write('[3, "delete", "b"]\n')
+        journal.write('[4, "upsert", "c"')
+
+    assert await journaled_store.async_load() == {"a": 2}
+
+    # The incomplete entry is dropped, so later operations are replayed
+    journaled_store.async_upsert("d", 4)
+    await journaled_store.async_flush()
+    store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+    assert await store.async_load() == {"a": 2, "d": 4}
+
+
+async def test_journaled_store_missing_newline(hass, journaled_store):
+    """Test operations are appended after a complete entry without newline."""
+    os.makedirs(os.path.dirname(journaled_store.path))
+    with open(journaled_store.journal_path, "w") as journal:
+        journal.write('[1, "upsert", "a", 1]')
+
+    assert await journaled_store.async_load() == {"a": 1}
+    journaled_store.async_upsert("b", 2)
+    await journaled_store.async_flush()
+
+    store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+    assert await store.async_load() == {"a": 1, "b": 2}
+
+
+async def test_journaled_store_corrupt(hass, journaled_store):
+    """Test a journal corrupted before its last entry isn't loaded."""
+    os.makedirs(os.path.dirname(journaled_store.path))
+    with open(journaled_store.journal_path, "w") as journal:
+        journal.write('[1, "upsert", "a", 1]\n')
+        journal.write('[2, "upsert"\n')
+        journal.write('[3, "upsert", "b", 2]\n')
+
+    with pytest.raises(HomeAssistantError):
+        await journaled_store.async_load()
+
+
+async def test_journaled_store_delay_save(hass, journaled_store):
+    """Test delayed saves journal the changed items."""
+    items = {"a": {"value": 1}, "b": {"value": 2}}
+    journaled_store.async_delay_save(lambda: items, 1)
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    items["a"]["value"] = 3
+    del items["b"]
+    journaled_store.async_delay_save(lambda: items, 1)
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    with open(journaled_store.journal_path) as journal:
+        assert [json.loads(line) for line in journal] == [
+            [1, "upsert", "a", {"value": 1}],
+            [2, "upsert", "b", {"value": 2}],
+            [3, "delete", "b"],
+            [4, "upsert", "a", {"value": 3}],
+        ]
+
+    store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+    assert await store.async_load() == {"a": {"value": 3}}
@@ -2,6 +2,7 @@
 # pylint: disable=protected-access
 from collections import OrderedDict
 import copy
+from datetime import timedelta
 import os
 from unittest import mock
 from unittest.mock import AsyncMock, Mock, patch
@@ -28,14 +29,22 @@ from homeassistant.const import (
     __version__,
 )
 from homeassistant.core import SOURCE_STORAGE, HomeAssistantError
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import config_validation as cv, validation_cache
 import homeassistant.helpers.check_config as check_config
 from homeassistant.helpers.entity import Entity
 from homeassistant.loader import async_get_integration
 from homeassistant.util import dt as dt_util
 from homeassistant.util.yaml import SECRET_YAML
 
-from tests.common import get_test_config_dir, patch_yaml_files
+from tests.common import (
+    MockModule,
+    MockPlatform,
+    async_fire_time_changed,
+    get_test_config_dir,
+    mock_entity_platform,
+    mock_integration,
+    patch_yaml_files,
+)
 
 CONFIG_DIR = get_test_config_dir()
 YAML_PATH = os.path.join(CONFIG_DIR, config_util.YAML_CONFIG_FILE)
@@ -1190,3 +1199,175 @@ def test_identify_config_schema(domain, schema, expected):
         config_util._identify_config_schema(Mock(DOMAIN=domain, CONFIG_SCHEMA=schema))
         == expected
     )
+
+
+@pytest.fixture
+def release_version():
+    """Run the validation cache as on a release of Home Assistant."""
+    with patch("homeassistant.helpers.validation_cache.__version__", "2021.9.0"):
+        yield
+
+
+async def test_component_config_validation_cache(hass, hass_storage, release_version):
+    """Test unchanged config blocks are validated once."""
+    config_schema = Mock(
+        wraps=vol.Schema(
+            {"test_domain": vol.Schema({vol.Required("name"): cv.string})},
+            extra=vol.ALLOW_EXTRA,
+        )
+    )
+    integration = mock_integration(
+        hass, MockModule("test_domain", config_schema=config_schema)
+    )
+
+    config = {"test_domain": {"name": "hello"}, "other": {"value": 1}}
+    validated = await config_util.async_process_component_config(
+        hass, config, integration
+    )
+    assert validated == config
+    validated["test_domain"]["name"] = "changed"
+
+    assert await config_util.async_process_component_config(
+        hass, config, integration
+    ) == {"test_domain": {"name": "hello"}, "other": {"value": 1}}
+    assert config_schema.call_count == 1
+
+    # Changed blocks are validated and report their errors
+    config["test_domain"]["name"] = ["invalid"]
+    assert (
+        await config_util.async_process_component_config(hass, config, integration)
+        is None
+    )
+    assert config_schema.call_count == 2
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert list(hass_storage["core.config_validation"]["data"]["blocks"].values()) == [
+        {"test_domain": {"name": "hello"}}
+    ]
+
+
+async def test_platform_config_validation_cache(hass, release_version):
+    """Test unchanged platform blocks made of JSON types are validated once."""
+    schema = cv.PLATFORM_SCHEMA.extend(
+        {vol.Optional("value"): cv.string, vol.Optional("delay"): cv.time_period}
+    )
+    component_schema = Mock(wraps=schema)
+    platform_schema = Mock(wraps=schema)
+    integration = mock_integration(
+        hass, MockModule("test_domain", platform_schema=component_schema)
+    )
+    mock_entity_platform(
+        hass, "test_domain.test_platform", MockPlatform(platform_schema=platform_schema)
+    )
+
+    config = {
+        "test_domain": [
+            {"platform": "test_platform", "value": 1},
+            {"platform": "test_platform", "delay": 5},
+        ]
+    }
+    for _ in range(2):
+        assert await config_util.async_process_component_config(
+            hass, config, integration
+        ) == {
+            "test_domain": [
+                {"platform": "test_platform", "value": "1"},
+                {"platform": "test_platform", "delay": timedelta(seconds=5)},
+            ]
+        }
+    assert component_schema.call_count == 3
+    assert platform_schema.call_count == 3
+
+
+async def test_config_validation_cache_dev_version(hass, hass_storage):
+    """Test config blocks aren't cached on development versions."""
+    config_schema = Mock(
+        wraps=vol.Schema({"test_domain": {"name": cv.string}}, extra=vol.ALLOW_EXTRA)
+    )
+    integration = mock_integration(
+        hass, MockModule("test_domain", config_schema=config_schema)
+    )
+
+    config = {"test_domain": {"name": "hello"}}
+    with patch("homeassistant.helpers.validation_cache.__version__", "2021.9.0.dev0"):
+        for _ in range(2):
+            assert (
+                await config_util.async_process_component_config(
+                    hass, config, integration
+                )
+                == config
+            )
+    assert config_schema.call_count == 2
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert "core.config_validation" not in hass_storage
+
+
+async def test_config_validation_cache_system_dependent(
+    hass, tmp_path, release_version
+):
+    """Test config blocks checking the system aren't cached."""
+    config_schema = Mock(
+        wraps=vol.Schema({"test_domain": {"path": cv.isfile}}, extra=vol.ALLOW_EXTRA)
+    )
+    integration = mock_integration(
+        hass, MockModule("test_domain", config_schema=config_schema)
+    )
+
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("test")
+    config = {"test_domain": {"path": str(test_file)}}
+    assert (
+        await config_util.async_process_component_config(hass, config, integration)
+        == config
+    )
+
+    test_file.unlink()
+    assert (
+        await config_util.async_process_component_config(hass, config, integration)
+        is None
+    )
+    assert config_schema.call_count == 2
+
+
+async def test_config_validation_cache_deprecated(hass, caplog, release_version):
+    """Test config blocks with deprecated options log their warning every time."""
+    schema = vol.All(
+        cv.deprecated("old_name"),
+        cv.PLATFORM_SCHEMA.extend(
+            {vol.Optional("old_name"): cv.string, vol.Optional("name"): cv.string}
+        ),
+    )
+    component_schema = Mock(wraps=schema)
+    integration = mock_integration(
+        hass, MockModule("test_domain", platform_schema=component_schema)
+    )
+    mock_entity_platform(hass, "test_domain.test_platform", MockPlatform())
+
+    config = {
+        "test_domain": [
+            {"platform": "test_platform", "old_name": "hello"},
+            {"platform": "test_platform", "name": "hello"},
+        ]
+    }
+    for _ in range(2):
+        caplog.clear()
+        assert (
+            await config_util.async_process_component_config(hass, config, integration)
+            == config
+        )
+        assert "The 'old_name' option is deprecated" in caplog.text
+    assert component_schema.call_count == 3
+
+
+def test_config_validation_cache_source_fingerprint(tmp_path):
+    """Test the fingerprint of an integration changes with its sources."""
+    (tmp_path / "__init__.py").write_text("CONFIG_SCHEMA = None")
+    fingerprint = validation_cache._source_fingerprint(tmp_path)
+    assert validation_cache._source_fingerprint(tmp_path) == fingerprint
+
+    (tmp_path / "__init__.py").write_text("CONFIG_SCHEMA = vol.Schema({})")
+    assert validation_cache._source_fingerprint(tmp_path) != fingerprint
+    assert validation_cache._source_fingerprint(None) == ""
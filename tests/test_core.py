@@ -6,6 +6,7 @@ import functools
 import logging
 import os
 from tempfile import TemporaryDirectory
+import threading
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 import pytest
@@ -279,6 +280,28 @@ async def test_async_add_job_pending_tasks_executor(hass):
     assert len(call_count) == 2
 
 
+async def test_async_add_executor_job_pools(hass):
+    """Test executor jobs run in the executor pool of their integration."""
+    threads = []
+
+    def job():
+        threads.append(threading.current_thread().name)
+
+    await hass.async_add_executor_job(job)
+    job.__module__ = "homeassistant.components.recorder.history"
+    await hass.async_add_executor_job(job)
+    await hass.async_add_pool_executor_job(ha.EXECUTOR_POOL_POLLING, job)
+
+    assert not threads[0].startswith("SyncWorker-")
+    assert threads[1].startswith(f"SyncWorker-{ha.EXECUTOR_POOL_DATABASE}")
+    assert threads[2].startswith(f"SyncWorker-{ha.EXECUTOR_POOL_POLLING}")
+
+    metrics = hass.executor_pools.metrics()
+    assert metrics[ha.EXECUTOR_POOL_DATABASE]["completed"] == 1
+    assert metrics[ha.EXECUTOR_POOL_POLLING]["completed"] == 1
+    assert ha.EXECUTOR_POOL_CAMERA not in metrics
+
+
 async def test_async_add_job_pending_tasks_callback(hass):
     """Run a callback in pending tasks."""
     call_count = []
@@ -728,6 +751,52 @@ async def test_statemachine_force_update(hass):
     assert len(events) == 1
 
 
+async def test_statemachine_shares_unchanged_attributes(hass):
+    """Test unchanged attributes are shared with the previous state."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    state2 = hass.states.get("light.bowl")
+    assert state2.state == "off"
+    assert state2.attributes is state.attributes
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    state3 = hass.states.get("light.bowl")
+    assert state3.attributes is not state2.attributes
+    assert state3.attributes == {"brightness": 50}
+
+
+def test_state_interns_strings_and_creates_context_lazily():
+    """Test states intern their ids and only create a context when accessed."""
+    state = ha.State("light.bowl", "on")
+    state2 = ha.State("".join(("light.", "bowl")), "off")
+    assert state.entity_id is state2.entity_id
+    assert state.domain is state2.domain
+    assert state.attributes is state2.attributes
+
+    assert state._context is None
+    context = state.context
+    assert state.context is context
+    assert state.as_dict()["context"] == context.as_dict()
+
+
+async def test_statemachine_memory_usage(hass):
+    """Test the memory usage of the states per domain."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.hall", "on")
+    hass.states.async_set("sensor.temperature", "21", {"unit_of_measurement": "C"})
+
+    usage = hass.states.async_memory_usage()
+    assert set(usage) == {"light", "sensor"}
+    assert usage["light"]["states"] == 3
+    assert usage["sensor"]["states"] == 1
+    assert usage["sensor"]["bytes"] > usage["sensor"]["attributes_bytes"] > 0
+    assert usage["light"]["shared_attributes"] == 1
+
+
 def test_service_call_repr():
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
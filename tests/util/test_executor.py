@@ -1,13 +1,19 @@
 """Test Home Assistant executor util."""
 
 import concurrent.futures
+import functools
+import threading
 import time
 from unittest.mock import patch
 
 import pytest
 
 from homeassistant.util import executor
-from homeassistant.util.executor import InterruptibleThreadPoolExecutor
+from homeassistant.util.executor import (
+    ExecutorPools,
+    InterruptibleThreadPoolExecutor,
+    MeteredThreadPoolExecutor,
+)
 
 
 async def test_executor_shutdown_can_interrupt_threads(caplog):
@@ -89,3 +95,82 @@ async def test_overall_timeout_reached(caplog):
     assert finish - start < 1
 
     iexecutor.shutdown()
+
+
+async def test_metered_executor():
+    """Test the metered executor measures the jobs waiting for a thread."""
+    mexecutor = MeteredThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+
+    blocking = mexecutor.submit(release.wait)
+    waiting = [mexecutor.submit(lambda value: value * 2, value) for value in (1, 2)]
+
+    metrics = mexecutor.metrics_as_dict()
+    assert metrics["max_workers"] == 1
+    assert metrics["submitted"] == 3
+    assert metrics["queued"] >= 2
+    assert metrics["max_queued"] >= 2
+
+    time.sleep(0.05)
+    release.set()
+    assert blocking.result() is True
+    assert [future.result() for future in waiting] == [2, 4]
+
+    mexecutor.shutdown()
+    metrics = mexecutor.metrics_as_dict()
+    assert metrics["submitted"] == 3
+    assert metrics["completed"] == 3
+    assert metrics["queued"] == 0
+    assert metrics["wait_max"] >= 0.05
+    assert metrics["wait_total"] >= 0.1
+    assert metrics["run_total"] >= 0.05
+
+
+def _job():
+    """Job of a module outside of the integrations."""
+
+
+async def test_executor_pools():
+    """Test jobs are sent to the pool of their integration."""
+    pools = ExecutorPools(
+        {"database": 2, "camera": 1, "polling": None},
+        {"recorder": "database", "camera": "camera"},
+        lambda: 5,
+    )
+
+    def make_job(module):
+        def job():
+            pass
+
+        job.__module__ = module
+        return job
+
+    database = pools.for_target(make_job("homeassistant.components.recorder.history"))
+    assert database is pools.get("database")
+    assert database.metrics_as_dict()["max_workers"] == 2
+    assert pools.for_target(
+        functools.partial(make_job("homeassistant.components.recorder"))
+    ) is pools.get("database")
+    # Platforms of integrations
+    assert pools.for_target(
+        make_job("homeassistant.components.generic.camera")
+    ) is pools.get("camera")
+    assert pools.for_target(make_job("custom_components.ipcam.camera")) is pools.get(
+        "camera"
+    )
+    assert pools.for_target(make_job("homeassistant.components.light")) is None
+    assert pools.for_target(make_job("homeassistant.core")) is None
+    assert pools.for_target(_job) is None
+
+    assert list(pools.metrics()) == ["database", "camera"]
+    # Pools without a size are sized like the default executor
+    assert pools.get("polling").metrics_as_dict()["max_workers"] == 5
+
+    with pytest.raises(ValueError):
+        pools.add("camera", 2)
+    pools.add("network", 3)
+
+    pools.shutdown()
+    assert pools.get("database")._shutdown
+    with pytest.raises(RuntimeError):
+        pools.get("network")
@@ -445,3 +445,98 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+def test_fast_loader_tracks_file_and_line():
+    """Test the fast loader records the same references as the line loader."""
+    conf = "key:\n  - first\n  - nested:\n      value: 1\n"
+    docs = []
+    for loader in (yaml_loader.FastSafeLoader, yaml_loader.SafeLineLoader):
+        with io.StringIO(conf) as file:
+            file.name = "test.yaml"
+            docs.append(yaml_loader.yaml.load(file, Loader=loader))
+
+    fast, python = docs
+    assert fast == python
+    for fast_obj, python_obj in (
+        (fast, python),
+        (fast["key"], python["key"]),
+        (fast["key"][1], python["key"][1]),
+    ):
+        assert fast_obj.__config_file__ == python_obj.__config_file__ == "test.yaml"
+        assert fast_obj.__line__ == python_obj.__line__
+
+
+def _write_old(path, content):
+    """Write a file with a modification time in the past."""
+    path.write_text(content)
+    mtime = os.stat(path).st_mtime - 60
+    os.utime(path, (mtime, mtime))
+
+
+def test_load_yaml_cache(tmp_path, monkeypatch):
+    """Test parsed files are cached until a file they use changes."""
+    monkeypatch.setattr(yaml_loader, "YAML_FILE_CACHE", yaml_loader.YamlFileCache())
+    (tmp_path / "dir").mkdir()
+    _write_old(tmp_path / "configuration.yaml", "a: !include a.yaml\nb: !env_var B\n")
+    _write_old(tmp_path / "a.yaml", "dir: !include_dir_merge_named dir\n")
+    _write_old(tmp_path / "dir" / "one.yaml", "one: 1\n")
+    monkeypatch.setenv("B", "b")
+    config_path = str(tmp_path / "configuration.yaml")
+
+    with patch.object(
+        yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+    ) as mock_parse:
+        config = yaml.load_yaml(config_path)
+        assert config == {"a": {"dir": {"one": 1}}, "b": "b"}
+        assert mock_parse.call_count == 3
+        assert len(yaml_loader.YAML_FILE_CACHE) == 3
+
+        # Cached copies can be modified
+        config["a"]["dir"]["one"] = 2
+        config = yaml.load_yaml(config_path)
+        assert config == {"a": {"dir": {"one": 1}}, "b": "b"}
+        assert config["a"].__config_file__ == config_path
+        assert config["a"].__line__ == 0
+        assert mock_parse.call_count == 3
+
+        # Only the files that changed are parsed again
+        _write_old(tmp_path / "dir" / "two.yaml", "two: 2\n")
+        assert yaml.load_yaml(config_path) == {
+            "a": {"dir": {"one": 1, "two": 2}},
+            "b": "b",
+        }
+        assert mock_parse.call_count == 6
+
+        monkeypatch.setenv("B", "c")
+        assert yaml.load_yaml(config_path)["b"] == "c"
+        assert mock_parse.call_count == 7
+
+        _write_old(tmp_path / "dir" / "one.yaml", "one: 10\n")
+        assert yaml.load_yaml(config_path)["a"] == {"dir": {"one": 10, "two": 2}}
+        assert mock_parse.call_count == 10
+
+        # Recently modified files aren't cached
+        (tmp_path / "configuration.yaml").write_text("a: !include a.yaml\n")
+        assert yaml.load_yaml(config_path) == {"a": {"dir": {"one": 10, "two": 2}}}
+        assert yaml.load_yaml(config_path) == {"a": {"dir": {"one": 10, "two": 2}}}
+        assert mock_parse.call_count == 12
+
+
+def test_load_yaml_cache_secrets(tmp_path, monkeypatch):
+    """Test cached files are parsed again when a secret they use changes."""
+    monkeypatch.setattr(yaml_loader, "YAML_FILE_CACHE", yaml_loader.YamlFileCache())
+    _write_old(tmp_path / "configuration.yaml", "password: !secret password\n")
+    _write_old(tmp_path / yaml.SECRET_YAML, "password: one\n")
+    config_path = str(tmp_path / "configuration.yaml")
+
+    def load():
+        return yaml.load_yaml(config_path, yaml.Secrets(tmp_path))
+
+    assert load() == {"password": "one"}
+    assert load() == {"password": "one"}
+    _write_old(tmp_path / yaml.SECRET_YAML, "password: three\n")
+    assert load() == {"password": "three"}
+
+    with pytest.raises(HomeAssistantError):
+        yaml.load_yaml(config_path)